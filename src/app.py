@@ -116,7 +116,9 @@ if __name__ == "__main__":
 ### ------- PATH SETUP COMPLETE, IMPORT LOCAL MODULES HERE ------
 ### -------------------------------------------------------------
 
-from contextlib import asynccontextmanager
+import asyncio
+import gc
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
@@ -127,8 +129,14 @@ from fastapi.responses import JSONResponse
 from database.DatabaseManager import DatabaseManager
 from lib.Environment import env, inflection
 from lib.Logging import logger
+from lib.Middleware import (
+    BodyLoggingMiddleware,
+    JSONErrorMiddleware,
+    RequestContextMiddleware,
+)
+from lib.OpenAPICache import OpenAPIDocument, install_openapi_route
+from lib.Prefork import PreforkServer, prefork_enabled
 from lib.Pydantic import ModelRegistry
-from lib.RequestContext import clear_request_context, set_request_user
 
 
 def setup_extension_dependencies():
@@ -366,6 +374,12 @@ def build_app(model_registry: ModelRegistry):
     with open(os.path.join(this_directory, "version"), encoding="utf-8") as f:
         version = f.read().strip()
 
+    def prebuild_openapi():
+        try:
+            app.openapi()
+        except Exception as e:
+            logger.warning(f"Could not prebuild OpenAPI document: {e}")
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         """Handles startup and shutdown events for each worker"""
@@ -376,9 +390,45 @@ def build_app(model_registry: ModelRegistry):
             db_mgr = DatabaseManager()
             db_mgr.init_engine_config()
         db_mgr.init_worker()
+
+        # Per-worker write-behind flushers and scheduled maintenance
+        from logic.SVC_Auth import (
+            FailedLoginAttemptService,
+            SessionActivityService,
+            SessionReaperService,
+        )
+
+        services = [
+            service_class(
+                requester_id=env("SYSTEM_ID"), db_manager=model_registry.DB.manager
+            )
+            for service_class in (FailedLoginAttemptService, SessionActivityService)
+        ]
+        services.append(
+            SessionReaperService(
+                requester_id=env("ROOT_ID"), model_registry=model_registry
+            )
+        )
+        tasks = []
+        for service in services:
+            service.start()
+            tasks.append(asyncio.create_task(service.run_service_loop()))
+
+        # Load or build the OpenAPI document off the event loop so the first
+        # docs request does not pay for it
+        if env("OPENAPI_PREBUILD").lower() == "true":
+            asyncio.get_running_loop().run_in_executor(None, prebuild_openapi)
         try:
             yield
         finally:
+            for service, task in zip(services, tasks):
+                service.cleanup()
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+            graphql_manager = getattr(model_registry, "graphql_manager", None)
+            if graphql_manager is not None:
+                await graphql_manager.broadcast.disconnect()
             await db_mgr.close_worker()
 
     app = FastAPI(
@@ -402,99 +452,11 @@ def build_app(model_registry: ModelRegistry):
         allow_headers=["*"],
     )
 
-    # JWT extraction middleware
-    @app.middleware("http")
-    async def extract_jwt_context(request: Request, call_next):
-        """Extract JWT token data and set request context"""
-        clear_request_context()  # Clear any previous context
-
-        # Get authorization header
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header.startswith("Bearer "):
-            try:
-                import jwt
-
-                token = auth_header.replace("Bearer ", "").strip()
-                # Decode without verification to get payload (verification happens elsewhere)
-                payload = jwt.decode(token, options={"verify_signature": False})
-
-                # Set user context with timezone info
-                user_info = {
-                    "user_id": payload.get("sub"),
-                    "email": payload.get("email"),
-                    "timezone": payload.get("timezone", "UTC"),
-                }
-                set_request_user(user_info)
-            except Exception:
-                # If JWT decode fails, just continue without setting context
-                pass
-
-        response = await call_next(request)
-
-        # Debug: Log response body for POST requests
-        if request.method == "POST":
-            try:
-                # For StreamingResponse, we need to consume the body
-                if hasattr(response, "body_iterator"):
-                    body_parts = []
-                    async for chunk in response.body_iterator:
-                        body_parts.append(chunk)
-                    body_bytes = b"".join(body_parts)
-                    body_str = body_bytes.decode("utf-8")
-                    print(f"DEBUG POST RESPONSE BODY: {body_str}")
-
-                    # Try to parse as JSON
-                    try:
-                        import json
-
-                        body_json = json.loads(body_str)
-                        print(
-                            f"DEBUG POST RESPONSE JSON: {json.dumps(body_json, indent=2)}"
-                        )
-                    except:
-                        pass
-
-                    # Recreate the response with the consumed body
-                    from starlette.responses import Response
-
-                    response = Response(
-                        content=body_bytes,
-                        status_code=response.status_code,
-                        headers=response.headers,
-                        media_type=response.media_type,
-                    )
-                else:
-                    print(f"DEBUG: Response type {type(response)} - no body_iterator")
-            except Exception as e:
-                print(f"DEBUG: Could not read response: {e}")
-
-        clear_request_context()  # Clear context after request
-        return response
-
-    # Add middleware to catch JSON parsing errors early
-    from starlette.middleware.base import BaseHTTPMiddleware
-    from starlette.requests import Request as StarletteRequest
-    from starlette.responses import Response as StarletteResponse
-
-    class JSONParsingMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request: StarletteRequest, call_next):
-            try:
-                # Let the request proceed normally
-                response = await call_next(request)
-                return response
-            except Exception as exc:
-                # Check if this is a JSON parsing error
-                if "json" in str(exc).lower() and (
-                    "decode" in str(exc).lower() or "syntax" in str(exc).lower()
-                ):
-                    return JSONResponse(
-                        status_code=400,
-                        content={"detail": "Invalid JSON syntax in request body"},
-                    )
-                # Re-raise if not a JSON error
-                raise
-
-    app.add_middleware(JSONParsingMiddleware)
+    # Pure ASGI middleware: request context, sampled body logging and
+    # JSON error handling, none of which buffer request or response bodies
+    app.add_middleware(RequestContextMiddleware)
+    app.add_middleware(BodyLoggingMiddleware)
+    app.add_middleware(JSONErrorMiddleware)
 
     # Add exception handler for JSON decode errors (malformed JSON should return 400)
     @app.exception_handler(json.JSONDecodeError)
@@ -830,105 +792,76 @@ def build_app(model_registry: ModelRegistry):
 
         return problematic_models
 
-    # Override openapi to catch PydanticUndefinedType errors
-    def custom_openapi():
-        if app.openapi_schema:
-            return app.openapi_schema
-        try:
-            from lib.Logging import logger
-
-            # Test all models first
-            problematic_models = test_all_models_for_undefined_types()
-
-            logger.debug("Testing OpenAPI schema generation step by step...")
-
-            from fastapi.openapi.utils import get_openapi
-
-            # Try to isolate which part of OpenAPI generation fails
-            try:
-                logger.debug("Step 1: Creating base OpenAPI structure...")
-                base_schema = {
-                    "openapi": "3.1.0",
-                    "info": {"title": app.title, "version": app.version},
-                    "paths": {},
-                }
-
-                logger.debug("Step 2: Generating full schema...")
-                openapi_schema = get_openapi(
-                    title=app.title,
-                    version=app.version,
-                    openapi_version=app.openapi_version,
-                    description=app.description,
-                    routes=app.routes,
-                )
-
-                logger.debug("Step 3: Testing schema serialization...")
-                # Try to serialize the schema to JSON to trigger the error
-                import json
-
-                from fastapi.encoders import jsonable_encoder
-
-                logger.debug("Step 3a: Converting schema to dict...")
-                schema_dict = jsonable_encoder(openapi_schema)
-
-                logger.debug("Step 3b: Converting to JSON...")
-                json_str = json.dumps(schema_dict)
-
-                logger.debug("✓ OpenAPI schema generated successfully")
-                app.openapi_schema = openapi_schema
-                return app.openapi_schema
-
-            except Exception as step_error:
-                logger.error(f"OpenAPI generation failed at step: {step_error}")
-                if "PydanticUndefinedType" in str(step_error):
-                    logger.error(
-                        "The error is in the OpenAPI schema object itself, not the response models"
-                    )
+    def diagnose_undefined_types():
+        """Log the models and routes whose schema contains undefined types."""
+        from fastapi.encoders import jsonable_encoder
+        from fastapi.openapi.utils import get_openapi
 
-                    # Try to find the problematic part by testing schema components
-                    logger.info("Testing schema components individually...")
-
-                    try:
-                        from fastapi.openapi.utils import get_openapi_path
-
-                        logger.info("Testing individual routes...")
+        from lib.Logging import logger
 
-                        for i, route in enumerate(app.routes):
-                            try:
-                                if hasattr(route, "path") and hasattr(route, "methods"):
-                                    logger.debug(f"Testing route {i}: {route.path}")
-                                    # Try to generate OpenAPI for just this route
-                                    test_schema = get_openapi(
-                                        title="Test",
-                                        version="1.0.0",
-                                        routes=[route],
-                                    )
-                                    # Try to serialize it
-                                    jsonable_encoder(test_schema)
-                            except Exception as route_error:
-                                if "PydanticUndefinedType" in str(route_error):
-                                    logger.error(
-                                        f"PROBLEMATIC ROUTE FOUND: {route.path} - {route.methods}"
-                                    )
-                                    logger.error(f"Route error: {route_error}")
+        test_all_models_for_undefined_types()
 
-                                    # Try to inspect the route's details
-                                    if hasattr(route, "endpoint"):
-                                        endpoint = route.endpoint
-                                        logger.error(f"Endpoint: {endpoint}")
-                                        if hasattr(endpoint, "response_model"):
-                                            logger.error(
-                                                f"Response model: {endpoint.response_model}"
-                                            )
-                                        if hasattr(endpoint, "__annotations__"):
-                                            logger.error(
-                                                f"Annotations: {endpoint.__annotations__}"
-                                            )
-                    except Exception as comp_error:
-                        logger.error(f"Error testing components: {comp_error}")
+        # Try to find the problematic part by testing schema components
+        logger.info("Testing individual routes...")
+        try:
+            for i, route in enumerate(app.routes):
+                try:
+                    if hasattr(route, "path") and hasattr(route, "methods"):
+                        logger.debug(f"Testing route {i}: {route.path}")
+                        # Try to generate OpenAPI for just this route
+                        test_schema = get_openapi(
+                            title="Test",
+                            version="1.0.0",
+                            routes=[route],
+                        )
+                        # Try to serialize it
+                        jsonable_encoder(test_schema)
+                except Exception as route_error:
+                    if "PydanticUndefinedType" in str(route_error):
+                        logger.error(
+                            f"PROBLEMATIC ROUTE FOUND: {route.path} - {route.methods}"
+                        )
+                        logger.error(f"Route error: {route_error}")
+
+                        # Try to inspect the route's details
+                        if hasattr(route, "endpoint"):
+                            endpoint = route.endpoint
+                            logger.error(f"Endpoint: {endpoint}")
+                            if hasattr(endpoint, "response_model"):
+                                logger.error(
+                                    f"Response model: {endpoint.response_model}"
+                                )
+                            if hasattr(endpoint, "__annotations__"):
+                                logger.error(
+                                    f"Annotations: {endpoint.__annotations__}"
+                                )
+        except Exception as comp_error:
+            logger.error(f"Error testing components: {comp_error}")
+
+    def generate_openapi():
+        from fastapi.openapi.utils import get_openapi
+
+        return get_openapi(
+            title=app.title,
+            version=app.version,
+            openapi_version=app.openapi_version,
+            description=app.description,
+            routes=app.routes,
+        )
 
-                raise step_error
+    # The document is built (or loaded from disk) once and served as
+    # pre-serialized bytes; see lib/OpenAPICache.py
+    openapi_document = OpenAPIDocument(app, generate_openapi)
+    install_openapi_route(app, openapi_document)
+    app.state.openapi_document = openapi_document
 
+    # Override openapi to catch PydanticUndefinedType errors
+    def custom_openapi():
+        if app.openapi_schema:
+            return app.openapi_schema
+        try:
+            app.openapi_schema = openapi_document.prepare()
+            return app.openapi_schema
         except Exception as e:
             if "PydanticUndefinedType" in str(e):
                 from lib.Logging import logger
@@ -936,6 +869,7 @@ def build_app(model_registry: ModelRegistry):
                 logger.error(
                     f"PydanticUndefinedType error in OpenAPI schema generation: {e}"
                 )
+                diagnose_undefined_types()
 
                 # Return a minimal schema to prevent total failure
                 return {
@@ -967,18 +901,37 @@ if __name__ == "__main__":
     if log_level == "debug":
         log_level = "trace"
     reload = env("UVICORN_RELOAD").lower() == "true"
-    logger.debug(f"Booting server...")
-    uvicorn.run(
-        "app:instance",
-        host="0.0.0.0",
-        port=1996,
-        workers=workers,
-        log_level=(
-            env_log_level
-            if env_log_level in ["info", "debug", "warning", "error", "critical"]
-            else "info"
-        ),
-        proxy_headers=True,
-        reload=env_log_level == "debug",
-        factory=True,
+    uvicorn_log_level = (
+        env_log_level
+        if env_log_level in ["info", "debug", "warning", "error", "critical"]
+        else "info"
     )
+    logger.debug(f"Booting server...")
+    if prefork_enabled(workers, reload=env_log_level == "debug"):
+        # Boot once in the master; workers are forked from the finished app.
+        # The collector stays off until the fork so the boot leaves no freed
+        # holes in pages the workers will share.
+        gc.disable()
+        app = instance()
+        db_manager = app.state.model_registry.DB.manager
+        PreforkServer(
+            app,
+            workers,
+            before_fork=db_manager.dispose_all,
+            after_fork=db_manager.reset_after_fork,
+            host="0.0.0.0",
+            port=1996,
+            log_level=uvicorn_log_level,
+            proxy_headers=True,
+        ).run()
+    else:
+        uvicorn.run(
+            "app:instance",
+            host="0.0.0.0",
+            port=1996,
+            workers=workers,
+            log_level=uvicorn_log_level,
+            proxy_headers=True,
+            reload=env_log_level == "debug",
+            factory=True,
+        )
@@ -1,10 +1,14 @@
 import functools
 import uuid
+from datetime import datetime, timedelta, timezone
 from typing import (
     Any,
+    Dict,
+    Iterator,
     List,
     Literal,
     Optional,
+    Set,
     Type,
     TypeVar,
     Union,
@@ -13,7 +17,17 @@ from typing import (
 )
 
 from fastapi import HTTPException, Request
-from sqlalchemy import Column, DateTime, ForeignKey, String, func, inspect
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    String,
+    func,
+    inspect,
+    literal,
+    or_,
+    select,
+)
 from sqlalchemy.orm import Session, declared_attr, relationship
 from sqlalchemy.orm.exc import MultipleResultsFound, NoResultFound
 
@@ -28,6 +42,8 @@ from database.StaticPermissions import (
 from lib.Environment import env
 from lib.Logging import logger
 from lib.Pydantic import obj_to_dict
+from lib.RequestContext import get_request_session
+from lib.ResponseCache import invalidate_table
 
 
 def get_db_manager(
@@ -80,9 +96,14 @@ def with_session(func):
         if model_registry is None:
             raise ValueError("model_registry parameter is required")
 
-        # Get session from ModelRegistry.DB
-        session = model_registry.DB.session()
+        # Use the request's shared session when it belongs to this database,
+        # otherwise a session of our own from ModelRegistry.DB
         db_manager = model_registry.DB.manager
+        shared = get_request_session()
+        if shared is not None and getattr(shared, "_db_manager", None) is db_manager:
+            session = shared
+        else:
+            session = model_registry.DB.session()
 
         logger.debug(f"Executing {func.__name__} on {cls.__name__}: {str(kwargs)}")
         try:
@@ -100,8 +121,9 @@ def with_session(func):
             session.rollback()
             raise e
         finally:
-            logger.debug("Closing session...")
-            session.close()
+            if session is not shared:
+                logger.debug("Closing session...")
+                session.close()
 
     return wrapper
 
@@ -205,6 +227,84 @@ def build_query(
     return to_return
 
 
+def partition_window(
+    cls, partition_by, filters=[], order_by=None, limit=None, offset=None, **kwargs
+):
+    """
+    Filter keeping the ``offset``/``limit`` window of each ``partition_by`` value.
+
+    The rows matched by ``filters`` are numbered per partition with
+    ``row_number() OVER (PARTITION BY ... ORDER BY ...)`` in a subquery, so a
+    page of children for many parents is still a single bounded query.
+    """
+    position = (
+        func.row_number()
+        .over(partition_by=partition_by, order_by=order_by)
+        .label("position")
+    )
+    ranked = select(cls.id, position).where(*filters).filter_by(**kwargs).subquery()
+    start = offset or 0
+    window = select(ranked.c.id).where(ranked.c.position > start)
+    if limit:
+        window = window.where(ranked.c.position <= start + limit)
+    return cls.id.in_(window)
+
+
+def iter_id_chunks(query, id_column, chunk_size: int = 1000):
+    """
+    Yield the ids matched by ``query`` in keyset-paginated chunks.
+
+    Each chunk is fetched with its own bounded SELECT ordered by ``id_column``,
+    so callers can modify or delete the rows of one chunk (and commit) before
+    the next one is read.
+    """
+    last_id = None
+    while True:
+        page = query.with_entities(id_column)
+        if last_id is not None:
+            page = page.filter(id_column > last_id)
+        ids = [row[0] for row in page.order_by(id_column).limit(chunk_size).all()]
+        if not ids:
+            return
+        yield ids
+        if len(ids) < chunk_size:
+            return
+        last_id = ids[-1]
+
+
+def version_timestamp() -> datetime:
+    """
+    Current UTC time, with microseconds, for ``updated_at``.
+
+    ``func.now()`` has one-second resolution on SQLite, so two writes within
+    the same second would leave the row's version (and its ETag) unchanged.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def version_columns(cls) -> Optional[List[Any]]:
+    """
+    Columns identifying the stored version of a row, or None if unversioned.
+    """
+    if hasattr(cls, "id") and hasattr(cls, "updated_at"):
+        return [cls.id, cls.updated_at]
+    return None
+
+
+def projection_columns(cls, fields: List[str]) -> List[Any]:
+    """
+    Columns selected for a ``return_type="rows"`` projection.
+
+    The version columns are always added so callers can still compute an
+    ETag; ``fields`` must already have passed ``validate_fields``.
+    """
+    columns = [getattr(cls, field) for field in dict.fromkeys(fields)]
+    for column in version_columns(cls) or [cls.id]:
+        if column.key not in fields:
+            columns.append(column)
+    return columns
+
+
 def db_to_return_type(
     entity: Union[T, List[T]],
     return_type: Literal["db", "dict", "dto", "model"] = "dict",
@@ -446,7 +546,7 @@ class HookDict(dict):
 
 # Global hooks registry to properly handle inheritance
 _hooks_registry = {}
-hook_types = ["create", "update", "delete", "get", "list"]
+hook_types = ["create", "update", "delete", "get", "list", "bulk"]
 
 
 def get_hooks_for_class(cls):
@@ -877,6 +977,85 @@ class BaseMixin:
         # Get count
         return query.count()
 
+    @classmethod
+    @with_session
+    def aggregate(
+        cls: Type[T],
+        requester_id: str,
+        model_registry,
+        group_by: List[str] = [],
+        metrics: Dict[str, List[str]] = {},
+        filters=[],
+        limit=None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Group the rows visible to the requester and aggregate them in one query.
+
+        Args:
+            requester_id: The ID of the user making the request
+            group_by: Columns to group by; no grouping yields a single row
+            metrics: Aggregate function (``sum``, ``min`` or ``max``) to the
+                columns it is applied to
+            filters: Additional filter conditions
+            limit: Maximum number of groups returned
+            **kwargs: Additional equality filter criteria
+
+        Returns:
+            One ``{"group": {...}, "count": n, "<function>": {...}}`` dict
+            per group, ordered by the group columns
+        """
+        db = kwargs.pop("db")
+        db_manager = kwargs.pop("db_manager")
+
+        validate_columns(cls, **kwargs)
+        validate_fields(
+            cls, list(group_by) + [name for names in metrics.values() for name in names]
+        )
+
+        filters = cls._list_visibility_filters(
+            requester_id, db, db_manager, list(filters or [])
+        )
+        group_columns = [getattr(cls, name) for name in group_by]
+
+        # Labels are prefixed so a column named like a metric cannot collide
+        selected = [
+            column.label(f"group__{name}")
+            for name, column in zip(group_by, group_columns)
+        ]
+        selected.append(func.count().label("count"))
+        for function, names in metrics.items():
+            for name in names:
+                selected.append(
+                    getattr(func, function)(getattr(cls, name)).label(
+                        f"{function}__{name}"
+                    )
+                )
+
+        query = db.query(*selected).select_from(cls)
+        for filter_condition in filters or []:
+            query = query.filter(filter_condition)
+        for key, value in kwargs.items():
+            query = query.filter(getattr(cls, key) == value)
+        if group_columns:
+            query = query.group_by(*group_columns).order_by(*group_columns)
+        if limit:
+            query = query.limit(limit)
+
+        results = []
+        for row in query:
+            mapping = row._mapping
+            result = {
+                "group": {name: mapping[f"group__{name}"] for name in group_by},
+                "count": mapping["count"],
+            }
+            for function, names in metrics.items():
+                result[function] = {
+                    name: mapping[f"{function}__{name}"] for name in names
+                }
+            results.append(result)
+        return results
+
     @classmethod
     @with_session
     def exists(
@@ -991,13 +1170,74 @@ class BaseMixin:
             # Check if any results exist with permission filtering
             return query.first() is not None
 
+    @classmethod
+    @with_session
+    def existing_ids(
+        cls: Type[T],
+        requester_id: str,
+        model_registry,
+        ids: List[str],
+        **kwargs,
+    ) -> Set[str]:
+        """
+        Return which of ``ids`` exist, ignoring VIEW permissions.
+
+        Used after a permission-filtered read to tell ids the requester may
+        not see (forbidden) apart from ids that do not exist. Soft-deleted
+        rows count as missing for non-ROOT requesters, as in ``get``.
+        """
+        from database.StaticPermissions import is_root_id
+
+        db = kwargs.pop("db")
+        kwargs.pop("db_manager")
+
+        if not ids:
+            return set()
+        query = db.query(cls.id).filter(cls.id.in_(ids))
+        if hasattr(cls, "deleted_at") and not is_root_id(requester_id):
+            query = query.filter(cls.deleted_at == None)
+        return {row[0] for row in query}
+
+    @classmethod
+    @with_session
+    def visible_ids(
+        cls: Type[T],
+        requester_id: str,
+        model_registry,
+        ids: List[str],
+        **kwargs,
+    ) -> Set[str]:
+        """
+        Return which of ``ids`` the requester may VIEW, soft-deleted or not.
+
+        Used to announce a deletion only to requesters that could see the
+        record before it was deleted.
+        """
+        db = kwargs.pop("db")
+        db_manager = kwargs.pop("db_manager")
+
+        if not ids:
+            return set()
+        query = db.query(cls.id).filter(cls.id.in_(ids))
+        perm_filter = generate_permission_filter(
+            requester_id,
+            cls,
+            db,
+            db_manager.Base,
+            PermissionType.VIEW,
+            db_manager=db_manager,
+        )
+        if perm_filter is not None:
+            query = query.filter(perm_filter)
+        return {row[0] for row in query}
+
     @classmethod
     @with_session
     def get(
         cls: Type[T],
         requester_id: str,
         model_registry,
-        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        return_type: Literal["db", "dict", "dto", "model", "keys"] = "dict",
         joins=[],
         options=[],
         filters=[],
@@ -1043,6 +1283,15 @@ class BaseMixin:
             else:
                 filters = [perm_filter]
 
+        # Version keys are read without loader options, which need entities
+        if return_type == "keys":
+            columns = version_columns(db_cls)
+            if columns is None:
+                return None
+            query = build_query(db, db_cls, joins, [], filters, **kwargs)
+            row = query.with_entities(*columns).one_or_none()
+            return tuple(row) if row is not None else None
+
         # Build query with permission filter included
         query = build_query(db, db_cls, joins, options, filters, **kwargs)
 
@@ -1089,7 +1338,7 @@ class BaseMixin:
         cls: Type[T],
         requester_id: str,
         model_registry,
-        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        return_type: Literal["db", "dict", "dto", "model", "keys", "rows"] = "dict",
         joins=[],
         options=[],
         filters=[],
@@ -1100,6 +1349,7 @@ class BaseMixin:
         override_dto: Optional[Type[DtoT]] = None,
         check_permissions=True,
         minimum_role=None,
+        partition_by=None,
         **kwargs,
     ) -> List[T]:
         """
@@ -1108,17 +1358,18 @@ class BaseMixin:
         Args:
             requester_id: The ID of the user making the request
             db: Database session
-            return_type: The return type format ("db", "dict", "dto", "model")
+            return_type: The return type format ("db", "dict", "dto", "model", "keys" for (id, updated_at) tuples, or "rows" for dicts of the ``fields`` columns)
             joins: List of join conditions
             options: List of query options
             filters: List of filter conditions
             order_by: Order by criteria
             limit: Maximum number of records to return
             offset: Number of records to skip
-            fields: List of fields to include in the response (only for return_type="dict")
+            fields: List of fields to include in the response (only for return_type="dict" or "rows")
             override_dto: Optional DTO class override
             check_permissions: Whether to apply permission filtering (defaults to True)
             minimum_role: Minimum role required for team access (defaults to None)
+            partition_by: Column whose values each get their own limit/offset window
             **kwargs: Additional filter criteria
 
         Returns:
@@ -1131,45 +1382,49 @@ class BaseMixin:
         validate_columns(cls, **kwargs)
 
         # Validate fields parameter
-        if fields and return_type != "dict":
+        if fields and return_type not in ("dict", "rows"):
             raise HTTPException(
                 status_code=400,
-                detail="Fields parameter can only be used with return_type='dict'",
+                detail="Fields parameter can only be used with return_type='dict' or 'rows'",
             )
 
         # Validate that fields exist on the model
         validate_fields(cls, fields)
 
-        # Use injected database session and manager from decorator
-        # db and db_manager are already available from @with_session
-        declarative_base = db_manager.Base
-
         # cls is already the SQLAlchemy model class
         db_cls = cls
 
-        # Only add deleted_at filter for non-ROOT users
-        from database.StaticPermissions import is_root_id
+        filters = cls._list_visibility_filters(requester_id, db, db_manager, filters)
+
+        # Page each partition in SQL; the outer query keeps the same order
+        if partition_by is not None:
+            if not order_by:
+                order_by = [cls.id]
+                if hasattr(cls, "created_at"):
+                    order_by.insert(0, cls.created_at)
+            filters = list(filters or [])
+            filters.append(
+                partition_window(
+                    cls, partition_by, filters, order_by, limit, offset, **kwargs
+                )
+            )
+            limit = offset = None
 
-        if hasattr(db_cls, "deleted_at") and not is_root_id(requester_id):
-            if filters:
-                filters.append(db_cls.deleted_at == None)
-            else:
-                filters = [db_cls.deleted_at == None]
+        # Version keys are read without loader options, which need entities
+        if return_type == "keys":
+            query = build_query(
+                db, db_cls, joins, [], filters, order_by, limit, offset, **kwargs
+            )
+            columns = version_columns(db_cls) or [db_cls.id, literal(None)]
+            return [tuple(row) for row in query.with_entities(*columns).all()]
 
-        # Apply permission filter
-        perm_filter = generate_permission_filter(
-            requester_id,
-            cls,
-            db,
-            declarative_base,
-            PermissionType.VIEW,
-            db_manager=db_manager,
-        )  # Default VIEW for list
-        if perm_filter is not None:
-            if filters:
-                filters.append(perm_filter)
-            else:
-                filters = [perm_filter]
+        # Projections select only the requested columns and skip entities
+        if return_type == "rows":
+            query = build_query(
+                db, db_cls, joins, [], filters, order_by, limit, offset, **kwargs
+            )
+            columns = projection_columns(db_cls, fields or ["id"])
+            return [dict(row._mapping) for row in query.with_entities(*columns)]
 
         query = build_query(
             db, db_cls, joins, options, filters, order_by, limit, offset, **kwargs
@@ -1195,6 +1450,160 @@ class BaseMixin:
             fields=fields,
         )
 
+    @classmethod
+    def _list_visibility_filters(cls, requester_id, db, db_manager, filters):
+        """
+        Add the soft-delete and VIEW permission filters used by list queries.
+        """
+        # Only add deleted_at filter for non-ROOT users
+        from database.StaticPermissions import is_root_id
+
+        if hasattr(cls, "deleted_at") and not is_root_id(requester_id):
+            if filters:
+                filters.append(cls.deleted_at == None)
+            else:
+                filters = [cls.deleted_at == None]
+
+        # Apply permission filter
+        perm_filter = generate_permission_filter(
+            requester_id,
+            cls,
+            db,
+            db_manager.Base,
+            PermissionType.VIEW,
+            db_manager=db_manager,
+        )  # Default VIEW for list
+        if perm_filter is not None:
+            if filters:
+                filters.append(perm_filter)
+            else:
+                filters = [perm_filter]
+        return filters
+
+    @classmethod
+    def stream(
+        cls: Type[T],
+        requester_id: str,
+        model_registry,
+        return_type: Literal["db", "dict", "dto", "model"] = "dict",
+        joins=[],
+        options=[],
+        filters=[],
+        order_by=None,
+        limit=None,
+        offset=None,
+        override_dto: Optional[Type[DtoT]] = None,
+        batch_size: int = 500,
+        **kwargs,
+    ) -> Iterator[T]:
+        """
+        Yield records one at a time with the same filtering as ``list``.
+
+        Rows are fetched through a server-side cursor in batches of
+        ``batch_size`` and converted as they are read, so memory stays
+        bounded by the batch rather than the result size. Eager loads must
+        be select-style (``selectinload``); joined collection loads cannot be
+        combined with ``yield_per``.
+
+        Validation, permission filtering and query execution happen before
+        this returns, so their errors reach the caller before a response is
+        started. The session stays open until the returned iterator is
+        exhausted or closed.
+        """
+        if model_registry is None:
+            raise ValueError("model_registry parameter is required")
+
+        validate_columns(cls, **kwargs)
+
+        db = model_registry.DB.session()
+        db_manager = model_registry.DB.manager
+        dto_class = get_dto_class(cls, override_dto)
+        logger.debug(f"Executing stream on {cls.__name__}: {str(kwargs)}")
+        try:
+            filters = cls._list_visibility_filters(
+                requester_id, db, db_manager, list(filters or [])
+            )
+            rows = iter(
+                build_query(
+                    db, cls, joins, options, filters, order_by, limit, offset, **kwargs
+                ).yield_per(batch_size)
+            )
+        except Exception as e:
+            logger.error(e)
+            logger.debug("Rolling back stream...")
+            db.rollback()
+            db.close()
+            raise e
+
+        stream = cls._stream_rows(db, rows, return_type, dto_class)
+        # Start the generator so closing it before the first row still
+        # reaches the ``finally`` that closes the session
+        next(stream)
+        return stream
+
+    @staticmethod
+    def _stream_rows(db, rows, return_type, dto_class) -> Iterator[Any]:
+        try:
+            yield
+            for row in rows:
+                yield db_to_return_type(row, return_type, dto_class)
+        except Exception as e:
+            logger.error(e)
+            logger.debug("Rolling back stream...")
+            db.rollback()
+            raise e
+        finally:
+            logger.debug("Closing session...")
+            db.close()
+
+    @classmethod
+    @with_session
+    def bulk_purge(
+        cls: Type[T],
+        requester_id: str,
+        model_registry,
+        filters=[],
+        chunk_size: int = 1000,
+        **kwargs,
+    ) -> int:
+        """
+        Hard-delete every matching row with chunked set-based DELETEs.
+
+        Intended for retention jobs: only ROOT_ID and SYSTEM_ID may purge, and
+        per-entity delete hooks are not run. Each chunk of at most
+        ``chunk_size`` rows is committed on its own; ``bulk`` before-hooks
+        are called as ``hook(cls, ids, None, db)`` ahead of each chunk's
+        DELETE, in the same transaction.
+
+        Returns:
+            Number of rows deleted
+        """
+        from database.StaticPermissions import is_root_id, is_system_user_id
+
+        db = kwargs.pop("db")
+        kwargs.pop("db_manager")
+
+        if not (is_root_id(requester_id) or is_system_user_id(requester_id)):
+            raise HTTPException(
+                status_code=403,
+                detail=f"Only system users can purge {cls.__name__} records",
+            )
+
+        validate_columns(cls, **kwargs)
+        query = build_query(db, cls, filters=filters, **kwargs)
+
+        deleted = 0
+        for ids in iter_id_chunks(query, cls.id, chunk_size):
+            for hook in cls.hooks["bulk"]["before"]:
+                hook(cls, ids, None, db)
+            deleted += (
+                db.query(cls).filter(cls.id.in_(ids)).delete(synchronize_session=False)
+            )
+            db.commit()
+        if deleted:
+            invalidate_table(cls)
+        return deleted
+
 
 class UpdateMixin:
     """Adds update and delete hooks to the hooks registry"""
@@ -1215,7 +1624,7 @@ class UpdateMixin:
 
     @declared_attr
     def updated_at(cls):
-        return Column(DateTime, default=func.now(), onupdate=func.now())
+        return Column(DateTime, default=version_timestamp, onupdate=version_timestamp)
 
     @declared_attr
     def updated_by_user_id(cls):
@@ -1322,6 +1731,19 @@ class UpdateMixin:
                     detail=f"Only system users can modify records created by SYSTEM",
                 )
 
+        # Optimistic concurrency: compare If-Match with the row loaded above
+        from lib.RequestContext import get_request_if_match
+
+        if_match = get_request_if_match(entity.id)
+        if if_match:
+            from lib.Pydantic2FastAPI import compute_etag, etag_matches
+
+            if not etag_matches(if_match, compute_etag([entity]), weak=False):
+                raise HTTPException(
+                    status_code=412,
+                    detail=f"{cls.__name__} has been modified since it was read",
+                )
+
         # Copy updated properties to avoid modifying the input
         updated = dict(new_properties)
 
@@ -1335,7 +1757,11 @@ class UpdateMixin:
         if hasattr(cls, "updated_by_user_id"):
             updated["updated_by_user_id"] = requester_id
         if hasattr(cls, "updated_at"):
-            updated["updated_at"] = func.now()
+            # The version must move even when the clock has not
+            stamp = version_timestamp()
+            if entity.updated_at is not None and stamp <= entity.updated_at:
+                stamp = entity.updated_at + timedelta(microseconds=1)
+            updated["updated_at"] = stamp
 
         # Get hooks for before_update
         hooks = cls.hooks
@@ -1365,6 +1791,101 @@ class UpdateMixin:
         # Convert to requested return type
         return db_to_return_type(entity, return_type, override_dto, fields)
 
+    @classmethod
+    @with_session
+    def bulk_update(
+        cls: Type[T],
+        requester_id: str,
+        model_registry,
+        new_properties=None,
+        filters=[],
+        check_permissions=True,
+        chunk_size: int = 1000,
+        **kwargs,
+    ) -> int:
+        """
+        Apply ``new_properties`` to every matching row with chunked set-based
+        UPDATEs instead of loading and saving each entity.
+
+        Permission filtering and the ROOT/SYSTEM ownership rules match
+        ``update``, but rows the requester may not edit are skipped rather than
+        raising. Each chunk of at most ``chunk_size`` rows is committed on its
+        own. Per-entity update hooks are not run; ``bulk`` before-hooks are
+        called as ``hook(cls, ids, updated, db)`` ahead of each chunk's
+        UPDATE, in the same transaction.
+
+        Returns:
+            Number of rows updated
+        """
+        from database.StaticPermissions import (
+            PermissionType,
+            is_root_id,
+            is_system_user_id,
+        )
+
+        db = kwargs.pop("db")
+        db_manager = kwargs.pop("db_manager")
+
+        validate_columns(cls, **kwargs)
+
+        conditions = list(filters)
+        if check_permissions:
+            if hasattr(cls, "system") and getattr(cls, "system", False):
+                if not (is_root_id(requester_id) or is_system_user_id(requester_id)):
+                    raise HTTPException(
+                        status_code=403,
+                        detail=f"Only system users can modify {cls.__name__} records",
+                    )
+            conditions.append(
+                generate_permission_filter(
+                    requester_id,
+                    cls,
+                    db,
+                    db_manager.Base,
+                    PermissionType.EDIT,
+                    db_manager=db_manager,
+                )
+            )
+            if hasattr(cls, "created_by_user_id"):
+                if not is_root_id(requester_id):
+                    conditions.append(
+                        or_(
+                            cls.created_by_user_id == None,
+                            cls.created_by_user_id != env("ROOT_ID"),
+                        )
+                    )
+                if not (is_root_id(requester_id) or is_system_user_id(requester_id)):
+                    conditions.append(
+                        or_(
+                            cls.created_by_user_id == None,
+                            cls.created_by_user_id != env("SYSTEM_ID"),
+                        )
+                    )
+
+        updated = dict(new_properties or {})
+        updated.pop("created_by_user_id", None)
+        updated.pop("id", None)
+        if hasattr(cls, "updated_by_user_id"):
+            updated["updated_by_user_id"] = requester_id
+        if hasattr(cls, "updated_at"):
+            updated["updated_at"] = version_timestamp()
+
+        query = build_query(db, cls, filters=conditions, **kwargs)
+
+        total = 0
+        for ids in iter_id_chunks(query, cls.id, chunk_size):
+            for hook in cls.hooks["bulk"]["before"]:
+                hook(cls, ids, updated, db)
+            total += (
+                db.query(cls)
+                .filter(cls.id.in_(ids))
+                .update(updated, synchronize_session=False)
+            )
+            db.commit()
+        if total:
+            invalidate_table(cls)
+        return total
+
     @declared_attr
     def deleted_at(cls):
         return Column(DateTime, default=None)
@@ -1488,8 +2009,6 @@ class UpdateMixin:
 
         # Set deleted fields
         if hasattr(cls, "deleted_at"):
-            from datetime import datetime, timezone
-
             setattr(entity, "deleted_at", datetime.now(timezone.utc))
         if hasattr(cls, "deleted_by_user_id"):
             setattr(entity, "deleted_by_user_id", requester_id)
@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 from typing import List, Optional
 
 import pytest
@@ -14,7 +15,9 @@ from database.AbstractDatabaseEntity import (
     get_hooks_for_class,
 )
 from database.StaticPermissions import ROOT_ID
+from lib.Pydantic2FastAPI import compute_etag
 from lib.Pydantic2SQLAlchemy import DatabaseMixin
+from lib.RequestContext import set_request_if_match
 from logic.AbstractLogicManager import ApplicationModel, UpdateMixinModel
 
 
@@ -398,6 +401,55 @@ def test_count_method(mock_server):
         db.close()
 
 
+def test_aggregate_method(mock_server):
+    """Test that aggregate groups, counts and applies metrics in SQL"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        db.add_all(
+            [
+                TestModel(name="a", description="x"),
+                TestModel(name="b", description="x"),
+                TestModel(name="c", description="y"),
+            ]
+        )
+        db.commit()
+
+        groups = TestModel.aggregate(
+            ROOT_ID,
+            model_registry,
+            group_by=["description"],
+            metrics={"min": ["name"], "max": ["name"]},
+        )
+        assert groups == [
+            {
+                "group": {"description": "x"},
+                "count": 2,
+                "min": {"name": "a"},
+                "max": {"name": "b"},
+            },
+            {
+                "group": {"description": "y"},
+                "count": 1,
+                "min": {"name": "c"},
+                "max": {"name": "c"},
+            },
+        ]
+        assert TestModel.aggregate(ROOT_ID, model_registry, description="x") == [
+            {"group": {}, "count": 2}
+        ]
+
+        with pytest.raises(HTTPException) as exc:
+            TestModel.aggregate(ROOT_ID, model_registry, group_by=["missing"])
+        assert exc.value.status_code == 400
+    finally:
+        db.close()
+
+
 def test_exists_method(test_user_id, mock_server):
     """Test the exists method"""
     # Get model registry from mock server
@@ -432,6 +484,63 @@ def test_exists_method(test_user_id, mock_server):
         db.close()
 
 
+def test_existing_ids_method(test_user_id, mock_server):
+    """Test that existing_ids ignores VIEW permissions but not soft deletes"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        live = TestModel(name="Live")
+        gone = TestModel(name="Gone", deleted_at=datetime.now())
+        db.add_all([live, gone])
+        db.commit()
+        ids = [live.id, gone.id, "missing"]
+
+        assert TestModel.existing_ids(ROOT_ID, model_registry, ids=ids) == {
+            live.id,
+            gone.id,
+        }
+        assert TestModel.existing_ids(test_user_id, model_registry, ids=ids) == {
+            live.id
+        }
+        assert TestModel.existing_ids(ROOT_ID, model_registry, ids=[]) == set()
+    finally:
+        db.close()
+
+
+def test_visible_ids_method(test_user_id, mock_server):
+    """Test that visible_ids applies VIEW permissions to soft-deleted rows"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        live = TestModel(name="Live")
+        mine = TestModel(name="Mine", user_id=test_user_id, deleted_at=datetime.now())
+        gone = TestModel(name="Gone", deleted_at=datetime.now())
+        db.add_all([live, mine, gone])
+        db.commit()
+        ids = [live.id, mine.id, gone.id, "missing"]
+
+        assert TestModel.visible_ids(ROOT_ID, model_registry, ids=ids) == {
+            live.id,
+            mine.id,
+            gone.id,
+        }
+        assert TestModel.visible_ids(test_user_id, model_registry, ids=ids) == {
+            live.id,
+            mine.id,
+        }
+        assert TestModel.visible_ids(ROOT_ID, model_registry, ids=[]) == set()
+    finally:
+        db.close()
+
+
 def test_get_method(test_user_id, mock_server):
     """Test the get method"""
     # Get model registry from mock server
@@ -528,6 +637,45 @@ def test_list_method(mock_server):
         db.close()
 
 
+def test_stream_method(mock_server):
+    """Test that stream yields the same rows as list in bounded batches"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        db.commit()
+        db.add_all(
+            [TestModel(name="stream", description=str(i)) for i in range(5)]
+            + [TestModel(name="other")]
+        )
+        db.commit()
+
+        rows = TestModel.stream(ROOT_ID, model_registry, name="stream", batch_size=2)
+        assert not isinstance(rows, list)
+        streamed = sorted(row["description"] for row in rows)
+        assert streamed == [str(i) for i in range(5)]
+
+        listed = TestModel.list(ROOT_ID, model_registry, name="stream")
+        assert {row["id"] for row in listed} == {
+            row["id"]
+            for row in TestModel.stream(ROOT_ID, model_registry, name="stream")
+        }
+
+        assert (
+            len(list(TestModel.stream(ROOT_ID, model_registry, limit=3, batch_size=2)))
+            == 3
+        )
+
+        # Invalid filters fail on the call, before any row is requested
+        with pytest.raises(ValueError):
+            TestModel.stream(ROOT_ID, model_registry, missing="x")
+    finally:
+        db.close()
+
+
 def test_update_method(test_user_id, mock_server):
     """Test the update method"""
     # Get model registry from mock server
@@ -570,6 +718,124 @@ def test_update_method(test_user_id, mock_server):
         db.close()
 
 
+def test_version_keys_and_if_match(mock_server):
+    """Test version keys and the If-Match precondition on update"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        db.commit()
+        entity = TestModel(name="Versioned")
+        db.add(entity)
+        db.commit()
+        db.refresh(entity)
+        entity_id = entity.id
+
+        key = TestModel.get(ROOT_ID, model_registry, return_type="keys", id=entity_id)
+        assert key == (entity_id, entity.updated_at)
+        assert TestModel.list(ROOT_ID, model_registry, return_type="keys") == [key]
+        etag = compute_etag([key])
+
+        set_request_if_match(entity_id, '"stale"')
+        with pytest.raises(HTTPException) as exc:
+            TestModel.update(
+                ROOT_ID,
+                model_registry,
+                new_properties={"description": "rejected"},
+                id=entity_id,
+            )
+        assert exc.value.status_code == 412
+
+        set_request_if_match(entity_id, etag)
+        updated = TestModel.update(
+            ROOT_ID,
+            model_registry,
+            new_properties={"description": "accepted"},
+            id=entity_id,
+        )
+        assert updated["description"] == "accepted"
+
+        # Back-to-back writes within one clock tick still move the version
+        accepted = TestModel.get(ROOT_ID, model_registry, return_type="keys", id=entity_id)
+        TestModel.update(
+            ROOT_ID,
+            model_registry,
+            new_properties={"description": "again"},
+            id=entity_id,
+        )
+        again = TestModel.get(ROOT_ID, model_registry, return_type="keys", id=entity_id)
+        assert again[1] > accepted[1] > key[1]
+        assert compute_etag([again]) != compute_etag([accepted])
+    finally:
+        set_request_if_match(None, None)
+        db.close()
+
+
+def test_list_rows_projection(mock_server):
+    """Test that return_type="rows" selects only the requested columns"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        db.add(TestModel(name="Projected", description="not selected"))
+        db.commit()
+
+        rows = TestModel.list(
+            ROOT_ID, model_registry, return_type="rows", fields=["name"]
+        )
+        assert len(rows) == 1
+        assert set(rows[0]) == {"name", "id", "updated_at"}
+        assert rows[0]["name"] == "Projected"
+
+        with pytest.raises(HTTPException) as exc:
+            TestModel.list(
+                ROOT_ID, model_registry, return_type="rows", fields=["missing"]
+            )
+        assert exc.value.status_code == 400
+    finally:
+        db.close()
+
+
+def test_list_partition_window(mock_server):
+    """Test that partition_by applies limit/offset to each partition"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        db.add_all(
+            TestModel(name=f"Partition {group} {i}", description=group)
+            for group, size in (("a", 3), ("b", 2))
+            for i in range(size)
+        )
+        db.commit()
+
+        def counts(**kwargs):
+            results = TestModel.list(
+                ROOT_ID, model_registry, partition_by=TestModel.description, **kwargs
+            )
+            by_group = {}
+            for result in results:
+                group = result["description"]
+                by_group[group] = by_group.get(group, 0) + 1
+            return by_group
+
+        assert counts(limit=2) == {"a": 2, "b": 2}
+        assert counts(limit=2, offset=1) == {"a": 2, "b": 1}
+        assert counts(limit=2, offset=2) == {"a": 1}
+        assert counts(limit=1, description="b") == {"b": 1}
+    finally:
+        db.close()
+
+
 def test_delete_method(test_user_id, mock_server):
     """Test the delete method"""
     # Get model registry from mock server
@@ -614,6 +880,47 @@ def test_delete_method(test_user_id, mock_server):
         db.close()
 
 
+def test_bulk_update_and_purge_in_chunks(test_user_id, mock_server):
+    """Test set-based bulk_update and bulk_purge across several chunks"""
+    model_registry = mock_server.app.state.model_registry
+    db = model_registry.DB.get_session()
+    TestModel = AbstractDbEntityTestModel.DB(model_registry.DB.Base)
+    model_registry.DB.Base.metadata.create_all(model_registry.DB.get_setup_engine())
+
+    try:
+        db.query(TestModel).delete()
+        db.commit()
+        db.add_all([TestModel(name="bulk", description=str(i)) for i in range(5)])
+        db.add(TestModel(name="keep"))
+        db.commit()
+
+        updated = TestModel.bulk_update(
+            ROOT_ID,
+            model_registry,
+            new_properties={"description": "bulk updated"},
+            name="bulk",
+            chunk_size=2,
+        )
+        assert updated == 5
+        db.expire_all()
+        assert {e.description for e in db.query(TestModel).filter_by(name="bulk")} == {
+            "bulk updated"
+        }
+
+        with pytest.raises(HTTPException) as exc:
+            TestModel.bulk_purge(test_user_id, model_registry, name="bulk")
+        assert exc.value.status_code == 403
+
+        purged = TestModel.bulk_purge(
+            ROOT_ID, model_registry, name="bulk", chunk_size=2
+        )
+        assert purged == 5
+        db.expire_all()
+        assert [e.name for e in db.query(TestModel).all()] == ["keep"]
+    finally:
+        db.close()
+
+
 # Test error handling for DTO conversions
 def test_dto_conversion_error_handling():
     """Test error handling in DTO conversions"""
@@ -7,6 +7,7 @@ Consolidated database configuration and declarative base management.
 import multiprocessing
 import os
 import threading
+import zlib
 from contextlib import asynccontextmanager, contextmanager
 from enum import Enum
 from os import makedirs, path
@@ -14,7 +15,8 @@ from threading import local
 from typing import AsyncGenerator, Generator, Optional
 from weakref import WeakSet
 
-from sqlalchemy import UUID, String, create_engine, event
+from sqlalchemy import UUID, String, create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -81,6 +83,33 @@ def setup_sqlite_for_concurrency(engine):
             cursor.close()
 
 
+class BatchSession(Session):
+    """
+    Session that runs many operations in one transaction.
+
+    Code written to commit after each operation only flushes here, and
+    ``rollback`` undoes the innermost savepoint rather than the whole
+    transaction, so each operation can be isolated with ``begin_nested``.
+    The transaction itself ends with ``commit_batch`` or ``rollback_batch``.
+    """
+
+    def commit(self) -> None:
+        self.flush()
+
+    def rollback(self) -> None:
+        nested = self.get_nested_transaction()
+        if nested is not None:
+            nested.rollback()
+        else:
+            super().rollback()
+
+    def commit_batch(self) -> None:
+        super().commit()
+
+    def rollback_batch(self) -> None:
+        super().rollback()
+
+
 def get_database_info(db_prefix: str = ""):
     """Get database configuration information.
 
@@ -427,6 +456,35 @@ class DatabaseManager:
 
         self._worker_initialized = False
 
+    def reset_after_fork(self) -> None:
+        """Forget engines and sessions inherited from a forking parent process.
+
+        Pooled connections belong to the parent, so they are dropped with
+        ``dispose(close=False)`` instead of being closed under it. Worker
+        engines are rebuilt by the next ``init_worker`` call while the engine
+        configuration, declarative base and metadata stay shared.
+        """
+        for engine in (self._setup_engine, self.engine):
+            if engine:
+                try:
+                    engine.dispose(close=False)
+                except Exception:
+                    pass
+        if self.async_engine:
+            try:
+                self.async_engine.sync_engine.dispose(close=False)
+            except Exception:
+                pass
+
+        self.engine = None
+        self.async_engine = None
+        self._session_factory = None
+        self._async_session_factory = None
+        self._worker_initialized = False
+        self._thread_local = local()
+        self._active_sessions = WeakSet()
+        self._sessions_lock = threading.RLock()
+
     def _close_all_sessions(self) -> None:
         """Close all tracked active sessions."""
         with self._sessions_lock:
@@ -500,6 +558,41 @@ class DatabaseManager:
                 with self._sessions_lock:
                     self._active_sessions.discard(session)
 
+    @contextmanager
+    def batch_session(self) -> Generator[BatchSession, None, None]:
+        """
+        Get a ``BatchSession`` whose operations share one transaction.
+
+        The transaction is committed when the block exits normally and rolled
+        back if it raises.
+        """
+        if not self._worker_initialized:
+            self.init_worker()
+
+        session = BatchSession(**self._session_factory.kw)
+        setattr(session, "_db_manager", self)
+        with self._sessions_lock:
+            self._active_sessions.add(session)
+
+        try:
+            if self._database_type == "sqlite":
+                # pysqlite only opens a transaction before DML, and releasing a
+                # savepoint taken outside a transaction commits it
+                session.connection().exec_driver_sql("BEGIN")
+            yield session
+            session.commit_batch()
+        except Exception:
+            session.rollback_batch()
+            raise
+        finally:
+            try:
+                session.close()
+            except Exception as e:
+                logger.warning(f"Error closing session: {e}")
+            finally:
+                with self._sessions_lock:
+                    self._active_sessions.discard(session)
+
     @asynccontextmanager
     async def _get_async_db_session(
         self, *, auto_commit: bool = True
@@ -571,6 +664,64 @@ class DatabaseManager:
         async with self._get_async_db_session(auto_commit=auto_commit) as session:
             yield session
 
+    @contextmanager
+    def try_lock(self, name: str) -> Generator[bool, None, None]:
+        """
+        Hold the named cross-process lock for the block if it is free.
+
+        Yields whether the lock was taken; it is never waited for. PostgreSQL
+        uses a session advisory lock and MySQL/MariaDB a named lock, held on
+        a dedicated pooled connection. SQLite locks a file next to the
+        database with flock. The server or OS releases all of them if the
+        holder dies. Where none is available the block always runs.
+        """
+        if not self._worker_initialized:
+            self.init_worker()
+
+        if self._database_type == "sqlite":
+            database = make_url(self._database_uri).database
+            try:
+                import fcntl
+            except ImportError:
+                fcntl = None
+            if fcntl is None or not database or database == ":memory:":
+                yield True
+                return
+            with open(f"{database}.{name}.lock", "a") as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+            return
+
+        if self._database_type == "postgresql":
+            key = zlib.crc32(f"{self._database_name}.{name}".encode()) & 0x7FFFFFFF
+            acquire = (text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+            release = (text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        elif self._database_type in ("mysql", "mariadb"):
+            lock_name = f"{self._database_name}.{name}"
+            acquire = (text("SELECT GET_LOCK(:name, 0)"), {"name": lock_name})
+            release = (text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+        else:
+            logger.debug(f"No cross-process lock available for {self._database_type}")
+            yield True
+            return
+
+        with self.engine.connect() as connection:
+            acquired = bool(connection.execute(*acquire).scalar())
+            connection.commit()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    connection.execute(*release)
+                    connection.commit()
+
     def cleanup_thread(self) -> None:
         """Clean up thread-local resources."""
         if hasattr(self._thread_local, "session"):
@@ -394,6 +394,55 @@ class TestDatabaseManager:
                 )
                 assert result is None
 
+    def test_batch_session_isolates_failed_operations(self):
+        """Test batch session commits once and rolls back only failed savepoints."""
+        with patch.dict(
+            os.environ, {"DATABASE_TYPE": "sqlite", "DATABASE_NAME": "test_db"}
+        ):
+            manager = DatabaseManager("test.static")
+
+            TestModel = type(
+                "TestModel",
+                (manager.Base,),
+                {
+                    "__tablename__": "test_model_batch",
+                    "id": Column(Integer, primary_key=True),
+                    "name": Column(String(50)),
+                },
+            )
+
+            manager.Base.metadata.create_all(manager.get_setup_engine())
+            with manager._get_db_session() as session:
+                session.query(TestModel).delete()
+
+            with manager.batch_session() as session:
+                for name in ("kept", "failed", "also_kept"):
+                    savepoint = session.begin_nested()
+                    session.add(TestModel(name=name))
+                    # Per-operation commits only flush
+                    session.commit()
+                    if name == "failed":
+                        session.rollback()
+                    else:
+                        savepoint.commit()
+
+                # Nothing is visible outside the batch before it ends
+                with manager._get_db_session() as other:
+                    assert other.query(TestModel).count() == 0
+
+            with manager._get_db_session() as session:
+                names = {row.name for row in session.query(TestModel)}
+                assert names == {"kept", "also_kept"}
+
+            with pytest.raises(ValueError):
+                with manager.batch_session() as session:
+                    session.add(TestModel(name="discarded"))
+                    session.commit()
+                    raise ValueError("Test exception")
+
+            with manager._get_db_session() as session:
+                assert session.query(TestModel).count() == 2
+
     @pytest.mark.asyncio
     async def test_async_session_context_manager(self):
         """Test async session context manager."""
@@ -543,6 +592,41 @@ class TestDatabaseManager:
             await manager.close_worker()
             assert not manager._worker_initialized
 
+    def test_reset_after_fork(self):
+        """Test a forked worker drops inherited engines and rebuilds its own."""
+        with patch.dict(
+            os.environ, {"DATABASE_TYPE": "sqlite", "DATABASE_NAME": "test_db"}
+        ):
+            manager = DatabaseManager("test.static")
+            manager.init_worker()
+            inherited = manager.engine
+            config = manager.engine_config
+
+            manager.reset_after_fork()
+            assert not manager._worker_initialized
+            assert manager.engine is None
+            assert manager.get_active_session_count() == 0
+
+            with manager._get_db_session() as session:
+                assert session.execute(text("SELECT 1")).scalar() == 1
+            assert manager.engine is not inherited
+            assert manager.engine_config is config
+
+    def test_try_lock_is_exclusive(self):
+        """Test a held named lock is reported as taken instead of waited for."""
+        with patch.dict(
+            os.environ, {"DATABASE_TYPE": "sqlite", "DATABASE_NAME": "test_db"}
+        ):
+            manager = DatabaseManager("test.static")
+            with manager.try_lock("sweep") as first:
+                assert first is True
+                with manager.try_lock("sweep") as second:
+                    assert second is False
+                with manager.try_lock("other") as other:
+                    assert other is True
+            with manager.try_lock("sweep") as again:
+                assert again is True
+
 
 class TestDatabaseOperations:
     """Test actual database operations."""
@@ -1,14 +1,18 @@
 import inspect
+import time
+from datetime import timezone
 from enum import Enum as PyEnum  # Import Python Enum
 from typing import Any, Optional, Type, TypeVar
 
 import stringcase
 from sqlalchemy import (  # Import inspect and Integer
     Integer,
+    String,
     and_,
     exists,
     false,
     func,
+    literal,
     or_,
     select,
     true,
@@ -864,75 +868,59 @@ def check_permission(
         return (PermissionResult.ERROR, str(e))
 
 
-def _get_admin_accessible_team_ids_cte(
-    user_id: str,
-    db: Session,
-    declarative_base,
-    max_depth: int = 5,
-    unique_suffix: str = "",
-) -> CTE:
+def _get_membership_base_selects(user_id: str, declarative_base) -> list:
     """
-    Generates a recursive CTE to find all team IDs accessible by a user,
-    including teams they are directly a member of and parent teams.
+    Build one SELECT per source of direct team membership for a user:
+    enabled user_teams rows, invitations addressed to the user, and
+    invitations the user is an invitee of.
 
     Args:
         user_id: The ID of the user
-        db: Database session
         declarative_base: The declarative base to use for accessing SQLAlchemy models
-        max_depth: Maximum depth for recursion (default: 5)
-        unique_suffix: Optional suffix to make CTE name unique (default: "")
 
     Returns:
-        CTE: Common table expression with accessible team IDs
+        list: ``(select, expires_at_column, direct)`` tuples. Each select yields
+        ``id``, ``role_id`` and ``depth`` columns; ``direct`` is True for
+        user_teams rows.
     """
     # Local import to break cycle
-    from database.DatabaseManager import DatabaseManager
-    from logic.BLL_Auth import (
-        InvitationModel,
-        InviteeModel,
-        RoleModel,
-        TeamModel,
-        UserModel,
-        UserTeamModel,
-    )
+    from logic.BLL_Auth import InvitationModel, InviteeModel, UserTeamModel
 
-    # Get SQLAlchemy models using the declarative base
-    UserModel.DB(declarative_base)
-    RoleModel.DB(declarative_base)
-    team_db_cls = TeamModel.DB(declarative_base)
     user_team_db_cls = UserTeamModel.DB(declarative_base)
 
-    # Create a unique CTE name using the suffix if provided
-    cte_name = f"admin_accessible_teams_cte{unique_suffix}"
-
     base_selects = [
-        select(
-            user_team_db_cls.team_id.label("id"),
-            user_team_db_cls.role_id.label("role_id"),
-            func.cast(1, Integer).label("depth"),
-        )
-        .where(user_team_db_cls.user_id == user_id)
-        .where(user_team_db_cls.enabled == True)
-        .where(
-            or_(
-                user_team_db_cls.expires_at == None,
-                user_team_db_cls.expires_at > func.now(),
+        (
+            select(
+                user_team_db_cls.team_id.label("id"),
+                user_team_db_cls.role_id.label("role_id"),
+                func.cast(1, Integer).label("depth"),
             )
+            .where(user_team_db_cls.user_id == user_id)
+            .where(user_team_db_cls.enabled == True)
+            .where(
+                or_(
+                    user_team_db_cls.expires_at == None,
+                    user_team_db_cls.expires_at > func.now(),
+                )
+            ),
+            user_team_db_cls.expires_at,
+            True,
         )
     ]
 
     # Invitations that target the user directly should also expose the team hierarchy
     invitation_db_cls = InvitationModel.DB(declarative_base)
     invitee_db_cls = InviteeModel.DB(declarative_base)
+    invitation_expires_at = getattr(invitation_db_cls, "expires_at", None)
 
     invitation_filters = [invitation_db_cls.team_id.isnot(None)]
     if hasattr(invitation_db_cls, "deleted_at"):
         invitation_filters.append(invitation_db_cls.deleted_at.is_(None))
-    if hasattr(invitation_db_cls, "expires_at"):
+    if invitation_expires_at is not None:
         invitation_filters.append(
             or_(
-                invitation_db_cls.expires_at.is_(None),
-                invitation_db_cls.expires_at > func.now(),
+                invitation_expires_at.is_(None),
+                invitation_expires_at > func.now(),
             )
         )
 
@@ -943,7 +931,7 @@ def _get_admin_accessible_team_ids_cte(
     ).where(invitation_db_cls.user_id == user_id)
     for condition in invitation_filters:
         direct_invitation_query = direct_invitation_query.where(condition)
-    base_selects.append(direct_invitation_query)
+    base_selects.append((direct_invitation_query, invitation_expires_at, False))
 
     invitee_invitation_query = (
         select(
@@ -964,15 +952,25 @@ def _get_admin_accessible_team_ids_cte(
     invitee_invitation_query = invitee_invitation_query.where(
         invitee_db_cls.declined_at.is_(None)
     )
-    base_selects.append(invitee_invitation_query)
+    base_selects.append((invitee_invitation_query, invitation_expires_at, False))
+
+    return base_selects
 
-    if len(base_selects) == 1:
-        combined_base = base_selects[0]
-    else:
-        base_union = union_all(*base_selects).subquery()
-        combined_base = select(
-            base_union.c.id, base_union.c.role_id, base_union.c.depth
-        )
+
+def _expand_team_ids_cte(
+    combined_base, declarative_base, cte_name: str, max_depth: int = 5
+) -> CTE:
+    """
+    Turn a base SELECT of ``id``, ``role_id`` and ``depth`` into a recursive
+    CTE that also yields every parent team up to ``max_depth`` levels.
+    """
+    # Local import to break cycle
+    from logic.BLL_Auth import RoleModel, TeamModel, UserModel
+
+    # Get SQLAlchemy models using the declarative base
+    UserModel.DB(declarative_base)
+    RoleModel.DB(declarative_base)
+    team_db_cls = TeamModel.DB(declarative_base)
 
     recursive_cte = combined_base.cte(cte_name, recursive=True)
 
@@ -991,9 +989,183 @@ def _get_admin_accessible_team_ids_cte(
         .where(cte_alias.c.depth < max_depth)
     )
 
-    recursive_cte = recursive_cte.union(recursive_term)
+    return recursive_cte.union(recursive_term)
+
+
+def _get_admin_accessible_team_ids_cte(
+    user_id: str,
+    db: Session,
+    declarative_base,
+    max_depth: int = 5,
+    unique_suffix: str = "",
+) -> CTE:
+    """
+    Generates a recursive CTE to find all team IDs accessible by a user,
+    including teams they are directly a member of and parent teams.
+
+    Args:
+        user_id: The ID of the user
+        db: Database session
+        declarative_base: The declarative base to use for accessing SQLAlchemy models
+        max_depth: Maximum depth for recursion (default: 5)
+        unique_suffix: Optional suffix to make CTE name unique (default: "")
 
-    return recursive_cte
+    Returns:
+        CTE: Common table expression with accessible team IDs
+    """
+    # Create a unique CTE name using the suffix if provided
+    cte_name = f"admin_accessible_teams_cte{unique_suffix}"
+
+    base_selects = [
+        query for query, _, _ in _get_membership_base_selects(user_id, declarative_base)
+    ]
+
+    if len(base_selects) == 1:
+        combined_base = base_selects[0]
+    else:
+        base_union = union_all(*base_selects).subquery()
+        combined_base = select(
+            base_union.c.id, base_union.c.role_id, base_union.c.depth
+        )
+
+    return _expand_team_ids_cte(combined_base, declarative_base, cte_name, max_depth)
+
+
+def _get_claimed_team_ids_cte(
+    memberships: list,
+    declarative_base,
+    max_depth: int = 5,
+    unique_suffix: str = "",
+) -> CTE:
+    """
+    Same shape as ``_get_admin_accessible_team_ids_cte`` but seeded from the
+    memberships carried in verified token claims, so the user_teams and
+    invitation tables are not read. Parent teams are still resolved live.
+
+    Args:
+        memberships: ``[team_id, role_id, direct]`` rows from the claims
+        declarative_base: The declarative base to use for accessing SQLAlchemy models
+        max_depth: Maximum depth for recursion (default: 5)
+        unique_suffix: Optional suffix to make CTE name unique (default: "")
+
+    Returns:
+        CTE: Common table expression with accessible team IDs
+    """
+    cte_name = f"claimed_teams_cte{unique_suffix}"
+
+    base_selects = [
+        select(
+            literal(team_id, String).label("id"),
+            literal(role_id, String).label("role_id"),
+            func.cast(1, Integer).label("depth"),
+        )
+        for team_id, role_id, _ in memberships
+    ]
+
+    if not base_selects:
+        combined_base = select(
+            literal(None, String).label("id"),
+            literal(None, String).label("role_id"),
+            func.cast(1, Integer).label("depth"),
+        ).where(false())
+    elif len(base_selects) == 1:
+        combined_base = base_selects[0]
+    else:
+        base_union = union_all(*base_selects).subquery()
+        combined_base = select(
+            base_union.c.id, base_union.c.role_id, base_union.c.depth
+        )
+
+    return _expand_team_ids_cte(combined_base, declarative_base, cte_name, max_depth)
+
+
+def build_authorization_claims(
+    user_id: str, db: Session, declarative_base
+) -> Optional[dict]:
+    """
+    Build the compact, versioned membership claim set embedded in access
+    tokens as ``authz``.
+
+    The claim set is ``{"v": version, "t": [[team_id, role_id, direct], ...],
+    "exp": epoch | None}`` where ``v`` is the user's ``membership_version`` at
+    issue time and ``exp`` is the earliest membership expiry. Returns None
+    when the user has more memberships than ``AUTHZ_CLAIMS_MAX_TEAMS``.
+    """
+    # Local import to break cycle
+    from logic.BLL_Auth import UserModel
+
+    user_db_cls = UserModel.DB(declarative_base)
+    version = (
+        db.query(user_db_cls.membership_version)
+        .filter(user_db_cls.id == user_id)
+        .scalar()
+    )
+
+    memberships = []
+    expiries = []
+    for query, expires_at, direct in _get_membership_base_selects(
+        user_id, declarative_base
+    ):
+        if expires_at is not None:
+            query = query.add_columns(expires_at.label("expires_at"))
+        for row in db.execute(query):
+            memberships.append([row.id, row.role_id, 1 if direct else 0])
+            row_expires_at = getattr(row, "expires_at", None)
+            if row_expires_at is not None:
+                if row_expires_at.tzinfo is None:
+                    row_expires_at = row_expires_at.replace(tzinfo=timezone.utc)
+                expiries.append(int(row_expires_at.timestamp()))
+
+    if len(memberships) > int(env("AUTHZ_CLAIMS_MAX_TEAMS")):
+        return None
+
+    return {
+        "v": version or 0,
+        "t": memberships,
+        "exp": min(expiries) if expiries else None,
+    }
+
+
+def _get_request_memberships(
+    user_id: str, db: Session, declarative_base
+) -> Optional[list]:
+    """
+    Return the memberships from the current request's verified claims, or
+    None when the permission filter has to read the membership tables.
+
+    Claims are only trusted for the token's own subject, before the earliest
+    membership expiry, and while their version equals the user's current
+    ``membership_version``. The version comparison is memoized in the
+    request's claims dictionary, so it costs at most one primary key lookup
+    per request.
+    """
+    if env("AUTHZ_CLAIMS").lower() != "true":
+        return None
+
+    # Local imports to break cycle
+    from lib.RequestContext import get_request_claims
+    from logic.BLL_Auth import UserModel
+
+    claims = get_request_claims()
+    if not claims or claims.get("sub") != user_id:
+        return None
+
+    expires = claims.get("exp")
+    if expires is not None and expires <= time.time():
+        return None
+
+    if "_version_ok" not in claims:
+        user_db_cls = UserModel.DB(declarative_base)
+        current = (
+            db.query(user_db_cls.membership_version)
+            .filter(user_db_cls.id == user_id)
+            .scalar()
+        )
+        claims["_version_ok"] = (current or 0) == claims.get("v")
+
+    if not claims["_version_ok"]:
+        return None
+    return claims.get("t") or []
 
 
 def _get_role_hierarchy_map(db: Session, declarative_base) -> dict:
@@ -1080,6 +1252,7 @@ def _build_direct_permission_filter(
     db: Session,
     required_permission_level: "PermissionType",
     declarative_base,
+    memberships: Optional[list] = None,
 ):
     """
     Generates a SQLAlchemy filter expression to check for direct permissions
@@ -1092,6 +1265,7 @@ def _build_direct_permission_filter(
         db: Database session
         required_permission_level: Required permission type
         declarative_base: The declarative base to use for accessing SQLAlchemy models
+        memberships: Memberships from verified token claims, if any
 
     Returns:
         SQLAlchemy expression for direct permission checks
@@ -1150,22 +1324,27 @@ def _build_direct_permission_filter(
 
     # 3. Role Permission (User must have a role on an accessible team, and that role has the permission)
     # Get user's roles on accessible teams
-    user_roles_on_accessible_teams = (
-        select(user_team_db_cls.role_id)
-        .distinct()
-        .join(
-            accessible_team_ids_cte,
-            user_team_db_cls.team_id == accessible_team_ids_cte.c.id,
+    if memberships is not None:
+        user_roles_on_accessible_teams = list(
+            {role_id: None for _, role_id, direct in memberships if direct}
         )
-        .where(user_team_db_cls.user_id == user_id)
-        .where(user_team_db_cls.enabled == True)
-        .where(
-            or_(
-                user_team_db_cls.expires_at == None,
-                user_team_db_cls.expires_at > func.now(),
+    else:
+        user_roles_on_accessible_teams = (
+            select(user_team_db_cls.role_id)
+            .distinct()
+            .join(
+                accessible_team_ids_cte,
+                user_team_db_cls.team_id == accessible_team_ids_cte.c.id,
             )
-        )
-    )  # Subquery for user's relevant role IDs
+            .where(user_team_db_cls.user_id == user_id)
+            .where(user_team_db_cls.enabled == True)
+            .where(
+                or_(
+                    user_team_db_cls.expires_at == None,
+                    user_team_db_cls.expires_at > func.now(),
+                )
+            )
+        )  # Subquery for user's relevant role IDs
 
     # Check if any of *those* roles have the required permission assigned
     role_perm_exists_specific = exists().where(
@@ -1285,14 +1464,24 @@ def generate_permission_filter(
 
     unique_suffix = f"_{resource_cls.__name__}_{str(uuid.uuid4())[-8:]}"
 
-    # Get accessible teams CTE with depth limit and unique name
-    accessible_team_ids_cte = _get_admin_accessible_team_ids_cte(
-        user_id,
-        db,
-        declarative_base,
-        max_depth=5,
-        unique_suffix=unique_suffix,
-    )
+    # Get accessible teams CTE with depth limit and unique name, seeded from
+    # the token's membership claims when they are still current
+    memberships = _get_request_memberships(user_id, db, declarative_base)
+    if memberships is not None:
+        accessible_team_ids_cte = _get_claimed_team_ids_cte(
+            memberships,
+            declarative_base,
+            max_depth=5,
+            unique_suffix=unique_suffix,
+        )
+    else:
+        accessible_team_ids_cte = _get_admin_accessible_team_ids_cte(
+            user_id,
+            db,
+            declarative_base,
+            max_depth=5,
+            unique_suffix=unique_suffix,
+        )
 
     # Check for deleted records - only ROOT_ID can see them
     if hasattr(resource_db_cls, "deleted_at"):
@@ -1338,7 +1527,17 @@ def generate_permission_filter(
                     if role_hierarchy.get(role.name, -99) >= admin_level
                 ]
 
-                if sufficient_role_ids_for_admin:
+                if sufficient_role_ids_for_admin and memberships is not None:
+                    # Same check against the claimed direct memberships
+                    user_has_sufficient_role_on_team = resource_db_cls.team_id.in_(
+                        [
+                            team_id
+                            for team_id, role_id, direct in memberships
+                            if direct and role_id in sufficient_role_ids_for_admin
+                        ]
+                    )
+                    conditions.append(user_has_sufficient_role_on_team)
+                elif sufficient_role_ids_for_admin:
                     # Check if the user has *any* sufficient role on the *specific team* owning the record
                     user_has_sufficient_role_on_team = exists().where(
                         and_(
@@ -1554,6 +1753,7 @@ def generate_permission_filter(
         db,
         required_permission_level,
         declarative_base,
+        memberships=memberships,
     )
     conditions.append(direct_permissions)
 
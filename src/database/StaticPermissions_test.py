@@ -1647,3 +1647,191 @@ def test_invited_user_sees_child_and_parent_team(model_registry, use_invitee):
 
     assert "Invitation Child" in team_names
     assert "Invitation Parent" in team_names
+
+
+class TestAuthorizationClaims:
+    """Membership claims carried in the token instead of membership queries."""
+
+    @pytest.fixture
+    def session(self, model_registry):
+        db = model_registry.DB.session()
+        yield db
+        db.close()
+
+    @pytest.fixture(autouse=True)
+    def claims_enabled(self):
+        from lib.RequestContext import clear_request_context
+
+        with patch("lib.Environment.settings.AUTHZ_CLAIMS", "true"):
+            yield
+        clear_request_context()
+
+    def _visible_team_ids(self, user_id, db, base):
+        from database.StaticPermissions import generate_permission_filter
+        from logic.BLL_Auth import TeamModel
+
+        team_db_cls = TeamModel.DB(base)
+        permission_filter = generate_permission_filter(user_id, team_db_cls, db, base)
+        return {row.id for row in db.query(team_db_cls.id).filter(permission_filter)}
+
+    def test_build_claims(self, server, model_registry, session):
+        from conftest import create_team, create_user
+        from database.StaticPermissions import build_authorization_claims
+
+        base = model_registry.DB.manager.Base
+        user = create_user(server)
+        team = create_team(server, user.id, name="Claims Team")
+
+        claims = build_authorization_claims(user.id, session, base)
+        assert [team.id, env("ADMIN_ROLE_ID"), 1] in claims["t"]
+        assert claims["v"] >= 1
+        assert claims["exp"] is None
+
+    def test_login_embeds_claims(self, server, model_registry):
+        import jwt as pyjwt
+        from conftest import authorize_user, create_team, create_user
+
+        user = create_user(server)
+        team = create_team(server, user.id, name="Claims Login Team")
+
+        token = authorize_user(server, user.email)
+        payload = pyjwt.decode(token, options={"verify_signature": False})
+        assert [team.id, env("ADMIN_ROLE_ID"), 1] in payload["authz"]["t"]
+
+    def test_claims_used_until_version_changes(self, server, model_registry, session):
+        from conftest import add_user_to_team, create_team, create_user
+        from database.StaticPermissions import _get_request_memberships
+        from lib.RequestContext import get_request_claims, set_request_claims
+        from logic.BLL_Auth import UserModel
+
+        base = model_registry.DB.manager.Base
+        user = create_user(server)
+        owner = create_user(server)
+        other_team = create_team(server, owner.id, name="Claims Other Team")
+        assert other_team.id not in self._visible_team_ids(user.id, session, base)
+
+        # Claims naming a team the user does not belong to prove that the
+        # filter is seeded from the claims rather than from user_teams
+        version = (
+            session.query(UserModel.DB(base).membership_version)
+            .filter(UserModel.DB(base).id == user.id)
+            .scalar()
+        )
+        set_request_claims(
+            {
+                "v": version or 0,
+                "t": [[other_team.id, env("USER_ROLE_ID"), 1]],
+                "exp": None,
+                "sub": user.id,
+            }
+        )
+        assert other_team.id in self._visible_team_ids(user.id, session, base)
+
+        # Any membership change bumps the version and retires the claims
+        add_user_to_team(server, user.id, other_team.id, env("USER_ROLE_ID"))
+        assert "_version_ok" not in get_request_claims()
+        assert _get_request_memberships(user.id, session, base) is None
+
+    def test_revoked_invitation_retires_claims(self, server, model_registry, session):
+        from conftest import create_team, create_user
+        from database.StaticPermissions import _get_request_memberships
+        from lib.RequestContext import get_request_claims, set_request_claims
+        from logic.BLL_Auth import InvitationModel, InviteeModel, UserModel
+
+        base = model_registry.DB.manager.Base
+        InvitationDB = InvitationModel.DB(base)
+        InviteeDB = InviteeModel.DB(base)
+        user = create_user(server)
+        owner = create_user(server)
+        team = create_team(server, owner.id, name="Claims Invitation Team")
+
+        invitation = InvitationDB(
+            id=str(uuid.uuid4()),
+            team_id=team.id,
+            role_id=env("USER_ROLE_ID"),
+            code="CLAIMSREVOKE",
+            created_by_user_id=env("ROOT_ID"),
+        )
+        session.add(invitation)
+        session.commit()
+        session.add(
+            InviteeDB(
+                id=str(uuid.uuid4()),
+                invitation_id=invitation.id,
+                user_id=user.id,
+                email=user.email,
+                created_by_user_id=env("ROOT_ID"),
+            )
+        )
+        session.commit()
+
+        version = (
+            session.query(UserModel.DB(base).membership_version)
+            .filter(UserModel.DB(base).id == user.id)
+            .scalar()
+        )
+        set_request_claims(
+            {
+                "v": version or 0,
+                "t": [[team.id, env("USER_ROLE_ID"), 1]],
+                "exp": None,
+                "sub": user.id,
+            }
+        )
+        assert _get_request_memberships(user.id, session, base) is not None
+
+        # Revoking the invitation bumps its invitees' membership version
+        InvitationDB.delete(
+            requester_id=env("ROOT_ID"),
+            model_registry=model_registry,
+            id=invitation.id,
+        )
+        assert "_version_ok" not in get_request_claims()
+        session.expire_all()
+        assert _get_request_memberships(user.id, session, base) is None
+
+    def test_bulk_membership_update_bumps_version(
+        self, server, model_registry, session
+    ):
+        from conftest import add_user_to_team, create_team, create_user
+        from logic.BLL_Auth import UserModel, UserTeamModel
+
+        base = model_registry.DB.manager.Base
+        UserDB = UserModel.DB(base)
+        user = create_user(server)
+        owner = create_user(server)
+        team = create_team(server, owner.id, name="Claims Bulk Team")
+        add_user_to_team(server, user.id, team.id, env("USER_ROLE_ID"))
+
+        def version():
+            session.expire_all()
+            return (
+                session.query(UserDB.membership_version)
+                .filter(UserDB.id == user.id)
+                .scalar()
+            ) or 0
+
+        before = version()
+        updated = UserTeamModel.DB(base).bulk_update(
+            requester_id=env("ROOT_ID"),
+            model_registry=model_registry,
+            new_properties={"enabled": False},
+            user_id=user.id,
+            team_id=team.id,
+        )
+        assert updated == 1
+        assert version() == before + 1
+
+    def test_claims_ignored_for_other_subject_or_expired(
+        self, server, model_registry, session
+    ):
+        from database.StaticPermissions import _get_request_memberships
+        from lib.RequestContext import set_request_claims
+
+        base = model_registry.DB.manager.Base
+        claims = {"v": 0, "t": [], "exp": None, "sub": "someone-else"}
+        set_request_claims(claims)
+        assert _get_request_memberships("another-user", session, base) is None
+
+        claims.update({"sub": "another-user", "exp": 1})
+        assert _get_request_memberships("another-user", session, base) is None
@@ -10,8 +10,9 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-import time
 
 import stringcase
 
@@ -1959,54 +1960,232 @@ class {class_name}(Base):
 
         return True
 
-    def run_all_migrations(self, command, target="head", extensions=None):
-        """Run migrations for core and all extensions"""
-        logger.debug(
-            f"Database environment: TYPE={self.db_info['type']}, NAME={self.db_info['name']}"
+    def _version_table(self, extension_name=None):
+        """Name of the Alembic version table for core or an extension."""
+        if extension_name:
+            return f"alembic_version_{extension_name}"
+        return "alembic_version"
+
+    def _core_versions_dir(self):
+        """Core versions directory, as referenced by the generated alembic.ini."""
+        return (
+            self.paths["src_dir"]
+            / self.database_dir_name
+            / "migrations"
+            / self._get_versions_directory_name()
         )
 
-        # Wait for alembic.ini to not exist before proceeding
-        # This ensures only one thread runs migrations at a time
-        alembic_ini_path = self.paths["src_dir"] / "alembic.ini"
-        wait_count = 0
-        max_wait_count = 600  # 60 seconds timeout
+    def _alembic_config(self, versions_dir, extension_name=None):
+        """Build an in-memory Alembic Config for core or an extension.
 
-        while alembic_ini_path.exists() and wait_count < max_wait_count:
-            if wait_count == 0:
-                logger.debug(
-                    f"Waiting for alembic.ini to be released by another thread..."
-                )
-            wait_count += 1
+        Extensions share the core env.py (it selects the extension from
+        ALEMBIC_EXTENSION) and only differ in their version location and
+        table. No file is written and no logging configuration is loaded.
+        """
+        from alembic.config import Config
 
-            time.sleep(0.1)  # Sleep for 100ms
+        config = Config()
+        config.set_main_option(
+            "script_location", str(self.paths["migrations_dir"])
+        )
+        config.set_main_option("version_locations", str(versions_dir))
+        config.set_main_option(
+            "sqlalchemy.url", self.db_info["url"].replace("%", "%%")
+        )
+        config.set_main_option("version_table", self._version_table(extension_name))
+        return config
 
-            # Log progress every 5 seconds
-            if wait_count % 50 == 0:
-                logger.debug(
-                    f"Still waiting for alembic.ini (waited {wait_count * 0.1:.1f}s)..."
+    def _migration_targets(self):
+        """Core and configured extensions with DB models, with their versions directories."""
+        targets = [(None, self._core_versions_dir())]
+        for ext_name in self.configured_extensions:
+            extension_dir = self.paths["extensions_dir"] / ext_name
+            if not list(extension_dir.glob("DB_*.py")):
+                continue
+            targets.append(
+                (
+                    ext_name,
+                    extension_dir
+                    / "migrations"
+                    / self._get_versions_directory_name(),
                 )
-
-        if wait_count >= max_wait_count:
-            logger.error(
-                f"Timeout waiting for alembic.ini after {wait_count * 0.1:.1f}s - file may be stuck"
             )
-            # Try to clean up the stuck file
+        return targets
+
+    def migrations_at_head(self):
+        """Check whether core and every extension already record their script heads.
+
+        Only reads revision headers and the version tables; neither env.py nor
+        any model module is loaded. Returns False whenever a target has no
+        migration scripts yet, so the full run can create them.
+        """
+        from alembic.runtime.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+        from sqlalchemy import create_engine, pool
+
+        try:
+            engine = create_engine(self.db_info["url"], poolclass=pool.NullPool)
             try:
-                alembic_ini_path.unlink()
-                logger.warning(f"Forcefully removed stuck alembic.ini file")
-            except Exception as e:
-                logger.error(f"Failed to remove stuck alembic.ini: {e}")
-                return False
-        elif wait_count > 0:
-            logger.debug(
-                f"alembic.ini is now available after {wait_count * 0.1:.1f}s wait"
+                with engine.connect() as connection:
+                    for extension_name, versions_dir in self._migration_targets():
+                        if not versions_dir.exists():
+                            return False
+                        script_heads = set(
+                            ScriptDirectory.from_config(
+                                self._alembic_config(versions_dir, extension_name)
+                            ).get_heads()
+                        )
+                        if not script_heads:
+                            return False
+                        recorded_heads = set(
+                            MigrationContext.configure(
+                                connection,
+                                opts={
+                                    "version_table": self._version_table(
+                                        extension_name
+                                    )
+                                },
+                            ).get_current_heads()
+                        )
+                        if recorded_heads != script_heads:
+                            logger.debug(
+                                f"Migrations pending for {extension_name or 'core'}: "
+                                f"recorded {sorted(recorded_heads)}, scripts {sorted(script_heads)}"
+                            )
+                            return False
+            finally:
+                engine.dispose()
+        except Exception as e:
+            logger.debug(f"Could not compare migration heads: {e}")
+            return False
+        return True
+
+    @contextmanager
+    def migration_lock(self):
+        """Serialize migration runs across processes at the database level.
+
+        PostgreSQL uses a session advisory lock and MySQL/MariaDB a named lock,
+        both held on a dedicated connection. SQLite locks a file next to the
+        database with flock. All of them are released by the server or OS if
+        the holder dies, so no stale lock has to be detected or removed.
+        """
+        from sqlalchemy import create_engine, pool, text
+        from sqlalchemy.engine import make_url
+
+        url = make_url(self.db_info["url"])
+        backend = url.get_backend_name()
+        lock_name = f"{self.db_info.get('name') or url.database}.migrations"
+
+        if backend == "sqlite":
+            database = self.db_info.get("file_path") or url.database
+            try:
+                import fcntl
+            except ImportError:
+                fcntl = None
+            if fcntl is None or not database or database == ":memory:":
+                logger.debug("No migration lock available for this SQLite database")
+                yield
+                return
+            with open(f"{database}.migration.lock", "a") as lock_file:
+                logger.debug(f"Waiting for migration lock {lock_file.name}")
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+            return
+
+        engine = create_engine(url, poolclass=pool.NullPool)
+        try:
+            with engine.connect() as connection:
+                logger.debug(f"Waiting for migration lock {lock_name}")
+                if backend == "postgresql":
+                    key = zlib.crc32(lock_name.encode()) & 0x7FFFFFFF
+                    connection.execute(
+                        text("SELECT pg_advisory_lock(:key)"), {"key": key}
+                    )
+                    unlock = (text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                elif backend in ("mysql", "mariadb"):
+                    connection.execute(
+                        text("SELECT GET_LOCK(:name, -1)"), {"name": lock_name}
+                    )
+                    unlock = (
+                        text("SELECT RELEASE_LOCK(:name)"),
+                        {"name": lock_name},
+                    )
+                else:
+                    logger.debug(f"No migration lock available for {backend}")
+                    unlock = None
+                connection.commit()
+                try:
+                    yield
+                finally:
+                    if unlock is not None:
+                        connection.execute(*unlock)
+                        connection.commit()
+        finally:
+            engine.dispose()
+
+    def run_alembic_api(
+        self, command, target="head", extension_name=None, versions_dir=None
+    ):
+        """Run an upgrade or downgrade in this process through the Alembic API."""
+        from alembic import command as alembic_command
+
+        versions_dir = versions_dir or self._core_versions_dir()
+        config = self._alembic_config(versions_dir, extension_name)
+        config.attributes["skip_model_import"] = True
+        logger.debug(
+            f"Running {command} to '{target}' for {extension_name or 'core'} in-process"
+        )
+
+        # env.py selects the extension's models and version table from here
+        previous = os.environ.get("ALEMBIC_EXTENSION")
+        os.environ["ALEMBIC_EXTENSION"] = extension_name or ""
+        try:
+            getattr(alembic_command, command)(config, target)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Alembic {command} failed for {extension_name or 'core'}: {e}"
             )
+            return False
+        finally:
+            if previous is None:
+                os.environ.pop("ALEMBIC_EXTENSION", None)
+            else:
+                os.environ["ALEMBIC_EXTENSION"] = previous
+
+    def run_all_migrations(self, command, target="head", extensions=None):
+        """Run migrations for core and all extensions.
+
+        Runs are serialized with ``migration_lock``. An upgrade to head first
+        compares recorded and script heads and returns at once when nothing is
+        pending, so an unchanged database costs no lock and no migration run.
+        """
+        logger.debug(
+            f"Database environment: TYPE={self.db_info['type']}, NAME={self.db_info['name']}"
+        )
 
         # Refresh configured extensions to pick up any environment changes
         self.configured_extensions = extensions or self._get_configured_extensions()
+        check_heads = command == "upgrade" and target == "head"
+        if check_heads and self.migrations_at_head():
+            logger.debug("Database is at head for core and all extensions")
+            return True
+
+        with self.migration_lock():
+            # Another process may have finished the same upgrade while we waited
+            if check_heads and self.migrations_at_head():
+                logger.debug("Database was brought to head by another process")
+                return True
+            return self._run_all_migrations_locked(command, target)
+
+    def _run_all_migrations_locked(self, command, target):
+        """Body of ``run_all_migrations``, called with the migration lock held."""
         logger.debug(f"Running migrations for extensions: {self.configured_extensions}")
         logger.debug(f"Running {command} for core migrations")
-        core_result = self.run_alembic_command(command, target)
+        core_result = self.run_alembic_api(command, target)
 
         if not core_result:
             logger.error(f"Core migrations {command} failed")
@@ -2115,7 +2294,9 @@ class {class_name}(Base):
             logger.debug(
                 f"About to run extension migration: extension={extension_name}, command={command}, target={target}"
             )
-            success = self.run_extension_migration(extension_name, command, target)
+            success = self.run_alembic_api(
+                command, target, extension_name, versions_dir
+            )
             if not success:
                 logger.error(
                     f"Migration {command} failed for extension {extension_name}"
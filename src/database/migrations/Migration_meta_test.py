@@ -344,3 +344,49 @@ def downgrade():
 
         for expected_key in expected_keys:
             assert expected_key in all_keys, f"Key {expected_key} should be present"
+
+    def test_run_all_migrations_skips_when_at_head(self):
+        """Test the head check short-circuits an upgrade with nothing pending."""
+        import sqlite3
+        from unittest.mock import patch
+
+        from database.migrations.Migration import MigrationManager
+
+        versions_dir = self.temp_dir / "migrations" / "versions"
+        versions_dir.mkdir(parents=True)
+        (versions_dir / "a1_initial.py").write_text(
+            'revision = "a1"\n'
+            "down_revision = None\n"
+            "branch_labels = None\n"
+            "depends_on = None\n\n\n"
+            "def upgrade():\n    pass\n\n\n"
+            "def downgrade():\n    pass\n"
+        )
+        db_path = self.temp_dir / "meta.db"
+        manager = MigrationManager(
+            custom_db_info={
+                "type": "sqlite",
+                "name": "meta",
+                "url": f"sqlite:///{db_path}",
+                "file_path": str(db_path),
+            },
+            database_dir=str(self.temp_dir),
+        )
+        manager.configured_extensions = []
+
+        # Nothing recorded yet: the upgrade has to run
+        assert not manager.migrations_at_head()
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"
+            )
+            conn.execute("INSERT INTO alembic_version VALUES ('a1')")
+        assert manager.migrations_at_head()
+
+        with patch.object(
+            manager, "_get_configured_extensions", return_value=[]
+        ), patch.object(manager, "run_alembic_api") as run_alembic_api:
+            assert manager.run_all_migrations("upgrade", "head", extensions=[])
+        run_alembic_api.assert_not_called()
+        assert not (self.temp_dir / "meta.db.migration.lock").exists()
@@ -443,9 +443,14 @@ def import_all_models():
     return target_metadata
 
 
-# Import models and configure Alembic
-target_metadata = import_all_models()
+# Import models and configure Alembic. In-process upgrades and downgrades
+# only replay revision scripts, so MigrationManager.run_alembic_api skips the
+# model import that autogenerate needs.
 config = context.config
+if config.attributes.get("skip_model_import"):
+    target_metadata = Base.metadata
+else:
+    target_metadata = import_all_models()
 version_table = MigrationManager.env_setup_alembic_config(config)
 
 # Log database configuration from Alembic config (set by MigrationManager)
@@ -0,0 +1,36 @@
+"""user membership version
+
+Revision ID: 3f2a9c41d7b8
+Revises: e0b0dc9d5070
+Create Date: 2026-10-18 09:12:40.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f2a9c41d7b8"
+down_revision: Union[str, None] = "e0b0dc9d5070"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "membership_version",
+            sa.Integer(),
+            nullable=True,
+            comment="Incremented whenever the user's team memberships change",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "membership_version")
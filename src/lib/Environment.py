@@ -53,13 +53,49 @@ class AppSettings(BaseModel):
     REST: str = "true"
     GQL: str = "true"
     GQL_DEPTH: int = 3
+    GQL_MAX_COST: int = 25000
+    GQL_MAX_ALIASES: int = 15
+    GQL_DOCUMENT_CACHE_SIZE: int = 1000
+    GQL_PERSISTED_QUERY_ALLOWLIST: str = ""
+    GQL_BROADCAST_URL: str = ""
+    GQL_SUBSCRIPTION_MAX_BACKLOG: int = 1000
+    GQL_NAVIGATION_MAX_ITEMS: int = 100
+    INCLUDE_MAX_DEPTH: int = 3
+    INCLUDE_MAX_COUNT: int = 10
+    BATCH_GET_MAX_IDS: int = 100
+    BULK_MUTATION_MAX_ITEMS: int = 100
+    AGGREGATE_MAX_GROUPS: int = 1000
     MCP: str = "false"
+    FAST_RESPONSES: str = "true"
+    RESPONSE_CACHE: str = "false"
+    RESPONSE_CACHE_PATH: str = ""
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10000
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 1048576
+    OPENAPI_CACHE: str = "true"
+    OPENAPI_CACHE_PATH: str = ""
+    OPENAPI_PREBUILD: str = "false"
     LOG_FORMAT: str = "%(asctime)s | %(levelname)s | %(message)s"
     LOG_LEVEL: str = "INFO"
+    DEBUG_BODY_SAMPLE_RATE: float = 0.0
+    DEBUG_BODY_MAX_BYTES: int = 4096
     REGISTRATION_DISABLED: str = "false"
     REGISTRATION_MODE: Literal["open", "invite", "closed"] = "open"
     SEED_DATA: str = "true"
 
+    LOGIN_MAX_FAILED_ATTEMPTS: int = 5
+    LOGIN_LOCKOUT_WINDOW_SECONDS: int = 3600
+    FAILED_LOGIN_FLUSH_SECONDS: int = 5
+    FAILED_LOGIN_RETENTION_DAYS: int = 30
+    SESSION_CACHE_SECONDS: int = 30
+    SESSION_REVOCATION_PATH: str = ""
+    SESSION_ACTIVITY_FLUSH_SECONDS: int = 30
+    SESSION_REAPER_SECONDS: int = 300
+    SESSION_REAPER_CHUNK_SIZE: int = 1000
+    SESSION_RETENTION_DAYS: int = 30
+    AUTHZ_CLAIMS: str = "false"
+    AUTHZ_CLAIMS_MAX_TEAMS: int = 50
+    PREFERENCE_CACHE_SECONDS: int = 60
+
     ROOT_ID: str = "FFFFFFFF-FFFF-FFFF-FFFF-FFFFFFFFFFFF"
     SYSTEM_ID: str = "FFFFFFFF-FFFF-FFFF-AAAA-FFFFFFFFFFFF"
     TEMPLATE_ID: str = "FFFFFFFF-FFFF-FFFF-0000-FFFFFFFFFFFF"
@@ -70,6 +106,7 @@ class AppSettings(BaseModel):
 
     TZ: str = "UTC"
     UVICORN_WORKERS: Optional[str] = 1
+    UVICORN_PREFORK: str = "false"
 
     @field_validator("DATABASE_NAME", "DATABASE_USER", mode="before")
     @classmethod
@@ -0,0 +1,373 @@
+"""
+GraphQLBroadcast.py - Event bus behind GraphQL subscriptions.
+
+Mutations publish model events to channels such as ``usermanager_created``
+and subscriptions listen on them. The transport is a ``broadcaster``
+backend chosen by URL, so events published by one worker reach subscribers
+on every worker: ``sqlite://`` shares a SQLite file between the workers of
+a host, while ``redis://``, ``postgres://`` and ``kafka://`` span hosts.
+Every subscriber gets its own bounded queue, and the bus records delivery
+latency and backlog per subscriber.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+from broadcaster import BroadcastBackend, Event
+
+from lib.Environment import env
+from lib.Logging import logger
+
+
+class SQLiteBackend(BroadcastBackend):
+    """
+    Host-local bus through a SQLite file that every worker opens.
+
+    Published events are appended to a table; each worker polls for rows
+    newer than the last one it has read. Rows older than the retention
+    window are pruned by publishers. All SQLite calls run in the default
+    executor so a busy or locked file never blocks the event loop.
+
+    URL: ``sqlite:///path/to/bus.db?poll_interval=0.05&retention=60``. Without
+    a path the file is named after ``APP_NAME`` in the system temp directory.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, url: str):
+        parsed = urlparse(url)
+        options = parse_qs(parsed.query)
+        self.path = parsed.path or os.path.join(
+            tempfile.gettempdir(), f"{str(env('APP_NAME')).lower()}.broadcast.db"
+        )
+        self.poll_interval = float(options.get("poll_interval", ["0.05"])[0])
+        self.retention = float(options.get("retention", ["60"])[0])
+        self._conn: Optional[sqlite3.Connection] = None
+        # Serializes use of the connection across executor threads
+        self._lock = threading.Lock()
+        self._subscribed: Set[str] = set()
+        self._pending: Deque[Event] = deque()
+        self._last_id = 0
+        self._published = 0
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path, timeout=5, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, "
+            "message TEXT NOT NULL, published_at REAL NOT NULL)"
+        )
+        # Only events published after connecting are delivered
+        self._last_id = conn.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM events"
+        ).fetchone()[0]
+        return conn
+
+    def _close(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            conn.close()
+
+    def _insert(self, channel: str, message: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO events (channel, message, published_at) VALUES (?, ?, ?)",
+                (channel, message, now),
+            )
+            self._published += 1
+            if self._published % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM events WHERE published_at < ?",
+                    (now - self.retention,),
+                )
+
+    def _fetch(self) -> List[Any]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, channel, message FROM events WHERE id > ? ORDER BY id LIMIT 500",
+                (self._last_id,),
+            ).fetchall()
+
+    async def connect(self) -> None:
+        conn = await asyncio.to_thread(self._open)
+        self._pending.clear()
+        self._conn = conn
+
+    async def disconnect(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await asyncio.to_thread(self._close, conn)
+
+    async def subscribe(self, channel: str) -> None:
+        self._subscribed.add(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self._subscribed.discard(channel)
+
+    async def publish(self, channel: str, message: Any) -> None:
+        await asyncio.to_thread(self._insert, channel, message)
+
+    async def next_published(self) -> Event:
+        while True:
+            while self._pending:
+                event = self._pending.popleft()
+                if event.channel in self._subscribed:
+                    return event
+            rows = await asyncio.to_thread(self._fetch)
+            if not rows:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            self._last_id = rows[-1][0]
+            self._pending.extend(
+                Event(channel=channel, message=message) for _, channel, message in rows
+            )
+
+
+# Backends by URL scheme; the broadcaster ones are imported on first use
+BACKENDS: Dict[str, Callable[[str], BroadcastBackend]] = {"sqlite": SQLiteBackend}
+_BROADCASTER_BACKENDS = {
+    "memory": "broadcaster._backends.memory.MemoryBackend",
+    "redis": "broadcaster._backends.redis.RedisBackend",
+    "rediss": "broadcaster._backends.redis.RedisBackend",
+    "redis-stream": "broadcaster._backends.redis.RedisStreamBackend",
+    "postgres": "broadcaster._backends.postgres.PostgresBackend",
+    "postgresql": "broadcaster._backends.postgres.PostgresBackend",
+    "kafka": "broadcaster._backends.kafka.KafkaBackend",
+}
+
+
+def register_backend(scheme: str, factory: Callable[[str], BroadcastBackend]) -> None:
+    """Make ``factory(url)`` the backend for ``scheme://`` URLs."""
+    BACKENDS[scheme] = factory
+
+
+def broadcast_url() -> str:
+    """``GQL_BROADCAST_URL``, or a default that reaches every local worker."""
+    url = env("GQL_BROADCAST_URL")
+    if url:
+        return url
+    workers = str(env("UVICORN_WORKERS"))
+    return "sqlite://" if workers.isnumeric() and int(workers) > 1 else "memory://"
+
+
+def create_backend(url: str) -> BroadcastBackend:
+    scheme = urlparse(url).scheme
+    if scheme in BACKENDS:
+        return BACKENDS[scheme](url)
+    if scheme in _BROADCASTER_BACKENDS:
+        module_name, class_name = _BROADCASTER_BACKENDS[scheme].rsplit(".", 1)
+        return getattr(importlib.import_module(module_name), class_name)(url)
+    raise ValueError(f"Unsupported broadcast backend: {scheme}")
+
+
+class Subscription:
+    """
+    One subscriber's queue of decoded messages and its delivery measurements.
+
+    Latency runs from publication to the subscriber taking the message. When
+    the backlog reaches ``max_backlog`` the oldest message is dropped.
+    """
+
+    def __init__(self, channel: str, max_backlog: int):
+        self.channel = channel
+        self.max_backlog = max_backlog
+        self.delivered = 0
+        self.dropped = 0
+        self.max_backlog_seen = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._ready = asyncio.Event()
+
+    @property
+    def backlog(self) -> int:
+        return len(self._queue)
+
+    def put(self, message: Dict[str, Any]) -> None:
+        if len(self._queue) >= self.max_backlog:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(message)
+        self.max_backlog_seen = max(self.max_backlog_seen, len(self._queue))
+        self._ready.set()
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            while not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+            message = self._queue.popleft()
+            latency = max(time.time() - message.get("published_at", time.time()), 0.0)
+            self.delivered += 1
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self._total_latency += latency
+            yield message
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channel": self.channel,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "backlog": self.backlog,
+            "max_backlog": self.max_backlog_seen,
+            "last_latency_ms": round(self.last_latency * 1000, 3),
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+            "mean_latency_ms": (
+                round(self._total_latency / self.delivered * 1000, 3)
+                if self.delivered
+                else 0.0
+            ),
+        }
+
+
+class EventBus:
+    """
+    Publish JSON events and fan them out to local subscribers.
+
+    Connects lazily on first use in the running event loop, so a bus built
+    before workers fork never shares a connection between them. When the
+    backend fails while listening, the error is logged and the bus
+    reconnects with exponential backoff between ``RECONNECT_MIN_DELAY`` and
+    ``RECONNECT_MAX_DELAY`` seconds; open subscriptions stay attached.
+
+    Args:
+        url: Backend URL; defaults to ``broadcast_url()``
+        backend: Backend instance to use instead of one built from ``url``
+        max_backlog: Per-subscriber queue limit; defaults to
+            ``GQL_SUBSCRIPTION_MAX_BACKLOG``
+    """
+
+    RECONNECT_MIN_DELAY = 0.1
+    RECONNECT_MAX_DELAY = 30.0
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        backend: Optional[BroadcastBackend] = None,
+        max_backlog: Optional[int] = None,
+    ):
+        self.url = url or (None if backend else broadcast_url())
+        self._backend = backend or create_backend(self.url)
+        self.max_backlog = int(
+            max_backlog
+            if max_backlog is not None
+            else env("GQL_SUBSCRIPTION_MAX_BACKLOG")
+        )
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._started: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._started = loop.create_task(self._start())
+        await self._started
+
+    async def _start(self) -> None:
+        try:
+            await self._backend.connect()
+            for channel in self._subscribers:
+                await self._backend.subscribe(channel)
+        except BaseException:
+            self._loop = None
+            raise
+        self._listener = asyncio.create_task(self._listen())
+
+    async def disconnect(self) -> None:
+        if self._loop is None:
+            return
+        self._loop = None
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._backend.disconnect()
+
+    async def _listen(self) -> None:
+        delay = self.RECONNECT_MIN_DELAY
+        while True:
+            try:
+                event = await self._backend.next_published()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Broadcast listener failed, reconnecting in {delay:g}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+                await self._reconnect()
+                continue
+            delay = self.RECONNECT_MIN_DELAY
+            subscribers = self._subscribers.get(event.channel)
+            if not subscribers:
+                continue
+            try:
+                message = json.loads(event.message)
+            except (TypeError, ValueError):
+                logger.warning(f"Dropping undecodable event on {event.channel}")
+                continue
+            for subscription in list(subscribers):
+                subscription.put(message)
+
+    async def _reconnect(self) -> None:
+        """Reopen the backend and restore the channels of open subscriptions."""
+        try:
+            await self._backend.disconnect()
+        except Exception as e:
+            logger.debug(f"Broadcast disconnect before reconnecting failed: {e}")
+        try:
+            await self._backend.connect()
+            for channel in list(self._subscribers):
+                await self._backend.subscribe(channel)
+        except Exception as e:
+            logger.error(f"Broadcast reconnect failed: {e}")
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """Publish ``message`` with its publication time added."""
+        await self.connect()
+        payload = json.dumps({**message, "published_at": time.time()}, default=str)
+        await self._backend.publish(channel, payload)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        await self.connect()
+        subscription = Subscription(channel, self.max_backlog)
+        subscribers = self._subscribers.setdefault(channel, set())
+        if not subscribers:
+            await self._backend.subscribe(channel)
+        subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers.discard(subscription)
+            if not subscribers and self._subscribers.get(channel) is subscribers:
+                del self._subscribers[channel]
+                if self._loop is not None:
+                    await self._backend.unsubscribe(channel)
+            logger.debug(f"Subscription on {channel} closed: {subscription.stats()}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Delivery measurements of every open subscription."""
+        return [
+            subscription.stats()
+            for subscribers in self._subscribers.values()
+            for subscription in subscribers
+        ]
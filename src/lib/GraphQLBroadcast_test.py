@@ -0,0 +1,150 @@
+import asyncio
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from broadcaster import Event
+
+from lib.GraphQLBroadcast import (
+    EventBus,
+    SQLiteBackend,
+    Subscription,
+    broadcast_url,
+    create_backend,
+)
+
+
+async def _next(subscription, timeout=2):
+    return await asyncio.wait_for(subscription.__aiter__().__anext__(), timeout)
+
+
+class TestBackendSelection:
+    """Backends are chosen by URL, defaulting by worker count."""
+
+    def test_default_url_follows_worker_count(self):
+        settings = {"GQL_BROADCAST_URL": "", "UVICORN_WORKERS": "1"}
+        with patch("lib.GraphQLBroadcast.env", side_effect=settings.get):
+            assert broadcast_url() == "memory://"
+            settings["UVICORN_WORKERS"] = "4"
+            assert broadcast_url() == "sqlite://"
+
+    def test_explicit_url_wins(self):
+        settings = {"GQL_BROADCAST_URL": "redis://localhost", "UVICORN_WORKERS": "4"}
+        with patch("lib.GraphQLBroadcast.env", side_effect=settings.get):
+            assert broadcast_url() == "redis://localhost"
+
+    def test_sqlite_url_options(self, tmp_path):
+        backend = create_backend(
+            f"sqlite://{tmp_path}/bus.db?poll_interval=0.01&retention=5"
+        )
+        assert isinstance(backend, SQLiteBackend)
+        assert backend.path == f"{tmp_path}/bus.db"
+        assert backend.poll_interval == 0.01
+        assert backend.retention == 5
+
+    def test_unknown_scheme_rejected(self):
+        with pytest.raises(ValueError):
+            create_backend("carrier-pigeon://")
+
+
+class TestSubscription:
+    """Per-subscriber queues are bounded and measured."""
+
+    def test_backlog_drops_oldest(self):
+        subscription = Subscription("x_created", max_backlog=2)
+        for n in range(3):
+            subscription.put({"n": n})
+        stats = subscription.stats()
+        assert stats["backlog"] == 2
+        assert stats["dropped"] == 1
+        assert stats["max_backlog"] == 2
+        assert [m["n"] for m in subscription._queue] == [1, 2]
+
+
+@pytest.mark.asyncio
+class TestEventBus:
+    """Events reach subscribers on the channel they were published to."""
+
+    async def test_sqlite_bus_delivers_between_instances(self, tmp_path):
+        url = f"sqlite://{tmp_path}/bus.db?poll_interval=0.01"
+        publisher, subscriber = EventBus(url), EventBus(url)
+        try:
+            async with subscriber.subscribe("itemmanager_updated") as subscription:
+                await publisher.publish("itemmanager_created", {"id": "a"})
+                await publisher.publish("itemmanager_updated", {"id": "b"})
+                message = await _next(subscription)
+                assert message["id"] == "b"
+                assert "published_at" in message
+                stats = subscriber.stats()
+                assert len(stats) == 1
+                assert stats[0]["delivered"] == 1
+                assert stats[0]["channel"] == "itemmanager_updated"
+            assert subscriber.stats() == []
+        finally:
+            await publisher.disconnect()
+            await subscriber.disconnect()
+
+    async def test_each_subscriber_gets_every_event(self, tmp_path):
+        bus = EventBus(f"sqlite://{tmp_path}/bus.db?poll_interval=0.01")
+        try:
+            async with bus.subscribe("c") as first, bus.subscribe("c") as second:
+                await bus.publish("c", {"id": "a"})
+                assert (await _next(first))["id"] == "a"
+                assert (await _next(second))["id"] == "a"
+        finally:
+            await bus.disconnect()
+
+    async def test_listener_reconnects_after_backend_failure(self):
+        class FlakyBackend:
+            def __init__(self):
+                self.connects = 0
+                self.subscribed = []
+                self.failed = False
+
+            async def connect(self):
+                self.connects += 1
+
+            async def disconnect(self):
+                pass
+
+            async def subscribe(self, channel):
+                self.subscribed.append(channel)
+
+            async def unsubscribe(self, channel):
+                pass
+
+            async def next_published(self):
+                if not self.failed:
+                    self.failed = True
+                    raise sqlite3.OperationalError("database is locked")
+                await asyncio.sleep(0.01)
+                return Event(channel="c", message='{"id": "a"}')
+
+        backend = FlakyBackend()
+        bus = EventBus(backend=backend)
+        bus.RECONNECT_MIN_DELAY = 0.01
+        try:
+            async with bus.subscribe("c") as subscription:
+                assert (await _next(subscription))["id"] == "a"
+            assert backend.connects == 2
+            assert backend.subscribed == ["c", "c"]
+        finally:
+            await bus.disconnect()
+
+    async def test_sqlite_io_runs_off_the_event_loop(self, tmp_path):
+        bus = EventBus(f"sqlite://{tmp_path}/bus.db?poll_interval=0.01")
+        threads = set()
+        to_thread = asyncio.to_thread
+
+        async def record(func, *args):
+            threads.add(func.__name__)
+            return await to_thread(func, *args)
+
+        try:
+            with patch("lib.GraphQLBroadcast.asyncio.to_thread", side_effect=record):
+                async with bus.subscribe("c") as subscription:
+                    await bus.publish("c", {"id": "a"})
+                    assert (await _next(subscription))["id"] == "a"
+            assert {"_open", "_insert", "_fetch"} <= threads
+        finally:
+            await bus.disconnect()
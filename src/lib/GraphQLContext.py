@@ -0,0 +1,80 @@
+"""
+GraphQLContext.py - Per-request state shared by GraphQL resolvers.
+
+A GraphQL operation touching several types used to build a manager per
+resolver, each loading the requesting user again, and every database call
+opened its own session. ``GraphQLRequestContext`` authenticates once per
+request and keeps one manager per manager class, all sharing the first
+manager's requester. ``RequestScope`` opens one database session per query
+or mutation and shares it with every ``with_session`` call made while it
+executes.
+"""
+
+from typing import Any, Dict, Optional, Type
+
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from lib.RequestContext import reset_request_session, set_request_session
+
+CONTEXT_KEY = "request_context"
+
+
+class GraphQLRequestContext:
+    """
+    Requester and manager pool of one GraphQL request.
+
+    Args:
+        model_registry: Registry the managers are bound to
+        requester_id: Authenticated requester, or None if authentication failed
+    """
+
+    def __init__(self, model_registry: Any, requester_id: Optional[str]):
+        self.model_registry = model_registry
+        self.requester_id = requester_id
+        self.requester: Optional[Any] = None
+        self._managers: Dict[type, Any] = {}
+
+    def manager(self, manager_class: Type) -> Any:
+        """The request's instance of ``manager_class``, built on first use."""
+        manager = self._managers.get(manager_class)
+        if manager is None:
+            kwargs = {"requester": self.requester} if self.requester else {}
+            manager = manager_class(
+                requester_id=self.requester_id,
+                model_registry=self.model_registry,
+                **kwargs,
+            )
+            if self.requester is None:
+                self.requester = getattr(manager, "requester", None)
+            self._managers[manager_class] = manager
+        return manager
+
+
+class RequestScope(SchemaExtension):
+    """
+    Share one database session between the resolvers of a query or mutation.
+
+    Subscriptions are left alone: they live as long as the connection and
+    each of their database checks opens and closes its own session.
+
+    Args:
+        model_registry: Registry whose database the session is opened on
+    """
+
+    def __init__(self, model_registry: Any):
+        super().__init__()
+        self.model_registry = model_registry
+
+    def on_execute(self):
+        if self.execution_context.operation_type == OperationType.SUBSCRIPTION:
+            yield
+            return
+
+        session = self.model_registry.DB.session()
+        token = set_request_session(session)
+        try:
+            yield
+        finally:
+            reset_request_session(token)
+            session.close()
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import strawberry
+
+from lib.GraphQLContext import GraphQLRequestContext, RequestScope
+from lib.RequestContext import get_request_session
+
+
+class FakeManager:
+    lookups = 0
+
+    def __init__(self, requester_id, model_registry, requester=None):
+        if requester is None:
+            FakeManager.lookups += 1
+            requester = SimpleNamespace(id=requester_id)
+        self.requester = requester
+
+
+class OtherManager(FakeManager):
+    pass
+
+
+class TestGraphQLRequestContext:
+    """Managers are pooled per request and share one requester lookup."""
+
+    def test_one_manager_per_class(self):
+        FakeManager.lookups = 0
+        request = GraphQLRequestContext(MagicMock(), "u1")
+
+        first = request.manager(FakeManager)
+        assert request.manager(FakeManager) is first
+        other = request.manager(OtherManager)
+
+        assert other is not first
+        assert other.requester is first.requester is request.requester
+        assert FakeManager.lookups == 1
+
+
+class TestRequestScope:
+    """Queries and mutations share one session for their whole execution."""
+
+    def _schema(self, registry, seen):
+        @strawberry.type
+        class Query:
+            @strawberry.field
+            def first(self) -> bool:
+                seen.append(get_request_session())
+                return True
+
+            @strawberry.field
+            def second(self) -> bool:
+                seen.append(get_request_session())
+                return True
+
+        return strawberry.Schema(
+            query=Query, extensions=[lambda: RequestScope(registry)]
+        )
+
+    def test_resolvers_share_one_session(self):
+        session = MagicMock()
+        registry = MagicMock()
+        registry.DB.session.return_value = session
+        seen = []
+
+        result = self._schema(registry, seen).execute_sync("{ first second }")
+
+        assert result.errors is None
+        assert seen == [session, session]
+        registry.DB.session.assert_called_once()
+        session.close.assert_called_once()
+        assert get_request_session() is None
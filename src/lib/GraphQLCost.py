@@ -0,0 +1,261 @@
+"""
+GraphQLCost.py - Static cost analysis for GraphQL operations.
+
+Every operation is measured before it is validated or executed: its depth
+(nesting of object fields), its alias count and its cost, an estimate of the
+number of objects it can resolve. List fields multiply the cost of their
+selection by their ``limit`` argument, so a nested query that would fan out
+into thousands of resolver calls is rejected up front instead of tying up
+the connection pool.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLInt,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    is_composite_type,
+    is_list_type,
+    value_from_ast,
+)
+from graphql.language import DocumentNode
+from strawberry.extensions import SchemaExtension
+
+from lib.Environment import env
+
+# Multiplier for list fields without a usable ``limit``; matches the default
+# page size of the generated list resolvers
+DEFAULT_LIST_SIZE = 100
+
+
+def list_limit(limit: Any) -> int:
+    """
+    Number of items a list field resolves when queried with ``limit``.
+
+    A missing or non-positive limit runs as ``DEFAULT_LIST_SIZE``. The cost
+    analysis and the generated list resolvers share this rule, so an
+    operation is costed by what it actually resolves.
+    """
+    return limit if isinstance(limit, int) and limit > 0 else DEFAULT_LIST_SIZE
+
+
+@dataclass
+class QueryCost:
+    """Result of analysing one operation."""
+
+    cost: int = 0
+    depth: int = 0
+    aliases: int = 0
+
+
+def analyze_query(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Optional[QueryCost]:
+    """
+    Measure the operation of ``document`` that would be executed.
+
+    An object field costs one, times the ``limit`` of the list it returns
+    (``DEFAULT_LIST_SIZE`` without one), plus the cost of its selection for
+    every item. Leaf fields are free. Introspection fields and fields unknown
+    to the schema are skipped; the latter fail validation anyway.
+
+    Returns:
+        The measurement, or None if the document has no matching operation
+    """
+    operation = None
+    fragments: Dict[str, FragmentDefinitionNode] = {}
+    for definition in document.definitions:
+        if isinstance(definition, FragmentDefinitionNode):
+            fragments[definition.name.value] = definition
+        elif isinstance(definition, OperationDefinitionNode):
+            if operation_name is None or (
+                definition.name and definition.name.value == operation_name
+            ):
+                operation = operation or definition
+    if operation is None:
+        return None
+
+    root_type = schema.get_root_type(operation.operation)
+    if root_type is None:
+        return None
+
+    result = QueryCost()
+    result.cost = _selection_cost(
+        schema,
+        root_type,
+        operation.selection_set,
+        fragments,
+        variables or {},
+        depth=1,
+        result=result,
+        visiting=set(),
+    )
+    return result
+
+
+def _fields(
+    schema: GraphQLSchema,
+    parent_type: Any,
+    selection_set: Optional[SelectionSetNode],
+    fragments: Dict[str, FragmentDefinitionNode],
+    visiting: Set[str],
+) -> Iterator[tuple]:
+    """Yield ``(parent_type, field_node)`` pairs with fragments expanded."""
+    for selection in selection_set.selections if selection_set else ():
+        if isinstance(selection, FieldNode):
+            yield parent_type, selection
+            continue
+        if isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = fragments.get(name)
+            if fragment is None or name in visiting:
+                continue
+            visiting.add(name)
+            condition = fragment.type_condition
+            yield from _fields(
+                schema,
+                schema.get_type(condition.name.value) or parent_type,
+                fragment.selection_set,
+                fragments,
+                visiting,
+            )
+            visiting.discard(name)
+        elif isinstance(selection, InlineFragmentNode):
+            condition = selection.type_condition
+            fragment_type = schema.get_type(condition.name.value) if condition else None
+            yield from _fields(
+                schema,
+                fragment_type or parent_type,
+                selection.selection_set,
+                fragments,
+                visiting,
+            )
+
+
+def _list_size(field_node: FieldNode, field_def: Any, variables: Dict[str, Any]) -> int:
+    """The ``limit`` a list field is queried with, or its default."""
+    limit = None
+    for argument in field_node.arguments or ():
+        if argument.name.value == "limit":
+            limit = value_from_ast(argument.value, GraphQLInt, variables)
+    if limit is None and "limit" in field_def.args:
+        default = field_def.args["limit"].default_value
+        limit = default if isinstance(default, int) else None
+    return list_limit(limit)
+
+
+def _selection_cost(
+    schema: GraphQLSchema,
+    parent_type: Any,
+    selection_set: Optional[SelectionSetNode],
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Dict[str, Any],
+    depth: int,
+    result: QueryCost,
+    visiting: Set[str],
+) -> int:
+    cost = 0
+    for field_parent, field_node in _fields(
+        schema, parent_type, selection_set, fragments, visiting
+    ):
+        if field_node.alias:
+            result.aliases += 1
+        name = field_node.name.value
+        field_def = getattr(field_parent, "fields", {}).get(name)
+        if name.startswith("__") or field_def is None:
+            continue
+
+        return_type = get_nullable_type(field_def.type)
+        if not is_composite_type(get_named_type(return_type)):
+            continue
+
+        result.depth = max(result.depth, depth)
+        multiplier = (
+            _list_size(field_node, field_def, variables)
+            if is_list_type(return_type)
+            else 1
+        )
+        cost += multiplier * (
+            1
+            + _selection_cost(
+                schema,
+                get_named_type(return_type),
+                field_node.selection_set,
+                fragments,
+                variables,
+                depth + 1,
+                result,
+                visiting,
+            )
+        )
+    return cost
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Reject operations over ``GQL_DEPTH``, ``GQL_MAX_COST`` or
+    ``GQL_MAX_ALIASES`` and report the cost under ``extensions.cost``.
+
+    The analysis runs before validation, so a rejected operation is neither
+    validated nor executed.
+    """
+
+    cost: Optional[QueryCost] = None
+
+    def on_validate(self):
+        context = self.execution_context
+        document = context.graphql_document
+        if document is not None:
+            self.cost = analyze_query(
+                context.schema._schema,
+                document,
+                context.operation_name,
+                context.variables,
+            )
+
+        if self.cost is not None:
+            errors = []
+            for measured, setting, label in (
+                (self.cost.depth, "GQL_DEPTH", "depth"),
+                (self.cost.cost, "GQL_MAX_COST", "cost"),
+                (self.cost.aliases, "GQL_MAX_ALIASES", "aliases"),
+            ):
+                maximum = int(env(setting))
+                if measured > maximum:
+                    errors.append(
+                        GraphQLError(
+                            f"Query {label} {measured} exceeds the maximum of {maximum}",
+                            extensions={"code": "QUERY_TOO_COMPLEX"},
+                        )
+                    )
+            if errors:
+                context.pre_execution_errors = [
+                    *(context.pre_execution_errors or []),
+                    *errors,
+                ]
+        yield
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.cost is None:
+            return {}
+        return {
+            "cost": {
+                "requested": self.cost.cost,
+                "maximum": int(env("GQL_MAX_COST")),
+                "depth": self.cost.depth,
+                "aliases": self.cost.aliases,
+            }
+        }
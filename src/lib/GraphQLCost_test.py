@@ -0,0 +1,117 @@
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+import strawberry
+from graphql import parse
+
+from lib.GraphQLCost import (
+    DEFAULT_LIST_SIZE,
+    QueryCostLimiter,
+    analyze_query,
+    list_limit,
+)
+
+
+@strawberry.type
+class Team:
+    name: str
+
+    @strawberry.field
+    def members(self, limit: Optional[int] = 100) -> List["Member"]:
+        return [Member(name=f"m{i}") for i in range(min(limit or 0, 2))]
+
+
+@strawberry.type
+class Member:
+    name: str
+
+    @strawberry.field
+    def team(self) -> Team:
+        return Team(name="t")
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def teams(self, limit: Optional[int] = 100) -> List[Team]:
+        return [Team(name="t")]
+
+    @strawberry.field
+    def team(self) -> Team:
+        return Team(name="t")
+
+
+schema = strawberry.Schema(query=Query, extensions=[QueryCostLimiter])
+
+
+def _cost(query, variables=None):
+    return analyze_query(schema._schema, parse(query), None, variables)
+
+
+class TestAnalyzeQuery:
+    """Static measurement of depth, cost and aliases."""
+
+    def test_list_limits_multiply_nested_cost(self):
+        measured = _cost("{ teams(limit: 10) { name members(limit: 5) { name } } }")
+        # 10 teams, each with 5 members
+        assert measured.cost == 10 * (1 + 5)
+        assert measured.depth == 2
+
+    def test_defaults_and_variables_set_list_sizes(self):
+        assert _cost("{ teams { name } }").cost == 100
+        assert _cost("query($n: Int) { teams(limit: $n) { name } }", {"n": 3}).cost == 3
+
+    def test_non_positive_limits_cost_what_they_resolve(self):
+        # Resolvers run a missing, zero or negative limit as the default
+        # page size, so the cost must not count it as empty
+        assert _cost("{ teams(limit: 0) { members(limit: 0) { name } } }").cost == (
+            DEFAULT_LIST_SIZE * (1 + DEFAULT_LIST_SIZE)
+        )
+        assert _cost("{ teams(limit: -5) { name } }").cost == DEFAULT_LIST_SIZE
+        assert [list_limit(n) for n in (None, 0, -1, 7)] == [
+            DEFAULT_LIST_SIZE,
+            DEFAULT_LIST_SIZE,
+            DEFAULT_LIST_SIZE,
+            7,
+        ]
+
+    def test_fragments_aliases_and_introspection(self):
+        measured = _cost("""
+            { a: team { ...T } b: team { ...T } __schema { types { name } } }
+            fragment T on Team { members(limit: 2) { team { name } } }
+            """)
+        assert measured.aliases == 2
+        assert measured.cost == 2 * (1 + 2 * (1 + 1))
+        assert measured.depth == 3
+
+
+class TestQueryCostLimiter:
+    """Limits are enforced before execution and the cost is reported."""
+
+    def test_cost_reported_in_extensions(self):
+        result = schema.execute_sync("{ teams(limit: 2) { name } }")
+        assert result.errors is None
+        assert result.extensions["cost"]["requested"] == 2
+        assert result.extensions["cost"]["depth"] == 1
+
+    @pytest.mark.parametrize(
+        "label, query",
+        [
+            (
+                "depth",
+                "{ team { members(limit: 1) { team { members(limit: 1) { name } } } } }",
+            ),
+            ("cost", "{ teams { members { team { name } } } }"),
+            ("aliases", "{ a: team { name } b: team { name } }"),
+        ],
+    )
+    def test_limits_reject_before_execution(self, label, query):
+        limits = {"GQL_DEPTH": "3", "GQL_MAX_COST": "1000", "GQL_MAX_ALIASES": "1"}
+        with patch("lib.GraphQLCost.env", side_effect=limits.get):
+            result = schema.execute_sync(query)
+
+        assert result.data is None
+        assert len(result.errors) == 1
+        assert result.errors[0].message.startswith(f"Query {label} ")
+        assert result.errors[0].extensions["code"] == "QUERY_TOO_COMPLEX"
@@ -0,0 +1,208 @@
+"""
+GraphQLDocuments.py - Persisted queries and a parse/validation cache.
+
+Documents are addressed by the SHA-256 of their query text. Each worker
+keeps an LRU of parsed documents together with the result of validating
+them against the schema, so a repeated operation skips both steps. Clients
+may send only the hash of a document the worker has seen before (automatic
+persisted queries); an optional allow-list restricts execution to a fixed
+set of documents.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from graphql import GraphQLError
+from graphql.language import DocumentNode
+from strawberry.extensions import SchemaExtension
+
+from lib.Environment import env
+from lib.Logging import logger
+
+
+def query_hash(query: str) -> str:
+    """Hex SHA-256 of a query text, as sent in ``persistedQuery.sha256Hash``."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def load_allowlist(path: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Read an allow-list manifest into ``{hash: query}``.
+
+    Accepts an Apollo persisted query manifest (``{"operations": [{"id",
+    "body"}]}``) or a plain ``{hash: query}`` object. Hashes are recomputed
+    from the query text, and entries whose declared hash differs are skipped.
+
+    Returns:
+        The allowed documents, or None when no path is configured
+    """
+    if not path:
+        return None
+    with open(path, "r", encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    if isinstance(manifest, dict) and isinstance(manifest.get("operations"), list):
+        declared = [(op.get("id"), op.get("body")) for op in manifest["operations"]]
+    else:
+        declared = list(manifest.items())
+
+    allowed: Dict[str, str] = {}
+    for declared_hash, query in declared:
+        if not isinstance(query, str):
+            continue
+        digest = query_hash(query)
+        if declared_hash and declared_hash != digest:
+            logger.warning(
+                f"Skipping allow-listed GraphQL document {declared_hash}: "
+                f"its hash is {digest}"
+            )
+            continue
+        allowed[digest] = query
+    logger.debug(f"Loaded {len(allowed)} allow-listed GraphQL documents from {path}")
+    return allowed
+
+
+@dataclass
+class CachedDocument:
+    """A query text with its parsed document and validation errors, once known."""
+
+    query: str
+    document: Optional[DocumentNode] = None
+    errors: Optional[List[GraphQLError]] = None
+
+
+class DocumentCache:
+    """
+    Per-worker LRU of documents keyed by query hash.
+
+    Args:
+        max_entries: Documents kept; defaults to ``GQL_DOCUMENT_CACHE_SIZE``
+        allowlist: ``{hash: query}`` of the only documents that may run, or
+            None to accept any document
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        allowlist: Optional[Dict[str, str]] = None,
+    ):
+        self.max_entries = int(
+            max_entries if max_entries is not None else env("GQL_DOCUMENT_CACHE_SIZE")
+        )
+        self.allowlist = allowlist
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CachedDocument]" = OrderedDict()
+
+    def allows(self, digest: str) -> bool:
+        return self.allowlist is None or digest in self.allowlist
+
+    def get(self, digest: str) -> Optional[CachedDocument]:
+        """Return the document for ``digest``; allow-listed ones are always found."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                return entry
+        if self.allowlist is not None and digest in self.allowlist:
+            return self.put(digest, self.allowlist[digest])
+        return None
+
+    def put(self, digest: str, query: str) -> CachedDocument:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                entry = self._entries[digest] = CachedDocument(query)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _persisted_query_error(message: str, code: str) -> GraphQLError:
+    return GraphQLError(message, extensions={"code": code})
+
+
+class PersistedQueries(SchemaExtension):
+    """
+    Resolve persisted query hashes and reuse cached parse and validation results.
+
+    Requests follow the automatic persisted queries protocol: a
+    ``persistedQuery`` operation extension carries the ``sha256Hash`` of the
+    document. A hash alone runs the cached document or answers
+    ``PersistedQueryNotFound``, after which the client resends the hash with
+    the query text. Validation results are cached per document, which assumes
+    the schema's validation rules do not vary between requests.
+
+    Args:
+        cache: Documents of the schema this extension is installed on
+    """
+
+    def __init__(self, cache: DocumentCache):
+        super().__init__()
+        self.cache = cache
+        self.entry: Optional[CachedDocument] = None
+
+    def on_operation(self):
+        context = self.execution_context
+        persisted = (context.operation_extensions or {}).get("persistedQuery")
+        requested_hash = (
+            persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        )
+
+        if context.query:
+            digest = query_hash(context.query)
+            if requested_hash and requested_hash != digest:
+                raise _persisted_query_error(
+                    "provided sha does not match query",
+                    "PERSISTED_QUERY_HASH_MISMATCH",
+                )
+            if not self.cache.allows(digest):
+                raise _persisted_query_error(
+                    "Operation is not in the allow-list",
+                    "PERSISTED_QUERY_NOT_ALLOWED",
+                )
+            self.entry = self.cache.get(digest) or self.cache.put(digest, context.query)
+        elif requested_hash:
+            self.entry = self.cache.get(requested_hash)
+            if self.entry is None:
+                raise _persisted_query_error(
+                    "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+                )
+            context.query = self.entry.query
+        yield
+
+    def on_parse(self):
+        context = self.execution_context
+        if self.entry is not None and self.entry.document is not None:
+            context.graphql_document = self.entry.document
+        yield
+        if self.entry is not None and self.entry.document is None:
+            self.entry.document = context.graphql_document
+
+    def on_validate(self):
+        # Imported here like strawberry's own ValidationCache, to avoid a
+        # circular import with strawberry.schema
+        from strawberry.schema.schema import validate_document
+
+        context = self.execution_context
+        entry = self.entry
+        if (
+            entry is not None
+            and context.graphql_document is entry.document
+            and context.pre_execution_errors is None
+        ):
+            if entry.errors is None:
+                entry.errors = validate_document(
+                    context.schema._schema,
+                    context.graphql_document,
+                    context.validation_rules,
+                )
+            context.pre_execution_errors = list(entry.errors)
+        yield
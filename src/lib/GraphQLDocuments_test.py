@@ -0,0 +1,124 @@
+import json
+from unittest.mock import patch
+
+import strawberry
+
+from lib.GraphQLCost import QueryCostLimiter
+from lib.GraphQLDocuments import (
+    DocumentCache,
+    PersistedQueries,
+    load_allowlist,
+    query_hash,
+)
+
+QUERY = "{ hello }"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+def _schema(cache):
+    return strawberry.Schema(
+        query=Query,
+        extensions=[lambda: PersistedQueries(cache), QueryCostLimiter],
+    )
+
+
+def _persisted(digest):
+    return {"persistedQuery": {"version": 1, "sha256Hash": digest}}
+
+
+class TestDocumentCache:
+    """Parsed and validated documents are reused per worker."""
+
+    def test_repeat_operation_skips_parse_and_validation(self):
+        cache = DocumentCache(max_entries=10)
+        schema = _schema(cache)
+        assert schema.execute_sync(QUERY).data == {"hello": "world"}
+
+        entry = cache.get(query_hash(QUERY))
+        assert entry.document is not None and entry.errors == []
+
+        with patch("strawberry.schema.schema.parse") as parse, patch(
+            "strawberry.schema.schema.validate"
+        ) as validate:
+            result = schema.execute_sync(QUERY)
+        assert result.data == {"hello": "world"}
+        parse.assert_not_called()
+        validate.assert_not_called()
+
+    def test_validation_errors_are_cached_too(self):
+        cache = DocumentCache(max_entries=10)
+        schema = _schema(cache)
+        first = schema.execute_sync("{ missing }")
+        second = schema.execute_sync("{ missing }")
+        assert first.errors and second.errors
+        assert second.errors[0].message == first.errors[0].message
+
+    def test_least_recently_used_documents_are_evicted(self):
+        cache = DocumentCache(max_entries=2)
+        for query in ("{ a }", "{ b }"):
+            cache.put(query_hash(query), query)
+        cache.get(query_hash("{ a }"))
+        cache.put(query_hash("{ c }"), "{ c }")
+        assert cache.get(query_hash("{ b }")) is None
+        assert cache.get(query_hash("{ a }")) is not None
+        assert len(cache) == 2
+
+
+class TestPersistedQueries:
+    """Automatic persisted queries and allow-list mode."""
+
+    def test_hash_only_request_registers_then_runs(self):
+        schema = _schema(DocumentCache(max_entries=10))
+        digest = query_hash(QUERY)
+
+        missing = schema.execute_sync(None, operation_extensions=_persisted(digest))
+        assert missing.errors[0].message == "PersistedQueryNotFound"
+        assert missing.errors[0].extensions["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+        registered = schema.execute_sync(QUERY, operation_extensions=_persisted(digest))
+        assert registered.data == {"hello": "world"}
+
+        by_hash = schema.execute_sync(None, operation_extensions=_persisted(digest))
+        assert by_hash.errors is None
+        assert by_hash.data == {"hello": "world"}
+
+    def test_hash_must_match_query(self):
+        schema = _schema(DocumentCache(max_entries=10))
+        result = schema.execute_sync(QUERY, operation_extensions=_persisted("0" * 64))
+        assert result.errors[0].extensions["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+
+    def test_allowlist_only_runs_listed_documents(self, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(
+            json.dumps(
+                {
+                    "format": "apollo-persisted-query-manifest",
+                    "version": 1,
+                    "operations": [
+                        {"id": query_hash(QUERY), "body": QUERY},
+                        {"id": "forged", "body": "{ __typename }"},
+                    ],
+                }
+            )
+        )
+        allowlist = load_allowlist(str(manifest))
+        assert allowlist == {query_hash(QUERY): QUERY}
+        schema = _schema(DocumentCache(max_entries=10, allowlist=allowlist))
+
+        by_hash = schema.execute_sync(
+            None, operation_extensions=_persisted(query_hash(QUERY))
+        )
+        assert by_hash.data == {"hello": "world"}
+
+        rejected = schema.execute_sync("{ __typename }")
+        assert rejected.data is None
+        assert rejected.errors[0].extensions["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+    def test_no_allowlist_configured(self):
+        assert load_allowlist("") is None
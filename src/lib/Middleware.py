@@ -0,0 +1,199 @@
+"""
+Middleware.py - Pure ASGI middleware for the application stack.
+
+Each class wraps the downstream ASGI app directly instead of going through
+``BaseHTTPMiddleware``, so no extra task or queue sits between the server
+and the route, and request and response bodies are forwarded chunk by
+chunk without being buffered.
+"""
+
+import json
+import random
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, MutableMapping, Optional
+
+from lib.Environment import env
+from lib.Logging import logger
+from lib.RequestContext import (
+    clear_request_context,
+    set_request_claims,
+    set_request_user,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    """Return the first value of header ``name`` (lowercase bytes)."""
+    for key, value in scope.get("headers") or []:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def set_context_from_authorization(auth_header: Optional[str]) -> None:
+    """
+    Populate the request context from a Bearer token.
+
+    The user entry is read without verifying the signature (verification
+    happens in the auth dependencies); membership claims are only trusted
+    from a verified token.
+    """
+    if not auth_header or not auth_header.startswith("Bearer "):
+        return
+    try:
+        import jwt
+
+        token = auth_header.replace("Bearer ", "").strip()
+        payload = jwt.decode(token, options={"verify_signature": False})
+        set_request_user(
+            {
+                "user_id": payload.get("sub"),
+                "email": payload.get("email"),
+                "timezone": payload.get("timezone", "UTC"),
+            }
+        )
+        if "authz" in payload:
+            verified = jwt.decode(
+                token,
+                env("JWT_SECRET"),
+                algorithms=["HS256"],
+                leeway=timedelta(minutes=5),
+            )
+            set_request_claims({**verified["authz"], "sub": verified["sub"]})
+    except Exception:
+        # If JWT decode fails, just continue without setting context
+        pass
+
+
+class RequestContextMiddleware:
+    """Set the request context from the Authorization header and clear it after."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        clear_request_context()
+        set_context_from_authorization(_header(scope, b"authorization"))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            clear_request_context()
+
+
+def _is_json_error(exc: Exception) -> bool:
+    if isinstance(exc, json.JSONDecodeError):
+        return True
+    message = str(exc).lower()
+    return "json" in message and ("decode" in message or "syntax" in message)
+
+
+class JSONErrorMiddleware:
+    """Answer 400 for JSON parsing errors that escape the exception handlers."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if started or not _is_json_error(exc):
+                raise
+            body = b'{"detail":"Invalid JSON syntax in request body"}'
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+
+class BodyLoggingMiddleware:
+    """
+    Debug-log a sample of response bodies without holding them back.
+
+    Chunks are forwarded as soon as they are sent; only the first
+    ``max_bytes`` of a sampled response are copied for the log line, which
+    is written when the last chunk goes out.
+
+    Args:
+        app: Downstream ASGI app
+        sample_rate: Fraction of requests to log, defaults to
+            ``DEBUG_BODY_SAMPLE_RATE``
+        max_bytes: Bytes of each body to log, defaults to
+            ``DEBUG_BODY_MAX_BYTES``
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.app = app
+        self.sample_rate = float(
+            sample_rate if sample_rate is not None else env("DEBUG_BODY_SAMPLE_RATE")
+        )
+        self.max_bytes = int(
+            max_bytes if max_bytes is not None else env("DEBUG_BODY_MAX_BYTES")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or self.sample_rate <= 0
+            or random.random() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        state: Dict[str, Any] = {"status": None, "captured": bytearray(), "size": 0}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                state["size"] += len(chunk)
+                room = self.max_bytes - len(state["captured"])
+                if room > 0:
+                    state["captured"] += chunk[:room]
+                if not message.get("more_body", False):
+                    self._log(scope, state)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _log(self, scope: Scope, state: Dict[str, Any]) -> None:
+        body = bytes(state["captured"]).decode("utf-8", errors="replace")
+        truncated = state["size"] - len(state["captured"])
+        suffix = f" ... ({truncated} more bytes)" if truncated > 0 else ""
+        logger.debug(
+            f"{scope.get('method')} {scope.get('path')} -> {state['status']} "
+            f"({state['size']} bytes): {body}{suffix}"
+        )
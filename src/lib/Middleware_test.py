@@ -0,0 +1,95 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from lib.Middleware import (
+    BodyLoggingMiddleware,
+    JSONErrorMiddleware,
+    RequestContextMiddleware,
+)
+from lib.RequestContext import get_request_user
+
+
+def _token(payload):
+    import jwt
+
+    return jwt.encode(
+        payload, "middleware-test-secret-0123456789abcdef", algorithm="HS256"
+    )
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get("/whoami")
+    async def whoami():
+        return get_request_user() or {}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for index in range(3):
+                yield f"chunk{index}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.post("/broken")
+    async def broken():
+        json.loads("{not json")
+
+    return app
+
+
+class TestRequestContextMiddleware:
+    def test_sets_and_clears_user(self, app):
+        app.add_middleware(RequestContextMiddleware)
+        client = TestClient(app)
+        token = _token({"sub": "u1", "email": "a@b.c", "timezone": "Europe/Paris"})
+
+        response = client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+        assert response.json() == {
+            "user_id": "u1",
+            "email": "a@b.c",
+            "timezone": "Europe/Paris",
+        }
+        assert get_request_user() is None
+        assert client.get("/whoami").json() == {}
+
+    def test_invalid_token_is_ignored(self, app):
+        app.add_middleware(RequestContextMiddleware)
+        response = TestClient(app).get(
+            "/whoami", headers={"Authorization": "Bearer nope"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {}
+
+
+class TestJSONErrorMiddleware:
+    def test_json_errors_become_400(self, app):
+        app.add_middleware(JSONErrorMiddleware)
+        response = TestClient(app, raise_server_exceptions=False).post("/broken")
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Invalid JSON syntax in request body"}
+
+
+class TestBodyLoggingMiddleware:
+    def test_disabled_by_default(self, app):
+        app.add_middleware(BodyLoggingMiddleware)
+        with patch("lib.Middleware.logger") as logger:
+            TestClient(app).get("/stream")
+        logger.debug.assert_not_called()
+
+    def test_streams_and_logs_capped_body(self, app):
+        app.add_middleware(BodyLoggingMiddleware, sample_rate=1.0, max_bytes=8)
+        with patch("lib.Middleware.logger") as logger:
+            response = TestClient(app).get("/stream")
+        assert response.text == "chunk0\nchunk1\nchunk2\n"
+        logger.debug.assert_called_once()
+        line = logger.debug.call_args[0][0]
+        assert "GET /stream -> 200 (21 bytes): chunk0\nc" in line
+        assert "(13 more bytes)" in line
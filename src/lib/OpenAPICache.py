@@ -0,0 +1,238 @@
+"""
+OpenAPICache.py - Prebuilt OpenAPI document shared through the filesystem.
+
+Generating the schema walks every route and model and runs the example
+generator for each operation, which takes seconds on a full registry. The
+document is built once per fingerprint of the route table and of the source
+of every module it is derived from, written to disk gzipped, and served
+from memory as pre-serialized bytes. Workers that start with an unchanged
+model set load the stored document instead of rebuilding it.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from lib.Environment import env
+from lib.Logging import logger
+
+FILE_PREFIX = "openapi-"
+FILE_SUFFIX = ".json.gz"
+
+
+def openapi_cache_enabled() -> bool:
+    """Whether built documents are persisted to and loaded from disk."""
+    return str(env("OPENAPI_CACHE")).lower() == "true"
+
+
+def registry_fingerprint(app: FastAPI) -> str:
+    """
+    Hash everything the generated document depends on.
+
+    Covers the app metadata, the route table, the FastAPI and Pydantic
+    versions, the bound models and the source of every module defining an
+    endpoint, a response model or a bound model.
+    """
+    import fastapi
+    import pydantic
+
+    digest = hashlib.sha256()
+    for part in (
+        fastapi.__version__,
+        pydantic.VERSION,
+        app.title,
+        app.version,
+        app.openapi_version,
+        app.description or "",
+    ):
+        digest.update(f"{part}\n".encode())
+
+    modules = set()
+    for route in app.routes:
+        methods = ",".join(sorted(getattr(route, "methods", None) or ()))
+        digest.update(
+            f"{type(route).__name__} {getattr(route, 'path', '')} {methods} "
+            f"{getattr(route, 'name', '')}\n".encode()
+        )
+        for source in (
+            getattr(route, "endpoint", None),
+            getattr(route, "response_model", None),
+        ):
+            module = getattr(source, "__module__", None)
+            if module:
+                modules.add(module)
+
+    registry = getattr(app.state, "model_registry", None)
+    for model in getattr(registry, "bound_models", None) or ():
+        digest.update(f"{model.__module__}.{model.__qualname__}\n".encode())
+        modules.add(model.__module__)
+
+    for name in sorted(modules):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path and os.path.isfile(path):
+            digest.update(name.encode())
+            with open(path, "rb") as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()[:32]
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an ``Accept-Encoding`` header allows a gzip body."""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class OpenAPIDocument:
+    """
+    OpenAPI document built once and kept as JSON and gzip bytes.
+
+    Args:
+        app: Application the document describes
+        build: Generates the schema dict; only called on a cache miss
+        directory: Where documents are stored; defaults to
+            ``OPENAPI_CACHE_PATH`` or a directory named after ``APP_NAME`` in
+            the system temp directory. Nothing is stored when
+            ``OPENAPI_CACHE`` is off.
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        build: Callable[[], Dict[str, Any]],
+        directory: Optional[str] = None,
+    ):
+        self.app = app
+        self._build = build
+        self._directory = directory
+        self._lock = threading.Lock()
+        self.schema: Optional[Dict[str, Any]] = None
+        self.body: Optional[bytes] = None
+        self.gzip_body: Optional[bytes] = None
+        self.etag: Optional[str] = None
+
+    @property
+    def directory(self) -> str:
+        if not self._directory:
+            self._directory = env("OPENAPI_CACHE_PATH") or os.path.join(
+                tempfile.gettempdir(), f"{str(env('APP_NAME')).lower()}.openapi"
+            )
+        return self._directory
+
+    def prepare(self) -> Dict[str, Any]:
+        """Load the stored document for the current fingerprint or build it."""
+        with self._lock:
+            if self.schema is not None:
+                return self.schema
+
+            persist = openapi_cache_enabled()
+            path = None
+            gzip_body = None
+            if persist:
+                path = os.path.join(
+                    self.directory,
+                    f"{FILE_PREFIX}{registry_fingerprint(self.app)}{FILE_SUFFIX}",
+                )
+                gzip_body = self._read(path)
+
+            if gzip_body is not None:
+                body = gzip.decompress(gzip_body)
+                schema = json.loads(body)
+                logger.debug(f"Loaded OpenAPI document from {path}")
+            else:
+                schema = self._build()
+                body = json.dumps(
+                    jsonable_encoder(schema),
+                    ensure_ascii=False,
+                    allow_nan=False,
+                    separators=(",", ":"),
+                ).encode("utf-8")
+                gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+                if persist:
+                    self._write(path, gzip_body)
+
+            self.body = body
+            self.gzip_body = gzip_body
+            self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            self.schema = schema
+            return schema
+
+    @staticmethod
+    def _read(path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as stored:
+                return stored.read()
+        except OSError:
+            return None
+
+    def _write(self, path: str, gzip_body: bytes) -> None:
+        # Write to a temp file and rename so readers never see a partial
+        # document, then drop documents stored for older fingerprints
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(gzip_body)
+            os.replace(temp_path, path)
+            for name in os.listdir(self.directory):
+                stale = os.path.join(self.directory, name)
+                if (
+                    name.startswith(FILE_PREFIX)
+                    and name.endswith(FILE_SUFFIX)
+                    and stale != path
+                ):
+                    os.remove(stale)
+        except OSError as e:
+            logger.warning(f"Could not store OpenAPI document in {path}: {e}")
+
+    def response(self, request: Request) -> Response:
+        """Serve the prepared bytes, gzipped when the client accepts it."""
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.etag in (
+            tag.strip() for tag in if_none_match.split(",")
+        ):
+            return Response(status_code=304, headers=headers)
+        if _accepts_gzip(request.headers.get("accept-encoding")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzip_body, media_type="application/json", headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+def install_openapi_route(app: FastAPI, document: OpenAPIDocument) -> None:
+    """Replace the default ``openapi_url`` route with one serving ``document``."""
+    openapi_url = app.openapi_url
+    app.router.routes = [
+        route
+        for route in app.router.routes
+        if getattr(route, "path", None) != openapi_url
+    ]
+
+    async def openapi(request: Request) -> Response:
+        if document.body is None:
+            schema = await run_in_threadpool(app.openapi)
+            if document.body is None:
+                # The build failed and app.openapi fell back to another schema
+                return JSONResponse(schema)
+        return document.response(request)
+
+    app.add_route(openapi_url, openapi, include_in_schema=False)
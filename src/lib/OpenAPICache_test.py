@@ -0,0 +1,116 @@
+import gzip
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from lib.OpenAPICache import (
+    OpenAPIDocument,
+    _accepts_gzip,
+    install_openapi_route,
+    registry_fingerprint,
+)
+
+
+def _app():
+    app = FastAPI(title="Cached", version="1.0.0")
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    return app
+
+
+@pytest.fixture
+def served(tmp_path):
+    app = _app()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return app.__class__.openapi(app)
+
+    document = OpenAPIDocument(app, build, directory=str(tmp_path))
+    install_openapi_route(app, document)
+    app.openapi = document.prepare
+    return app, document, builds
+
+
+class TestOpenAPIDocument:
+    """Fingerprinted on-disk storage and byte serving of the schema."""
+
+    def test_fingerprint_tracks_routes(self):
+        app = _app()
+        fingerprint = registry_fingerprint(app)
+        assert fingerprint == registry_fingerprint(_app())
+
+        @app.get("/other")
+        async def other():
+            return {}
+
+        assert registry_fingerprint(app) != fingerprint
+
+    def test_built_once_and_reused_from_disk(self, served, tmp_path):
+        app, document, builds = served
+        schema = document.prepare()
+        assert document.prepare() is schema
+        assert builds == [1]
+        assert "/items" in schema["paths"]
+        stored = os.listdir(tmp_path)
+        assert len(stored) == 1 and stored[0].endswith(".json.gz")
+        assert json.loads(gzip.decompress((tmp_path / stored[0]).read_bytes())) == schema
+
+        # A fresh worker with the same routes loads the stored document
+        fresh = OpenAPIDocument(app, lambda: pytest.fail("rebuilt"), str(tmp_path))
+        assert fresh.prepare() == schema
+        assert fresh.etag == document.etag
+
+    def test_changed_routes_replace_stored_document(self, served, tmp_path):
+        app, document, builds = served
+        document.prepare()
+        first = os.listdir(tmp_path)
+
+        @app.get("/other")
+        async def other():
+            return {}
+
+        OpenAPIDocument(app, lambda: {"paths": {}}, str(tmp_path)).prepare()
+        assert os.listdir(tmp_path) != first
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_cache_disabled_keeps_disk_clean(self, served, tmp_path):
+        _, document, builds = served
+        with patch("lib.OpenAPICache.openapi_cache_enabled", return_value=False):
+            document.prepare()
+        assert builds == [1]
+        assert os.listdir(tmp_path) == []
+
+    def test_route_negotiates_gzip_and_etag(self, served):
+        app, document, _ = served
+        client = TestClient(app)
+
+        plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        assert "content-encoding" not in plain.headers
+        assert plain.json()["info"]["title"] == "Cached"
+
+        zipped = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.json() == plain.json()
+        assert zipped.headers["vary"] == "Accept-Encoding"
+
+        revalidated = client.get(
+            "/openapi.json", headers={"If-None-Match": plain.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+
+    def test_accept_encoding_parsing(self):
+        assert _accepts_gzip("gzip, deflate")
+        assert _accepts_gzip("br;q=1.0, *;q=0.5")
+        assert not _accepts_gzip("gzip;q=0")
+        assert not _accepts_gzip("identity")
+        assert not _accepts_gzip(None)
@@ -0,0 +1,141 @@
+"""
+Prefork.py - Boot the application once and fork the workers from it.
+
+With uvicorn's ``factory=True`` every worker imports the app and runs
+``instance()`` on its own, so the registry commit, router and schema
+generation are repeated per worker and none of the result is shared.
+``PreforkServer`` serves an application that was built once in the master
+process: the heap is frozen with ``gc.freeze()`` and the workers are forked
+from it, sharing those pages copy-on-write. Workers only replace what cannot
+cross a fork, such as database engines and their pools.
+"""
+
+import gc
+import os
+import signal
+import time
+from typing import Any, Callable, Dict, Optional
+
+import uvicorn
+
+from lib.Environment import env
+from lib.Logging import logger
+
+# A worker exiting sooner than this after its fork is restarted with a delay
+# so a broken boot does not turn into a fork loop.
+MIN_WORKER_UPTIME = 1.0
+
+
+def prefork_enabled(workers: int, reload: bool = False) -> bool:
+    """Whether ``UVICORN_PREFORK`` applies to this server configuration."""
+    if env("UVICORN_PREFORK").lower() != "true":
+        return False
+    if reload:
+        logger.warning("UVICORN_PREFORK is ignored while auto-reload is enabled")
+        return False
+    if not hasattr(os, "fork"):
+        logger.warning("UVICORN_PREFORK requires os.fork, starting workers normally")
+        return False
+    return workers > 1
+
+
+class PreforkServer:
+    """
+    Serve one pre-built ASGI application from forked uvicorn workers.
+
+    Args:
+        app: Application built in this process before any worker is forked
+        workers: Number of worker processes
+        before_fork: Called once in the master before the first fork
+        after_fork: Called in each worker right after it is forked
+        **config: ``uvicorn.Config`` options (host, port, log_level, ...)
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        workers: int,
+        before_fork: Optional[Callable[[], None]] = None,
+        after_fork: Optional[Callable[[], None]] = None,
+        **config: Any,
+    ):
+        self.config = uvicorn.Config(app, **config)
+        self.workers = workers
+        self.before_fork = before_fork
+        self.after_fork = after_fork
+        self.socket = None
+        self.pids: Dict[int, float] = {}
+        self.stopping = False
+
+    def start(self) -> None:
+        """Bind the shared socket, freeze the heap and fork the workers."""
+        self.socket = self.config.bind_socket()
+        if self.before_fork:
+            self.before_fork()
+        # Objects moved to the permanent generation are never scanned by the
+        # collector again, so collections in the workers leave their pages
+        # (and the reference counts on them) untouched.
+        gc.collect()
+        gc.freeze()
+        logger.info(
+            f"Forking {self.workers} workers from master {os.getpid()} "
+            f"({gc.get_freeze_count()} objects frozen)"
+        )
+        for _ in range(self.workers):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self._run_worker()
+            except BaseException as e:
+                logger.error(f"Worker {os.getpid()} failed: {e}")
+                code = 1
+            finally:
+                os._exit(code)
+        self.pids[pid] = time.monotonic()
+
+    def _run_worker(self) -> None:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, signal.SIG_DFL)
+        gc.enable()
+        if self.after_fork:
+            self.after_fork()
+        uvicorn.Server(self.config).run(sockets=[self.socket])
+
+    def stop(self, sig: int = signal.SIGTERM) -> None:
+        """Ask every worker to shut down; ``wait`` returns once they have."""
+        self.stopping = True
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def wait(self) -> None:
+        """Reap workers, restarting any that exit before ``stop`` is called."""
+        while self.pids:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.pids.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            logger.warning(
+                f"Worker {pid} exited with code {os.waitstatus_to_exitcode(status)}, restarting"
+            )
+            if time.monotonic() - started < MIN_WORKER_UPTIME:
+                time.sleep(MIN_WORKER_UPTIME)
+            self._spawn()
+        if self.socket is not None:
+            self.socket.close()
+
+    def run(self) -> None:
+        """Start the workers and supervise them until SIGINT or SIGTERM."""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda signum, frame: self.stop())
+        self.start()
+        self.wait()
@@ -0,0 +1,74 @@
+import gc
+import json
+import os
+import urllib.request
+from unittest.mock import patch
+
+from lib.Prefork import PreforkServer, prefork_enabled
+
+forked = {"after_fork": False}
+
+
+async def app(scope, receive, send):
+    body = json.dumps(
+        {"pid": os.getpid(), "after_fork": forked["after_fork"]}
+    ).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _after_fork():
+    forked["after_fork"] = True
+
+
+class TestPreforkEnabled:
+    """Pre-fork mode is opt-in and needs several workers without reload."""
+
+    def test_requires_flag_and_workers(self):
+        settings = {"UVICORN_PREFORK": "false"}
+        with patch("lib.Prefork.env", side_effect=settings.get):
+            assert not prefork_enabled(4)
+            settings["UVICORN_PREFORK"] = "true"
+            assert prefork_enabled(4)
+            assert not prefork_enabled(1)
+            assert not prefork_enabled(4, reload=True)
+
+
+class TestPreforkServer:
+    """Workers forked from the master serve the app built before the fork."""
+
+    def test_workers_serve_prebuilt_app(self):
+        before_fork = []
+        server = PreforkServer(
+            app,
+            2,
+            before_fork=lambda: before_fork.append(os.getpid()),
+            after_fork=_after_fork,
+            host="127.0.0.1",
+            port=0,
+            lifespan="off",
+            log_level="warning",
+        )
+        server.start()
+        try:
+            port = server.socket.getsockname()[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=10) as r:
+                served = json.loads(r.read())
+
+            assert before_fork == [os.getpid()]
+            assert len(server.pids) == 2
+            assert served["pid"] in server.pids
+            assert served["after_fork"] is True
+            assert forked["after_fork"] is False
+        finally:
+            server.stop()
+            server.wait()
+            gc.unfreeze()
+
+        assert server.pids == {}
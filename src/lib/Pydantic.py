@@ -1093,6 +1093,30 @@ class BaseNetworkModel(BaseModel):
     )
 
 
+class DatabaseProxy:
+    """Convenient session access to a ModelRegistry's DatabaseManager."""
+
+    def __init__(self, db_manager):
+        self._db_manager = db_manager
+
+    def session(self):
+        """Get a new database session."""
+        return self._db_manager.get_session()
+
+    def get_session(self):
+        """Get a new database session (alias for session())."""
+        return self._db_manager.get_session()
+
+    @property
+    def manager(self):
+        """Direct access to the underlying DatabaseManager."""
+        return self._db_manager
+
+    def __getattr__(self, name):
+        """Delegate all other attributes to the DatabaseManager."""
+        return getattr(self._db_manager, name)
+
+
 class ModelRegistry(AbstractRegistry):
     """
     Registry for managing Pydantic models and their database/API bindings.
@@ -1132,6 +1156,8 @@ class ModelRegistry(AbstractRegistry):
 
         # Model storage
         self.bound_models: OrderedSet[Type[BaseModel]] = OrderedSet()
+        self._models_by_name: Dict[str, Type[BaseModel]] = {}  # name -> model
+        self._db_proxy: Optional[DatabaseProxy] = None
         self.extension_models: Dict[Type[BaseModel], List[Type]] = (
             {}
         )  # target -> [extensions]
@@ -1164,16 +1190,7 @@ class ModelRegistry(AbstractRegistry):
     def apply(self, type: Type) -> Type:
         if type is None:
             raise TypeError(f"Cannot apply registry to None type")
-        # print(f"BEFORE APPLY: {list(type.model_fields.keys())}")
-        new_type = next(
-            (
-                possible_type
-                for possible_type in self.bound_models
-                if possible_type.__name__ == type.__name__
-            ),
-            None,
-        )
-        # print(f"AFTER APPLY: {list(new_type.model_fields.keys())}")
+        new_type = self._models_by_name.get(type.__name__)
         if not new_type:
             raise TypeError(f"No matching type found in registry for {type.__name__}!")
         return new_type
@@ -1494,29 +1511,11 @@ class ModelRegistry(AbstractRegistry):
         if not self.database_manager:
             raise RuntimeError("No DatabaseManager attached to this ModelRegistry")
 
-        # Return a wrapper that provides convenient session access
-        class DatabaseProxy:
-            def __init__(self, db_manager):
-                self._db_manager = db_manager
-
-            def session(self):
-                """Get a new database session."""
-                return self._db_manager.get_session()
-
-            def get_session(self):
-                """Get a new database session (alias for session())."""
-                return self._db_manager.get_session()
-
-            @property
-            def manager(self):
-                """Direct access to the underlying DatabaseManager."""
-                return self._db_manager
-
-            def __getattr__(self, name):
-                """Delegate all other attributes to the DatabaseManager."""
-                return getattr(self._db_manager, name)
-
-        return DatabaseProxy(self.database_manager)
+        # One proxy per attached manager; this is read on every manager call
+        proxy = self._db_proxy
+        if proxy is None or proxy._db_manager is not self.database_manager:
+            proxy = self._db_proxy = DatabaseProxy(self.database_manager)
+        return proxy
 
     def bind(self, model: Type[BaseModel], **metadata) -> None:
         """
@@ -1609,18 +1608,15 @@ class ModelRegistry(AbstractRegistry):
             return
 
         # Check for duplicate model names with different class objects (this should never happen)
-        for existing_model in self.bound_models:
-            if (
-                existing_model.__name__ == model.__name__
-                and existing_model is not model
-            ):
-                raise RuntimeError(
-                    f"CRITICAL ERROR: Duplicate model class detected! "
-                    f"Model '{model.__name__}' exists with different class objects:\n"
-                    f"  Existing: {existing_model} (ID: {id(existing_model)}) from {existing_model.__module__}\n"
-                    f"  New: {model} (ID: {id(model)}) from {model.__module__}\n"
-                    f"This indicates a module import or class loading issue that must be fixed."
-                )
+        existing_model = self._models_by_name.get(model.__name__)
+        if existing_model is not None and existing_model is not model:
+            raise RuntimeError(
+                f"CRITICAL ERROR: Duplicate model class detected! "
+                f"Model '{model.__name__}' exists with different class objects:\n"
+                f"  Existing: {existing_model} (ID: {id(existing_model)}) from {existing_model.__module__}\n"
+                f"  New: {model} (ID: {id(model)}) from {model.__module__}\n"
+                f"This indicates a module import or class loading issue that must be fixed."
+            )
 
         # First, ensure all dependencies are added
         dependencies = self._model_dependencies.get(model, set())
@@ -1633,16 +1629,17 @@ class ModelRegistry(AbstractRegistry):
 
         # Now add this model
         # Check for name duplicates before adding - this should never happen
-        for existing_model in self.bound_models:
-            if existing_model.__name__ == model.__name__:
-                raise RuntimeError(
-                    f"CRITICAL ERROR: Duplicate model name detected!\n"
-                    f"  Existing: {existing_model.__name__} (ID: {id(existing_model)}) from {existing_model.__module__}\n"
-                    f"  New: {model.__name__} (ID: {id(model)}) from {model.__module__}\n"
-                    f"This indicates a module import or class loading issue that must be fixed."
-                )
+        existing_model = self._models_by_name.get(model.__name__)
+        if existing_model is not None:
+            raise RuntimeError(
+                f"CRITICAL ERROR: Duplicate model name detected!\n"
+                f"  Existing: {existing_model.__name__} (ID: {id(existing_model)}) from {existing_model.__module__}\n"
+                f"  New: {model.__name__} (ID: {id(model)}) from {model.__module__}\n"
+                f"This indicates a module import or class loading issue that must be fixed."
+            )
 
         self.bound_models.add(model)
+        self._models_by_name[model.__name__] = model
         self.model_metadata[model] = metadata
 
         logger.debug(
@@ -1713,6 +1710,9 @@ class ModelRegistry(AbstractRegistry):
         # Phase 1: Process extensions
         self._process_extensions()
 
+        # Rebuild the name index apply() serves lookups from
+        self._models_by_name = {model.__name__: model for model in self.bound_models}
+
         # Phase 1.5: Generate Network classes for all bound models
         logger.debug(
             f"Generating Network classes for {len(self.bound_models)} bound models"
@@ -2928,6 +2928,7 @@ class ModelRegistry(AbstractRegistry):
     def clear(self) -> None:
         """Clear the registry (for testing purposes)."""
         self.bound_models.clear()
+        self._models_by_name.clear()
         self.extension_models.clear()
         self.model_metadata.clear()
         self.db_models.clear()
@@ -3037,6 +3038,53 @@ class ModelRegistry(AbstractRegistry):
         return registry
 
 
+def benchmark_registry_lookups(
+    model_registry: ModelRegistry, iterations: int = 1000
+) -> Dict[str, float]:
+    """
+    Measure the per-call cost of the registry lookups made on every manager call.
+
+    Times ``apply`` against the linear scan over ``bound_models`` it replaced,
+    and ``DB`` access against building a new ``DatabaseProxy`` each time.
+
+    Args:
+        model_registry: A registry with bound models and a DatabaseManager
+        iterations: Calls timed per lookup
+
+    Returns:
+        Microseconds per call, keyed by lookup
+    """
+    from time import perf_counter
+
+    models = list(model_registry.bound_models)
+    if not models:
+        return {}
+
+    def linear_scan(model):
+        return next(
+            (m for m in model_registry.bound_models if m.__name__ == model.__name__),
+            None,
+        )
+
+    def timed(run) -> float:
+        started = perf_counter()
+        for index in range(iterations):
+            run(models[index % len(models)])
+        return (perf_counter() - started) * 1_000_000 / iterations
+
+    return {
+        "apply_us": timed(model_registry.apply),
+        "linear_scan_us": timed(linear_scan),
+        "db_us": timed(lambda model: model_registry.DB),
+        # The proxy class used to be defined on every access as well
+        "db_uncached_us": timed(
+            lambda model: type("DatabaseProxy", (DatabaseProxy,), {})(
+                model_registry.database_manager
+            )
+        ),
+    }
+
+
 def obj_to_dict(obj, _visited=None):
     """
     Convert an entity to a dictionary, handling both DB entities and regular objects.
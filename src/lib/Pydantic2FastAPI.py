@@ -1,5 +1,9 @@
+import csv
+import hashlib
+import io
 import json
 import re
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import date, datetime
@@ -11,6 +15,8 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -22,6 +28,7 @@ from typing import (
     get_origin,
 )
 
+import pydantic_core
 import stringcase
 from faker import Faker
 from fastapi import (
@@ -40,7 +47,7 @@ from fastapi import (
 from fastapi.encoders import jsonable_encoder
 from fastapi.params import Depends as DependsParam
 from fastapi.security import HTTPBasic
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, ValidationError, create_model
 
 # Sentinel import for Pydantic's undefined values
@@ -87,8 +94,14 @@ except TypeError:
 
     ValidationError.from_exception_data = classmethod(_compat_from_exception_data)
 
-from lib.Environment import inflection
+from lib.Environment import env, inflection
 from lib.Logging import logger
+from lib.RequestContext import set_request_if_match
+from lib.ResponseCache import (
+    related_tables,
+    response_cache,
+    response_cache_enabled,
+)
 
 if TYPE_CHECKING:
     from logic.AbstractLogicManager import AbstractBLLManager
@@ -942,6 +955,19 @@ class RouteType(Enum):
     SEARCH = "search"
     BATCH_UPDATE = "batch_update"
     BATCH_DELETE = "batch_delete"
+    BATCH_GET = "batch_get"
+    EXPORT = "export"
+    SEARCH_EXPORT = "search_export"
+    AGGREGATE = "aggregate"
+
+
+# Routes on static GET paths that "/{id}" would otherwise shadow
+STATIC_GET_ROUTES = (RouteType.EXPORT, RouteType.BATCH_GET)
+
+
+def _static_path_last(route_type: RouteType) -> bool:
+    """Sort key registering static GET paths before ``/{id}``."""
+    return route_type not in STATIC_GET_ROUTES
 
 
 class HTTPMethod(Enum):
@@ -1046,6 +1072,8 @@ class RouterMixin:
     custom_routes: ClassVar[List[CustomRouteConfig]] = []
     nested_resources: ClassVar[Dict[str, NestedResourceConfig]] = {}
     example_overrides: ClassVar[Dict[str, Dict[str, Any]]] = {}
+    # Seconds GET/LIST responses stay in the shared response cache; 0 disables
+    response_cache_seconds: ClassVar[int] = 0
 
     @classmethod
     def Router(cls, model_registry) -> APIRouter:
@@ -1222,6 +1250,303 @@ def serialize_for_response(
     return data
 
 
+def fast_responses_enabled() -> bool:
+    """Whether generated read routes write response bodies with pydantic-core."""
+    return str(env("FAST_RESPONSES")).lower() == "true"
+
+
+def json_bytes_response(
+    model_instance: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Serialize a validated response model straight to JSON bytes.
+
+    Returning a ``Response`` skips FastAPI's response model handling, which
+    dumps the model to dicts, validates them again and runs
+    ``jsonable_encoder`` before encoding. pydantic-core writes the bytes
+    from the already validated model in one pass, with the same aliases.
+    """
+    return Response(
+        content=model_instance.__pydantic_serializer__.to_json(
+            model_instance, by_alias=True
+        ),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def _are_rows(items: Any) -> bool:
+    """Whether a manager answered a ``return_type="rows"`` request with rows."""
+    return isinstance(items, list) and all(isinstance(item, dict) for item in items)
+
+
+def rows_response(key: str, rows: List[Dict[str, Any]], fields: List[str]) -> Response:
+    """
+    Serialize projected column rows without building DTOs.
+
+    Rows come from ``return_type="rows"`` and already hold only the selected
+    columns plus the version columns, which are dropped unless requested.
+    """
+    allowed = _extract_projection_roots(fields)
+    return Response(
+        content=pydantic_core.to_json(
+            {key: [{k: v for k, v in row.items() if k in allowed} for row in rows]}
+        ),
+        media_type="application/json",
+    )
+
+
+def _version_key(item: Any) -> Tuple[Any, Any]:
+    """Return ``(id, updated_at)`` from a key tuple, dict or entity."""
+    if isinstance(item, tuple):
+        return item[0], item[1] if len(item) > 1 else None
+    if isinstance(item, dict):
+        return item.get("id"), item.get("updated_at")
+    return getattr(item, "id", None), getattr(item, "updated_at", None)
+
+
+def compute_etag(items: Iterable[Any], variant: str = "") -> Optional[str]:
+    """
+    Compute a strong ETag over the ``(id, updated_at)`` keys of ``items``.
+
+    ``variant`` distinguishes representations of the same rows, such as a
+    field projection. Returns None when any item has no ``updated_at``,
+    since its id alone does not identify a version.
+    """
+    digest = hashlib.sha256(variant.encode("utf-8"))
+    for item in items:
+        entity_id, updated_at = _version_key(item)
+        if entity_id is None or updated_at is None:
+            return None
+        if isinstance(updated_at, (datetime, date)):
+            updated_at = updated_at.isoformat()
+        digest.update(f"\x1f{entity_id}\x1e{updated_at}".encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(header: Optional[str], etag: Optional[str], weak: bool = True) -> bool:
+    """
+    Check an ``If-None-Match`` (weak) or ``If-Match`` (strong) header.
+    """
+    if not header or not etag:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _etag_variant(
+    include: Optional[List[str]] = None, fields: Optional[List[str]] = None
+) -> Optional[str]:
+    """
+    Key the ETag to the requested field projection.
+
+    Returns None when ``include`` is requested: the ETag only covers the
+    primary rows, so it cannot see changes to the included ones.
+    """
+    if include:
+        return None
+    if not fields:
+        return ""
+    return f"fields={','.join(fields)}"
+
+
+def _with_etag(payload: Any, response: Response, etag: Optional[str]) -> Any:
+    """Attach ``etag`` to a returned Response or to the injected response."""
+    if etag:
+        target = payload if isinstance(payload, Response) else response
+        target.headers["ETag"] = etag
+    return payload
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def _cached_lookup(
+    manager: Any, request: Optional[Dict], query_params: BaseModel, include: List[str]
+) -> Tuple[Optional[str], Dict[str, int], Optional[Response]]:
+    """
+    Look up a read response in the shared response cache.
+
+    The key covers the request path, the normalized query parameters and
+    the requester; the generations snapshot covers the tables the response
+    reads and the permission tables. Returns ``(key, generations, hit)``.
+    """
+    key = response_cache.make_key(
+        (request or {}).get("path", ""),
+        query_params.model_dump(exclude_none=True),
+        getattr(manager, "requester_id", None),
+    )
+    hit = response_cache.get(key)
+    if hit is not None:
+        body, etag = hit
+        if_none_match = (request or {}).get("headers", {}).get("if-none-match")
+        if etag and etag_matches(if_none_match, etag):
+            return key, {}, _not_modified(etag)
+        headers = {"ETag": etag} if etag else None
+        return (
+            key,
+            {},
+            Response(content=body, media_type="application/json", headers=headers),
+        )
+    return key, response_cache.snapshot(related_tables(manager.DB, include)), None
+
+
+def _cached_store(
+    key: str,
+    generations: Dict[str, int],
+    payload: Any,
+    etag: Optional[str],
+    ttl_seconds: int,
+) -> Response:
+    """Store a read response and return it as a bytes ``Response``."""
+    if not isinstance(payload, Response):
+        payload = json_bytes_response(payload)
+    response_cache.put(key, generations, bytes(payload.body), etag, ttl_seconds)
+    if etag:
+        payload.headers["ETag"] = etag
+    return payload
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _export_rows(
+    items: Iterable[Any],
+    item_model: Callable[[Any], BaseModel],
+    fields_selection: List[str],
+    include_selection: List[str],
+) -> Iterator[Dict[str, Any]]:
+    """Validate and project streamed entities one row at a time."""
+    for item in items:
+        row = item_model(item).model_dump(mode="json", by_alias=True)
+        if fields_selection:
+            row = _apply_field_projection_to_entity(
+                row, fields_selection, include_selection
+            )
+        yield row
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON, one chunk per row."""
+    for row in rows:
+        yield json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Encode rows as CSV, one chunk per row.
+
+    The header is taken from the first row. Nested values are written as JSON.
+    """
+    buffer = io.StringIO()
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in row.items()
+            }
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def streaming_export_response(
+    items: Iterable[Any],
+    item_model: Callable[[Any], BaseModel],
+    export_format: str,
+    filename: str,
+    fields_selection: Optional[List[str]] = None,
+    include_selection: Optional[List[str]] = None,
+) -> StreamingResponse:
+    """
+    Stream entities as an NDJSON or CSV download.
+
+    ``items`` is consumed lazily while the body is sent, so only the row being
+    written is held in memory.
+    """
+    rows = _export_rows(
+        items, item_model, fields_selection or [], include_selection or []
+    )
+    encoder = iter_csv if export_format == "csv" else iter_ndjson
+    return StreamingResponse(
+        encoder(rows),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
+
+
+def benchmark_response_serialization(
+    network_models: Dict[str, Type[BaseModel]], rows: int = 100, repeat: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the cost per row of serializing list responses.
+
+    Each ``ResponsePlural`` is filled with ``rows`` generated example rows and
+    serialized ``repeat`` times through the default path (dump, re-validate,
+    ``jsonable_encoder``, ``json.dumps``, as FastAPI does for a response
+    model) and through ``json_bytes_response``.
+
+    Args:
+        network_models: Network model classes keyed by a display name
+        rows: Number of rows per response
+        repeat: Number of timed runs; the fastest run is reported
+
+    Returns:
+        Microseconds per row for both paths, keyed by display name
+    """
+    results = {}
+    for name, network_model in network_models.items():
+        plural_cls = getattr(network_model, "ResponsePlural", None)
+        if plural_cls is None or len(plural_cls.model_fields) != 1:
+            continue
+        field_name, field_info = next(iter(plural_cls.model_fields.items()))
+        item_cls = get_args(field_info.annotation)[0]
+        try:
+            example = ExampleGenerator.generate_example_for_model(item_cls)
+            instance = plural_cls.model_validate({field_name: [example] * rows})
+        except Exception as e:
+            logger.debug(f"Skipping serialization benchmark for {name}: {e}")
+            continue
+
+        def default_path():
+            revalidated = plural_cls.model_validate(instance.model_dump(by_alias=True))
+            json.dumps(
+                jsonable_encoder(revalidated.model_dump(mode="json", by_alias=True))
+            ).encode("utf-8")
+
+        def fast_path():
+            json_bytes_response(instance)
+
+        timings = {}
+        for label, run in (("default", default_path), ("fast", fast_path)):
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            timings[f"{label}_us_per_row"] = best * 1_000_000 / rows
+        results[name] = timings
+    return results
+
+
 def create_manager_factory(
     manager_class: Type["AbstractBLLManager"],
     model_registry: Any,
@@ -1512,6 +1837,16 @@ def register_route(
     # Build dependencies
     dependencies = [auth_dependency] if auth_dependency else None
 
+    # Read routes can bypass FastAPI's response model re-validation
+    fast_responses = fast_responses_enabled()
+
+    # Per-model opt-in to the shared response cache for GET/LIST
+    cache_seconds = (
+        getattr(child_manager_class or manager_class, "response_cache_seconds", 0)
+        if response_cache_enabled()
+        else 0
+    )
+
     # Parent name for nested routes
     parent_name = parent_param_name.replace("_id", "") if parent_param_name else None
 
@@ -1549,6 +1884,7 @@ def register_route(
             responses=responses,
         )
         async def get_resource(
+            response: Response,
             request: Dict = Depends(get_request_info),
             id: str = Path(
                 ..., description=f"{stringcase.titlecase(resource_name)} ID"
@@ -1568,6 +1904,26 @@ def register_route(
                 fields_param = _normalize_query_list(
                     getattr(query_params, "fields", None)
                 )
+                etag_variant = _etag_variant(include_param, fields_param)
+
+                cache_key = None
+                if cache_seconds:
+                    cache_key, generations, cached = _cached_lookup(
+                        get_manager(manager, manager_property),
+                        request,
+                        query_params,
+                        include_param,
+                    )
+                    if cached is not None:
+                        return cached
+
+                # Answer revalidation from the version key before loading the DTO
+                if_none_match = (request or {}).get("headers", {}).get("if-none-match")
+                if if_none_match and etag_variant is not None:
+                    version = get_manager(manager, manager_property).version(id=id)
+                    etag = compute_etag([version], etag_variant) if version else None
+                    if etag_matches(if_none_match, etag):
+                        return _not_modified(etag)
 
                 result = get_manager(manager, manager_property).get(
                     id=id, include=include_param, fields=fields_param
@@ -1582,6 +1938,11 @@ def register_route(
                 response_model_instance = network_model.ResponseSingle(
                     **{resource_name: result}
                 )
+                etag = (
+                    compute_etag([result], etag_variant)
+                    if etag_variant is not None
+                    else None
+                )
 
                 fields_selection = _normalize_projection_values(query_params.fields)
                 include_selection = _normalize_projection_values(query_params.include)
@@ -1593,12 +1954,20 @@ def register_route(
                     projected_entity = _apply_field_projection_to_entity(
                         serialized_entity, fields_selection, include_selection
                     )
-                    return JSONResponse(
+                    payload = JSONResponse(
                         content=jsonable_encoder({resource_name: projected_entity}),
                         status_code=status.HTTP_200_OK,
                     )
+                elif fast_responses:
+                    payload = json_bytes_response(response_model_instance)
+                else:
+                    payload = response_model_instance
 
-                return response_model_instance
+                if cache_key:
+                    return _cached_store(
+                        cache_key, generations, payload, etag, cache_seconds
+                    )
+                return _with_etag(payload, response, etag)
             except Exception as err:
                 handle_resource_operation_error(err)
 
@@ -1626,6 +1995,7 @@ def register_route(
             responses=responses,
         )
         async def list_resources(
+            response: Response,
             request: Dict = Depends(get_request_info),
             query_params: network_model.LIST = Depends(list_query_dependency),
             manager=Depends(manager_factory),
@@ -1642,25 +2012,60 @@ def register_route(
                 fields_param = _normalize_query_list(
                     getattr(query_params, "fields", None)
                 )
+                page_params = {
+                    "offset": query_params.offset or 0,
+                    "limit": query_params.limit or 100,
+                    "sort_by": query_params.sort_by,
+                    "sort_order": query_params.sort_order or "asc",
+                }
+                etag_variant = _etag_variant(include_param, fields_param)
+
+                cache_key = None
+                if cache_seconds:
+                    cache_key, generations, cached = _cached_lookup(
+                        get_manager(manager, manager_property),
+                        request,
+                        query_params,
+                        include_param,
+                    )
+                    if cached is not None:
+                        return cached
+
+                # Answer revalidation from the page keys before loading DTOs
+                if_none_match = (request or {}).get("headers", {}).get("if-none-match")
+                if if_none_match and etag_variant is not None:
+                    keys = get_manager(manager, manager_property).list(
+                        return_type="keys", **page_params, **search_params
+                    )
+                    etag = compute_etag(keys, etag_variant)
+                    if etag_matches(if_none_match, etag):
+                        return _not_modified(etag)
+
+                fields_selection = _normalize_projection_values(query_params.fields)
+                include_selection = _normalize_projection_values(query_params.include)
+                pushdown = bool(fields_selection) and not include_selection
 
                 results = get_manager(manager, manager_property).list(
                     include=include_param,
                     fields=fields_param,
-                    offset=query_params.offset or 0,
-                    limit=query_params.limit or 100,
-                    sort_by=query_params.sort_by,
-                    sort_order=query_params.sort_order or "asc",
+                    **({"return_type": "rows"} if pushdown else {}),
+                    **page_params,
                     **search_params,
                 )
-
-                response_model_instance = network_model.ResponsePlural(
-                    **{resource_name_plural: results}
+                etag = (
+                    compute_etag(results, etag_variant)
+                    if etag_variant is not None
+                    else None
                 )
 
-                fields_selection = _normalize_projection_values(query_params.fields)
-                include_selection = _normalize_projection_values(query_params.include)
-
-                if fields_selection:
+                if pushdown and _are_rows(results):
+                    payload = rows_response(
+                        resource_name_plural, results, fields_selection
+                    )
+                elif fields_selection:
+                    response_model_instance = network_model.ResponsePlural(
+                        **{resource_name_plural: results}
+                    )
                     serialized_items = serialize_for_response(
                         getattr(response_model_instance, resource_name_plural)
                     )
@@ -1676,14 +2081,27 @@ def register_route(
                         )
                         for item in serialized_items or []
                     ]
-                    return JSONResponse(
+                    payload = JSONResponse(
                         content=jsonable_encoder(
                             {resource_name_plural: projected_items}
                         ),
                         status_code=status.HTTP_200_OK,
                     )
+                else:
+                    response_model_instance = network_model.ResponsePlural(
+                        **{resource_name_plural: results}
+                    )
+                    payload = (
+                        json_bytes_response(response_model_instance)
+                        if fast_responses
+                        else response_model_instance
+                    )
 
-                return response_model_instance
+                if cache_key:
+                    return _cached_store(
+                        cache_key, generations, payload, etag, cache_seconds
+                    )
+                return _with_etag(payload, response, etag)
             except Exception as err:
                 handle_resource_operation_error(err)
 
@@ -1809,6 +2227,7 @@ def register_route(
             responses=responses,
         )
         async def update_resource(
+            response: Response,
             request: Dict = Depends(get_request_info),
             id: str = Path(
                 ..., description=f"{stringcase.titlecase(resource_name)} ID"
@@ -1821,6 +2240,11 @@ def register_route(
                     body, resource_name, resource_name_plural
                 )
 
+                # Checked against the row the update already loads
+                set_request_if_match(
+                    id, (request or {}).get("headers", {}).get("if-match")
+                )
+
                 # actual_manager: Any = get_manager(manager, manager_property)
                 # result = actual_manager.update(id, **update_data)
                 # print(f"Type of result: {type(result)}")
@@ -1833,15 +2257,18 @@ def register_route(
                 #         fields=getattr(body, "fields", None),
                 #     )
 
-                return network_model.ResponseSingle(
-                    **{
-                        resource_name: get_manager(manager, manager_property).update(
-                            id, **update_data
-                        )
-                    }
+                result = get_manager(manager, manager_property).update(
+                    id, **update_data
+                )
+                return _with_etag(
+                    network_model.ResponseSingle(**{resource_name: result}),
+                    response,
+                    compute_etag([result]),
                 )
             except Exception as err:
                 handle_resource_operation_error(err)
+            finally:
+                set_request_if_match(None, None)
 
     elif route_type == RouteType.DELETE:
         path = "/{id}"
@@ -1968,6 +2395,10 @@ def register_route(
                 if not actual_sort_order:
                     actual_sort_order = "asc"
 
+                fields_selection = _normalize_projection_values(actual_fields)
+                include_selection = _normalize_projection_values(actual_include)
+                pushdown = bool(fields_selection) and not include_selection
+
                 search_results = get_manager(manager, manager_property).search(
                     include=actual_include,
                     fields=actual_fields,
@@ -1977,16 +2408,19 @@ def register_route(
                     sort_order=actual_sort_order,
                     page=actual_page,
                     pageSize=actual_page_size,
+                    **({"return_type": "rows"} if pushdown else {}),
                     **search_data,
                 )
 
+                if pushdown and _are_rows(search_results):
+                    return rows_response(
+                        resource_name_plural, search_results, fields_selection
+                    )
+
                 response_model_instance = network_model.ResponsePlural(
                     **{resource_name_plural: search_results}
                 )
 
-                fields_selection = _normalize_projection_values(actual_fields)
-                include_selection = _normalize_projection_values(actual_include)
-
                 if fields_selection:
                     serialized_items = serialize_for_response(
                         getattr(response_model_instance, resource_name_plural)
@@ -2004,10 +2438,147 @@ def register_route(
                         status_code=status.HTTP_200_OK,
                     )
 
+                if fast_responses:
+                    return json_bytes_response(response_model_instance)
                 return response_model_instance
             except Exception as err:
                 handle_resource_operation_error(err)
 
+    elif route_type in (RouteType.EXPORT, RouteType.SEARCH_EXPORT):
+        searching = route_type == RouteType.SEARCH_EXPORT
+        path = "/search/export" if searching else "/export"
+        summary = (
+            f"Export {resource_name_plural}"
+            + (" matching search criteria" if searching else "")
+            + (f" for {parent_name}" if parent_name else "")
+        )
+        export_responses = {
+            200: {
+                "description": "NDJSON or CSV stream, one row per entity",
+                "content": {media: {} for media in EXPORT_MEDIA_TYPES.values()},
+            }
+        }
+
+        def export_item(item: Any) -> BaseModel:
+            return getattr(
+                network_model.ResponseSingle(**{resource_name: item}), resource_name
+            )
+
+        def export_resources(
+            request: Dict,
+            manager: Any,
+            search_data: Dict[str, Any],
+            export_format: str,
+            include: Optional[List[str]],
+            fields: Optional[List[str]],
+            limit: Optional[int],
+            offset: Optional[int],
+            sort_by: Optional[str],
+            sort_order: Optional[str],
+        ) -> StreamingResponse:
+            if parent_param_name and request:
+                search_data[parent_param_name] = request["path_params"][
+                    parent_param_name
+                ]
+            include_param = _normalize_query_list(
+                _coerce_sequence_values(include or [])
+            )
+            fields_param = _normalize_query_list(_coerce_sequence_values(fields or []))
+            items = get_manager(manager, manager_property).stream(
+                include=include_param,
+                fields=fields_param,
+                offset=offset,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order or "asc",
+                **search_data,
+            )
+            return streaming_export_response(
+                items,
+                export_item,
+                export_format,
+                resource_name_plural,
+                fields_selection=_normalize_projection_values(fields_param),
+                include_selection=_normalize_projection_values(include_param),
+            )
+
+        if searching:
+
+            @router.post(
+                path,
+                summary=summary,
+                status_code=status.HTTP_200_OK,
+                dependencies=dependencies,
+                response_class=StreamingResponse,
+                responses=export_responses,
+            )
+            async def search_export_resources(
+                request: Dict = Depends(get_request_info),
+                criteria: network_model.SEARCH = Body(...),
+                manager=Depends(manager_factory),
+                format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                include: Optional[List[str]] = Query(None),
+                fields: Optional[List[str]] = Query(None),
+                limit: Optional[int] = Query(None, ge=1),
+                offset: Optional[int] = Query(None, ge=0),
+                sort_by: Optional[str] = Query(None),
+                sort_order: Optional[str] = Query(None, pattern="^(asc|desc)$"),
+            ):
+                try:
+                    return export_resources(
+                        request,
+                        manager,
+                        extract_body_data(
+                            criteria, resource_name, resource_name_plural
+                        ),
+                        format,
+                        include,
+                        fields,
+                        limit,
+                        offset,
+                        sort_by,
+                        sort_order,
+                    )
+                except Exception as err:
+                    handle_resource_operation_error(err)
+
+        else:
+
+            @router.get(
+                path,
+                summary=summary,
+                status_code=status.HTTP_200_OK,
+                dependencies=dependencies,
+                response_class=StreamingResponse,
+                responses=export_responses,
+            )
+            async def list_export_resources(
+                request: Dict = Depends(get_request_info),
+                manager=Depends(manager_factory),
+                format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                include: Optional[List[str]] = Query(None),
+                fields: Optional[List[str]] = Query(None),
+                limit: Optional[int] = Query(None, ge=1),
+                offset: Optional[int] = Query(None, ge=0),
+                sort_by: Optional[str] = Query(None),
+                sort_order: Optional[str] = Query(None, pattern="^(asc|desc)$"),
+            ):
+                try:
+                    return export_resources(
+                        request,
+                        manager,
+                        {},
+                        format,
+                        include,
+                        fields,
+                        limit,
+                        offset,
+                        sort_by,
+                        sort_order,
+                    )
+                except Exception as err:
+                    handle_resource_operation_error(err)
+
     elif route_type == RouteType.BATCH_UPDATE:
         path = ""
         summary = f"Batch update {resource_name_plural}"
@@ -2055,6 +2626,135 @@ def register_route(
             except Exception as err:
                 handle_resource_operation_error(err)
 
+    elif route_type == RouteType.AGGREGATE:
+        path = "/aggregate"
+        summary = f"Aggregate {resource_name_plural}" + (
+            f" for {parent_name}" if parent_name else ""
+        )
+
+        @router.post(
+            path,
+            summary=summary,
+            status_code=status.HTTP_200_OK,
+            dependencies=dependencies,
+            responses={
+                200: {
+                    "description": "One entry per group with its `count` and the "
+                    "requested `sum`/`min`/`max` values; `truncated` is true when "
+                    "the group limit cut the result",
+                }
+            },
+        )
+        async def aggregate_resources(
+            request: Dict = Depends(get_request_info),
+            criteria: Optional[network_model.SEARCH] = Body(None),
+            manager=Depends(manager_factory),
+            group_by: Optional[List[str]] = Query(None),
+            sum_fields: Optional[List[str]] = Query(None, alias="sum"),
+            min_fields: Optional[List[str]] = Query(None, alias="min"),
+            max_fields: Optional[List[str]] = Query(None, alias="max"),
+            limit: Optional[int] = Query(None, ge=1),
+        ):
+            try:
+                search_data = (
+                    extract_body_data(criteria, resource_name, resource_name_plural)
+                    if criteria is not None
+                    else {}
+                )
+                if parent_param_name and request:
+                    search_data[parent_param_name] = request["path_params"][
+                        parent_param_name
+                    ]
+                metrics = {
+                    function: _coerce_sequence_values(names)
+                    for function, names in (
+                        ("sum", sum_fields),
+                        ("min", min_fields),
+                        ("max", max_fields),
+                    )
+                    if names
+                }
+                groups, truncated = get_manager(manager, manager_property).aggregate(
+                    group_by=_coerce_sequence_values(group_by or []),
+                    metrics=metrics,
+                    limit=limit,
+                    **search_data,
+                )
+                return Response(
+                    content=pydantic_core.to_json(
+                        {"groups": groups, "truncated": truncated}
+                    ),
+                    media_type="application/json",
+                )
+            except Exception as err:
+                handle_resource_operation_error(err)
+
+    elif route_type == RouteType.BATCH_GET:
+        path = "/batch"
+        summary = f"Get multiple {resource_name_plural} by ID" + (
+            f" for {parent_name}" if parent_name else ""
+        )
+
+        @router.get(
+            path,
+            summary=summary,
+            status_code=status.HTTP_200_OK,
+            dependencies=dependencies,
+            responses={
+                200: {
+                    "description": f"Visible {resource_name_plural} in request order, "
+                    "plus an `errors` entry (`not_found` or `forbidden`) per unresolved id",
+                }
+            },
+        )
+        async def batch_get_resources(
+            ids: str = Query(
+                ..., description=f"Comma-separated list of {resource_name_plural} IDs"
+            ),
+            include: Optional[List[str]] = Query(None),
+            fields: Optional[List[str]] = Query(None),
+            manager=Depends(manager_factory),
+        ):
+            try:
+                ids_list = [id.strip() for id in ids.split(",") if id.strip()]
+                if not ids_list:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="No valid IDs provided in ids parameter",
+                    )
+                include_param = _normalize_query_list(
+                    _coerce_sequence_values(include or [])
+                )
+                fields_param = _normalize_query_list(
+                    _coerce_sequence_values(fields or [])
+                )
+
+                items, errors = get_manager(manager, manager_property).batch_get(
+                    ids=ids_list, include=include_param, fields=fields_param
+                )
+
+                response_model_instance = network_model.ResponsePlural(
+                    **{resource_name_plural: items}
+                )
+                serialized_items = serialize_for_response(
+                    getattr(response_model_instance, resource_name_plural)
+                )
+                if fields_param:
+                    serialized_items = [
+                        _apply_field_projection_to_entity(
+                            item, fields_param, include_param or []
+                        )
+                        for item in serialized_items or []
+                    ]
+                return Response(
+                    content=pydantic_core.to_json(
+                        {resource_name_plural: serialized_items or [], "errors": errors}
+                    ),
+                    media_type="application/json",
+                )
+            except Exception as err:
+                handle_resource_operation_error(err)
+
     elif route_type == RouteType.BATCH_DELETE:
         path = ""
         summary = f"Batch delete {resource_name_plural}"
@@ -2265,13 +2965,17 @@ def create_router_from_manager(
             RouteType.DELETE,
             RouteType.BATCH_UPDATE,
             RouteType.BATCH_DELETE,
+            RouteType.BATCH_GET,
+            RouteType.EXPORT,
+            RouteType.SEARCH_EXPORT,
+            RouteType.AGGREGATE,
         ]
 
     # Create main router
     router = APIRouter(prefix=prefix, tags=tags)
 
-    # Register standard routes
-    for route_type in routes_to_register:
+    # Register standard routes; GET /export and /batch must precede GET /{id}
+    for route_type in sorted(routes_to_register, key=_static_path_last):
         register_route(
             router=router,
             route_type=route_type,
@@ -2437,7 +3141,7 @@ def create_router_from_manager(
 
         # Register routes for nested resource
         nested_routes = nested_config.routes_to_register
-        for route_type in nested_routes:
+        for route_type in sorted(nested_routes, key=_static_path_last):
 
             register_route(
                 router=nested_router,
@@ -1,4 +1,7 @@
+import json
+from datetime import datetime
 from typing import Any, ClassVar, Dict, List, Optional, Type
+from unittest.mock import patch
 
 import pytest
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -13,17 +16,23 @@ from lib.Pydantic2FastAPI import (
     NestedResourceConfig,
     RouterMixin,
     RouteType,
+    benchmark_response_serialization,
+    compute_etag,
     create_manager_factory,
     create_router_from_manager,
+    etag_matches,
     extract_body_data,
     generate_routers_from_model_registry,
     get_auth_dependency,
     handle_resource_operation_error,
+    json_bytes_response,
     register_custom_route,
     register_route,
     serialize_for_response,
     static_route,
 )
+from lib.RequestContext import get_request_if_match
+from lib.ResponseCache import ResponseCache
 
 # Import AbstractBLLManager for proper inheritance
 from logic.AbstractLogicManager import AbstractBLLManager
@@ -426,6 +435,10 @@ class TestRouteRegistration:
             RouteType.UPDATE,
             RouteType.DELETE,
             RouteType.SEARCH,
+            RouteType.BATCH_GET,
+            RouteType.EXPORT,
+            RouteType.SEARCH_EXPORT,
+            RouteType.AGGREGATE,
         ],
     )
     def test_register_route(self, route_type, model_registry):
@@ -465,6 +478,18 @@ class TestRouteRegistration:
         elif route_type == RouteType.SEARCH:
             assert "/search" in route.path
             assert "POST" in route.methods
+        elif route_type == RouteType.BATCH_GET:
+            assert route.path == "/batch"
+            assert "GET" in route.methods
+        elif route_type == RouteType.EXPORT:
+            assert route.path == "/export"
+            assert "GET" in route.methods
+        elif route_type == RouteType.SEARCH_EXPORT:
+            assert route.path == "/search/export"
+            assert "POST" in route.methods
+        elif route_type == RouteType.AGGREGATE:
+            assert route.path == "/aggregate"
+            assert "POST" in route.methods
 
     def test_register_custom_route(self, model_registry):
         """Test registering custom route."""
@@ -790,6 +815,508 @@ class TestQueryParameterInjection:
         assert manager_cls.last_list_params["fields"] == ["name"]
 
 
+class TestFastResponses:
+    """Read routes serialize response models straight to JSON bytes."""
+
+    # Keeps the "test" resource name expected by TestNetworkModel
+    class TestManager(TestManager):
+        __test__ = False
+        auth_type = AuthType.NONE
+        routes_to_register = [RouteType.GET, RouteType.LIST]
+        custom_routes = []
+        _shared_store: Dict[str, TestModel] = {}
+
+        def __init__(self, requester_id: Optional[str] = None, model_registry=None):
+            super().__init__(requester_id=requester_id, model_registry=model_registry)
+            self._data_store = self.__class__._shared_store
+
+    def _fetch(self, model_registry, fast: str) -> Dict[str, Any]:
+        with patch("lib.Environment.settings.FAST_RESPONSES", fast):
+            router = create_router_from_manager(self.TestManager, model_registry)
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        return {
+            "get": client.get("/v1/test/test_1"),
+            "list": client.get("/v1/test"),
+        }
+
+    def test_fast_path_matches_default_path(self, model_registry):
+        self.TestManager._shared_store = {}
+        manager = self.TestManager()
+        manager.create(name="First", value=1)
+        manager.create(name="Second", value=2)
+
+        default = self._fetch(model_registry, "false")
+        fast = self._fetch(model_registry, "true")
+
+        for route in ("get", "list"):
+            assert fast[route].status_code == default[route].status_code == 200
+            assert fast[route].headers["content-type"] == "application/json"
+            assert fast[route].json() == default[route].json()
+        assert len(fast["list"].json()["tests"]) == 2
+
+    def test_json_bytes_response(self):
+        instance = TestNetworkModel.ResponseSingle(
+            test=TestModel(id="abc", name="Bytes", value=3)
+        )
+        response = json_bytes_response(instance, status_code=201)
+        assert response.status_code == 201
+        assert response.body == instance.model_dump_json(by_alias=True).encode()
+
+    def test_benchmark_response_serialization(self):
+        results = benchmark_response_serialization(
+            {"test": TestNetworkModel}, rows=10, repeat=1
+        )
+        assert set(results["test"]) == {"default_us_per_row", "fast_us_per_row"}
+        assert all(value > 0 for value in results["test"].values())
+
+
+class TestExportRoutes:
+    """Export routes stream list and search results as NDJSON or CSV."""
+
+    # Keeps the "test" resource name expected by TestNetworkModel
+    class TestManager(TestManager):
+        __test__ = False
+        auth_type = AuthType.NONE
+        routes_to_register = [
+            RouteType.GET,
+            RouteType.EXPORT,
+            RouteType.SEARCH_EXPORT,
+        ]
+        custom_routes = []
+        _shared_store: Dict[str, TestModel] = {}
+        consumed = 0
+
+        def __init__(self, requester_id: Optional[str] = None, model_registry=None):
+            super().__init__(requester_id=requester_id, model_registry=model_registry)
+            self._data_store = self.__class__._shared_store
+
+        def stream(self, offset=None, limit=None, sort_by=None, **criteria):
+            # Like the real manager, validate before returning the iterator
+            if sort_by not in (None, "name", "value"):
+                raise HTTPException(status_code=400, detail="Invalid sort field")
+            criteria = {
+                key: value
+                for key, value in criteria.items()
+                if key in ("name", "value") and value is not None
+            }
+            rows = list(self._data_store.values())[offset or 0 :]
+            return self._matching(rows[:limit] if limit else rows, criteria)
+
+        def _matching(self, rows, criteria):
+            for entity in rows:
+                if any(getattr(entity, k) != v for k, v in criteria.items()):
+                    continue
+                self.__class__.consumed += 1
+                yield entity
+
+    @pytest.fixture
+    def client(self, model_registry):
+        self.TestManager._shared_store = {}
+        self.TestManager.consumed = 0
+        manager = self.TestManager()
+        manager.create(name="First", value=1)
+        manager.create(name="Second", value=2)
+        manager.create(name="Third", value=2)
+
+        # Search bodies wrap criteria under the resource name, as generated
+        # network models do
+        class SEARCH(BaseModel):
+            test: TestNetworkModel.SEARCH
+
+        app = FastAPI()
+        with patch.object(TestNetworkModel, "SEARCH", SEARCH):
+            app.include_router(
+                create_router_from_manager(self.TestManager, model_registry)
+            )
+        return TestClient(app)
+
+    def test_list_export_ndjson(self, client):
+        response = client.get("/v1/test/export", params={"limit": 2})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "tests.ndjson" in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == ["First", "Second"]
+
+    def test_list_export_csv_with_projection(self, client):
+        response = client.get(
+            "/v1/test/export", params={"format": "csv", "fields": "id,name"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        lines = response.text.splitlines()
+        assert lines[0] == "id,name"
+        assert lines[1:] == ["test_1,First", "test_2,Second", "test_3,Third"]
+
+    def test_search_export(self, client):
+        response = client.post("/v1/test/search/export", json={"test": {"value": 2}})
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == ["Second", "Third"]
+        assert self.TestManager.consumed == 2
+
+    def test_export_is_not_shadowed_by_get(self, client):
+        assert client.get("/v1/test/test_1").json()["test"]["name"] == "First"
+        assert client.get("/v1/test/export").status_code == 200
+
+    def test_stream_errors_reach_the_status_code(self, client):
+        response = client.get("/v1/test/export", params={"sort_by": "missing"})
+        assert response.status_code == 400
+        assert self.TestManager.consumed == 0
+
+    def test_invalid_format_rejected(self, client):
+        response = client.get("/v1/test/export", params={"format": "xml"})
+        assert response.status_code == 422
+
+
+class TestAggregateRoutes:
+    """POST /aggregate passes grouping, metrics and search criteria through."""
+
+    class TestManager(TestManager):
+        __test__ = False
+        auth_type = AuthType.NONE
+        routes_to_register = [RouteType.AGGREGATE]
+        custom_routes = []
+        calls = []
+
+        def aggregate(self, group_by=None, metrics=None, limit=None, **criteria):
+            self.__class__.calls.append((group_by, metrics, limit, criteria))
+            return [{"group": {"value": 2}, "count": 2, "sum": {"value": 4}}], True
+
+    @pytest.fixture
+    def client(self, model_registry):
+        self.TestManager.calls = []
+
+        class SEARCH(BaseModel):
+            test: TestNetworkModel.SEARCH
+
+        app = FastAPI()
+        with patch.object(TestNetworkModel, "SEARCH", SEARCH):
+            app.include_router(
+                create_router_from_manager(self.TestManager, model_registry)
+            )
+        return TestClient(app)
+
+    def test_aggregate_with_criteria(self, client):
+        response = client.post(
+            "/v1/test/aggregate",
+            params={"group_by": "value", "sum": "value", "max": "name", "limit": 5},
+            json={"test": {"name": "First"}},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "groups": [{"group": {"value": 2}, "count": 2, "sum": {"value": 4}}],
+            "truncated": True,
+        }
+        group_by, metrics, limit, criteria = self.TestManager.calls[0]
+        assert group_by == ["value"]
+        assert metrics == {"sum": ["value"], "max": ["name"]}
+        assert limit == 5
+        assert criteria["name"] == "First"
+
+    def test_aggregate_without_body(self, client):
+        assert client.post("/v1/test/aggregate").status_code == 200
+        assert self.TestManager.calls == [([], {}, None, {})]
+
+
+class TestBatchGetRoutes:
+    """GET /batch resolves many ids and reports the ones it could not."""
+
+    class TestManager(TestManager):
+        __test__ = False
+        auth_type = AuthType.NONE
+        routes_to_register = [RouteType.GET, RouteType.BATCH_GET]
+        custom_routes = []
+        _shared_store: Dict[str, TestModel] = {}
+        calls = []
+
+        def __init__(self, requester_id: Optional[str] = None, model_registry=None):
+            super().__init__(requester_id=requester_id, model_registry=model_registry)
+            self._data_store = self.__class__._shared_store
+
+        def batch_get(self, ids, include=None, fields=None):
+            self.__class__.calls.append(list(ids))
+            found = [self._data_store[id] for id in ids if id in self._data_store]
+            errors = [
+                {"id": id, "error": "forbidden" if id == "hidden" else "not_found"}
+                for id in ids
+                if id not in self._data_store
+            ]
+            return found, errors
+
+    @pytest.fixture
+    def client(self, model_registry):
+        self.TestManager._shared_store = {}
+        self.TestManager.calls = []
+        manager = self.TestManager()
+        manager.create(name="First", value=1)
+        manager.create(name="Second", value=2)
+        app = FastAPI()
+        app.include_router(create_router_from_manager(self.TestManager, model_registry))
+        return TestClient(app)
+
+    def test_batch_get_reports_missing_ids(self, client):
+        response = client.get(
+            "/v1/test/batch", params={"ids": "test_2,missing,test_1,hidden"}
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["name"] for item in body["tests"]] == ["Second", "First"]
+        assert body["errors"] == [
+            {"id": "missing", "error": "not_found"},
+            {"id": "hidden", "error": "forbidden"},
+        ]
+        assert self.TestManager.calls == [["test_2", "missing", "test_1", "hidden"]]
+
+    def test_batch_get_applies_field_projection(self, client):
+        response = client.get(
+            "/v1/test/batch", params={"ids": "test_1", "fields": "id,name"}
+        )
+        assert response.json() == {
+            "tests": [{"id": "test_1", "name": "First"}],
+            "errors": [],
+        }
+
+    def test_batch_is_not_shadowed_by_get(self, client):
+        assert client.get("/v1/test/test_1").json()["test"]["name"] == "First"
+        assert client.get("/v1/test/batch", params={"ids": "test_1"}).status_code == 200
+
+    def test_empty_ids_rejected(self, client):
+        assert client.get("/v1/test/batch", params={"ids": " , "}).status_code == 400
+
+
+class TestConditionalRequests:
+    """ETags, If-None-Match revalidation and If-Match preconditions."""
+
+    class VersionedTestModel(TestModel):
+        __test__ = False
+        updated_at: Optional[datetime] = None
+
+    # Keeps the "test" resource name expected by TestNetworkModel
+    class TestManager(TestManager):
+        __test__ = False
+        auth_type = AuthType.NONE
+        routes_to_register = [RouteType.GET, RouteType.LIST, RouteType.UPDATE]
+        custom_routes = []
+        _shared_store: Dict[str, TestModel] = {}
+        loads = 0
+
+        def __init__(self, requester_id: Optional[str] = None, model_registry=None):
+            super().__init__(requester_id=requester_id, model_registry=model_registry)
+            self._data_store = self.__class__._shared_store
+
+        def create(self, **kwargs):
+            entity_id = f"test_{len(self._data_store) + 1}"
+            entity = TestConditionalRequests.VersionedTestModel(
+                id=entity_id, updated_at=datetime(2026, 1, 1), **kwargs
+            )
+            self._data_store[entity_id] = entity
+            return entity
+
+        def version(self, id: str):
+            entity = self._data_store.get(id)
+            return (entity.id, entity.updated_at) if entity else None
+
+        def get(self, id: str, include=None, fields=None):
+            self.__class__.loads += 1
+            return self._data_store.get(id)
+
+        def list(self, return_type="dto", **kwargs):
+            entities = list(self._data_store.values())
+            if return_type == "keys":
+                return [(entity.id, entity.updated_at) for entity in entities]
+            self.__class__.loads += 1
+            return entities
+
+        def update(self, id: str, **kwargs):
+            # Mirrors the check UpdateMixin.update makes on the loaded row
+            entity = self._data_store[id]
+            if_match = get_request_if_match(id)
+            if if_match and not etag_matches(
+                if_match, compute_etag([entity]), weak=False
+            ):
+                raise HTTPException(status_code=412, detail="Modified")
+            for key, value in kwargs.items():
+                setattr(entity, key, value)
+            entity.updated_at = datetime(2026, 1, 2)
+            return entity
+
+    @pytest.fixture
+    def client(self, model_registry):
+        self.TestManager._shared_store = {}
+        self.TestManager.loads = 0
+        manager = self.TestManager()
+        manager.create(name="First", value=1)
+        manager.create(name="Second", value=2)
+
+        # Update bodies wrap fields under the resource name, as generated
+        # network models do
+        class PUT(BaseModel):
+            test: TestNetworkModel.PUT
+
+        app = FastAPI()
+        with patch.object(TestNetworkModel, "PUT", PUT):
+            app.include_router(
+                create_router_from_manager(self.TestManager, model_registry)
+            )
+        return TestClient(app)
+
+    def test_get_returns_304_before_loading(self, client):
+        first = client.get("/v1/test/test_1")
+        etag = first.headers["etag"]
+        assert etag == compute_etag([("test_1", datetime(2026, 1, 1))])
+        assert self.TestManager.loads == 1
+
+        cached = client.get("/v1/test/test_1", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert self.TestManager.loads == 1
+
+        stale = client.get("/v1/test/test_1", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert self.TestManager.loads == 2
+
+    def test_projection_changes_etag(self, client):
+        full = client.get("/v1/test/test_1").headers["etag"]
+        projected = client.get("/v1/test/test_1", params={"fields": "name"})
+        assert projected.headers["etag"] != full
+
+    def test_include_has_no_etag(self, client):
+        etag = client.get("/v1/test/test_1").headers["etag"]
+        included = client.get(
+            "/v1/test/test_1",
+            params={"include": "owner"},
+            headers={"If-None-Match": etag},
+        )
+        assert included.status_code == 200
+        assert "etag" not in included.headers
+
+        listed = client.get("/v1/test", params={"include": "owner"})
+        assert "etag" not in listed.headers
+
+    def test_list_etag_tracks_page_keys(self, client):
+        etag = client.get("/v1/test").headers["etag"]
+        cached = client.get("/v1/test", headers={"If-None-Match": f"W/{etag}"})
+        assert cached.status_code == 304
+        assert self.TestManager.loads == 1
+
+        client.put("/v1/test/test_2", json={"test": {"name": "Changed"}})
+        changed = client.get("/v1/test", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_update_if_match(self, client):
+        etag = client.get("/v1/test/test_1").headers["etag"]
+
+        updated = client.put(
+            "/v1/test/test_1", json={"test": {"name": "Renamed"}}, headers={"If-Match": etag}
+        )
+        assert updated.status_code == 200
+        assert updated.headers["etag"] != etag
+
+        conflict = client.put(
+            "/v1/test/test_1", json={"test": {"name": "Again"}}, headers={"If-Match": etag}
+        )
+        assert conflict.status_code == 412
+        assert get_request_if_match("test_1") is None
+
+    def test_etag_helpers(self):
+        assert compute_etag([("a", None)]) is None
+        assert compute_etag([{"id": "a", "updated_at": "x"}]) == compute_etag(
+            [("a", "x")]
+        )
+        assert etag_matches("*", '"abc"', weak=False)
+        assert etag_matches('"x", W/"abc"', '"abc"')
+        assert not etag_matches('W/"abc"', '"abc"', weak=False)
+
+
+class TestProjectionPushdown:
+    """Plain-column projections are served from rows, not DTOs."""
+
+    class TestManager(TestConditionalRequests.TestManager):
+        __test__ = False
+        requested = []
+
+        def list(self, return_type="dto", **kwargs):
+            self.__class__.requested.append(return_type)
+            if return_type == "rows":
+                return [
+                    {"name": entity.name, "id": entity.id, "updated_at": entity.updated_at}
+                    for entity in self._data_store.values()
+                ]
+            return super().list(return_type=return_type, **kwargs)
+
+    @pytest.fixture
+    def client(self, model_registry):
+        self.TestManager._shared_store = {}
+        self.TestManager.requested = []
+        self.TestManager().create(name="First", value=1)
+        app = FastAPI()
+        app.include_router(create_router_from_manager(self.TestManager, model_registry))
+        return TestClient(app)
+
+    def test_list_fields_use_rows(self, client):
+        response = client.get("/v1/test", params={"fields": "name"})
+        assert response.json() == {"tests": [{"name": "First"}]}
+        assert response.headers["etag"] == compute_etag(
+            [("test_1", datetime(2026, 1, 1))], "fields=name"
+        )
+        assert self.TestManager.requested == ["rows"]
+
+    def test_includes_keep_dto_path(self, client):
+        client.get("/v1/test", params={"fields": "name", "include": "owner"})
+        client.get("/v1/test")
+        assert self.TestManager.requested == ["dto", "dto"]
+
+
+class TestResponseCacheRoutes:
+    """Opted-in GET/LIST routes answer repeats from the response cache."""
+
+    class TestManager(TestConditionalRequests.TestManager):
+        __test__ = False
+        response_cache_seconds = 60
+        DB = type("TestDB", (), {"__tablename__": "tests"})
+
+    @pytest.fixture
+    def client(self, model_registry, tmp_path):
+        self.TestManager._shared_store = {}
+        self.TestManager.loads = 0
+        self.TestManager().create(name="First", value=1)
+
+        cache = ResponseCache(path=str(tmp_path / "responses.db"))
+        app = FastAPI()
+        with patch("lib.Pydantic2FastAPI.response_cache_enabled", return_value=True):
+            app.include_router(
+                create_router_from_manager(self.TestManager, model_registry)
+            )
+        with patch("lib.Pydantic2FastAPI.response_cache", cache):
+            yield TestClient(app), cache
+
+    def test_repeat_reads_hit_cache_until_invalidated(self, client):
+        client, cache = client
+        first = client.get("/v1/test/test_1")
+        repeat = client.get("/v1/test/test_1")
+        assert repeat.content == first.content
+        assert repeat.headers["etag"] == first.headers["etag"]
+        assert self.TestManager.loads == 1
+
+        revalidated = client.get(
+            "/v1/test/test_1", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+
+        client.get("/v1/test/test_1", params={"fields": "name"})
+        client.get("/v1/test")
+        client.get("/v1/test")
+        assert self.TestManager.loads == 3
+
+        cache.invalidate("tests")
+        client.get("/v1/test/test_1")
+        assert self.TestManager.loads == 4
+
+
 class TestCompleteWorkflow:
     """Test complete workflow with real operations."""
 
@@ -41,6 +41,7 @@ from lib.AbstractPydantic2 import default_name_processor
 from lib.Environment import inflection
 from lib.Logging import logger
 from lib.Pydantic import ModelRegistry
+from lib.ResponseCache import register_invalidation_hooks
 
 # Type variable for generic models
 T = TypeVar("T", bound=BaseModel)
@@ -1454,7 +1455,17 @@ class DatabaseMixin:
         if declarative_base is None:
             raise ValueError("declarative_base cannot be None")
 
-        # Add debugging to help identify the issue
+        # Create a registry key based on the model and declarative base
+        registry_key = f"{cls.__module__}.{cls.__name__}"
+
+        # Fast path: this runs on every manager call, so a model that already
+        # exists is returned without logging or validation
+        pydantic_models = getattr(declarative_base, "_pydantic_models", None)
+        if isinstance(pydantic_models, dict):
+            sqlalchemy_model = pydantic_models.get(registry_key)
+            if sqlalchemy_model is not None:
+                return sqlalchemy_model
+
         logger.debug(
             f"DB method called for {cls.__name__} with declarative_base type: {type(declarative_base)}"
         )
@@ -1470,18 +1481,8 @@ class DatabaseMixin:
                 f"declarative_base must be a valid SQLAlchemy declarative base class, got {type(declarative_base)}"
             )
 
-        # Create a registry key based on the model and declarative base
-        registry_key = f"{cls.__module__}.{cls.__name__}"
-
-        # Check if we already have this model in the declarative base registry
-        if hasattr(declarative_base, "_pydantic_models"):
-            pydantic_models = getattr(declarative_base, "_pydantic_models", None)
-            if isinstance(pydantic_models, dict) and registry_key in pydantic_models:
-                return pydantic_models[registry_key]
-            elif not isinstance(pydantic_models, dict):
-                # Reset if it's not a proper dictionary
-                declarative_base._pydantic_models = {}
-        else:
+        # Reset the declarative base registry if it is missing or not a dictionary
+        if not isinstance(pydantic_models, dict):
             declarative_base._pydantic_models = {}
 
         # Get the model registry from the declarative base or database manager
@@ -1551,6 +1552,14 @@ class DatabaseMixin:
             )
             # If we can't store in the registry, that's okay - we'll just return the model without caching
 
+        # Let the model attach DB-level hooks to its newly created class
+        register_db_hooks = getattr(cls, "register_db_hooks", None)
+        if callable(register_db_hooks):
+            register_db_hooks(sqlalchemy_model)
+
+        # Stale cached responses that read this table on every write
+        register_invalidation_hooks(sqlalchemy_model)
+
         return sqlalchemy_model
 
     @classmethod
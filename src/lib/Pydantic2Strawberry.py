@@ -22,9 +22,11 @@ from types import ModuleType
 
 import strawberry
 import stringcase
-from broadcaster import Broadcast
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from strawberry.dataloader import DataLoader
 from strawberry.types import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment
 
 from lib.AbstractPydantic2 import (
     TypeIntrospector,
@@ -32,9 +34,14 @@ from lib.AbstractPydantic2 import (
     RelationshipAnalyzer,
     ErrorHandlerMixin,
 )
-from lib.Environment import inflection
+from lib.Environment import env, inflection
+from lib.GraphQLBroadcast import EventBus
+from lib.GraphQLContext import CONTEXT_KEY, GraphQLRequestContext, RequestScope
+from lib.GraphQLCost import QueryCostLimiter, list_limit
+from lib.GraphQLDocuments import DocumentCache, PersistedQueries, load_allowlist
 from lib.Logging import logger
 from lib.Pydantic import ModelRegistry
+from lib.RequestContext import reset_request_session, set_request_session
 from logic.AbstractLogicManager import AbstractBLLManager
 
 
@@ -136,6 +143,31 @@ TYPE_MAPPING = {
 # Create a shared type introspector instance
 _type_introspector: TypeIntrospector = TypeIntrospector()
 
+# Filter input suffixes and the search operators they translate to
+FILTER_OPERATORS: Dict[str, str] = {
+    "contains": "inc",
+    "equals": "eq",
+    "gt": "gt",
+    "lt": "lt",
+}
+
+
+@strawberry.type
+class BulkMutationError:
+    """An item of a bulk mutation that failed, by its position in the input."""
+
+    index: int
+    id: Optional[str]
+    error: str
+
+
+@strawberry.type
+class BulkDeleteResult:
+    """Outcome of a bulk delete mutation."""
+
+    deleted_ids: List[str]
+    errors: List[BulkMutationError]
+
 
 def convert_field_name(
     field_name: Optional[str], use_camelcase: bool = True
@@ -182,7 +214,7 @@ class GraphQLManager(ErrorHandlerMixin):
             raise ValueError("ModelRegistry instance is required")
 
         self.model_registry = model_registry
-        self.broadcast = Broadcast("memory://")
+        self.broadcast = EventBus()
 
         # Legacy generator references for backward compatibility with tests
         class MockGenerator:
@@ -246,9 +278,20 @@ class GraphQLManager(ErrorHandlerMixin):
         mutation_type = self._create_mutation_type()
         subscription_type = self._create_subscription_type()
 
-        # Create schema
+        # Create schema; documents are cached per worker, and every operation
+        # is costed and limited before it runs
+        self.documents = DocumentCache(
+            allowlist=load_allowlist(env("GQL_PERSISTED_QUERY_ALLOWLIST"))
+        )
         schema = strawberry.Schema(
-            query=query_type, mutation=mutation_type, subscription=subscription_type
+            query=query_type,
+            mutation=mutation_type,
+            subscription=subscription_type,
+            extensions=[
+                lambda: PersistedQueries(self.documents),
+                QueryCostLimiter,
+                lambda: RequestScope(self.model_registry),
+            ],
         )
 
         return schema
@@ -404,16 +447,30 @@ class GraphQLManager(ErrorHandlerMixin):
                 strict=True,
             )
 
+            # Users can only change themselves, so they get no bulk mutations
+            if "User" not in manager_class.__name__:
+                self.safe_operation(
+                    lambda: self._add_bulk_mutation_resolvers(
+                        inflection.plural(base_name),
+                        gql_type,
+                        manager_class,
+                        create_input,
+                        update_input,
+                    ),
+                    f"bulk mutation resolvers for {model_name}",
+                    strict=True,
+                )
+
             self.safe_operation(
                 lambda: (
                     self._add_subscription_resolver(
-                        f"{model_name_camel}Created", model_name
+                        f"{model_name_camel}Created", manager_class, "created"
                     ),
                     self._add_subscription_resolver(
-                        f"{model_name_camel}Updated", model_name
+                        f"{model_name_camel}Updated", manager_class, "updated"
                     ),
                     self._add_subscription_resolver(
-                        f"{model_name_camel}Deleted", model_name
+                        f"{model_name_camel}Deleted", manager_class, "deleted"
                     ),
                 ),
                 f"subscription resolvers for {model_name}",
@@ -621,6 +678,19 @@ class GraphQLManager(ErrorHandlerMixin):
                     resolver=make_resolver(pydantic_field_name)
                 )
 
+            # Resolve many-to-one references through the request's batch
+            # loader unless the parent already carries the related object
+            for relation_name, target_model in self._forward_relationships.get(
+                model_class, {}
+            ).items():
+                gql_field_name = convert_field_name(relation_name)
+                if gql_field_name in annotations:
+                    fields_dict[gql_field_name] = strawberry.field(
+                        resolver=self._create_navigation_resolver(
+                            model_class, target_model, relation_name
+                        )
+                    )
+
             # Add navigation resolver methods for reverse relationships
             if model_class in self._reverse_relationships:
                 for reverse_field_name, (
@@ -750,7 +820,9 @@ class GraphQLManager(ErrorHandlerMixin):
         # Create basic filter fields for string/numeric fields
         annotations: Dict[str, Type] = {}
         for field_name, field_info in model_class.model_fields.items():
-            field_type = field_info.annotation
+            field_type = _type_introspector.extract_optional_inner_type(
+                field_info.annotation
+            )
             if field_type == str:
                 annotations[f"{field_name}_contains"] = Optional[str]
                 annotations[f"{field_name}_equals"] = Optional[str]
@@ -763,7 +835,12 @@ class GraphQLManager(ErrorHandlerMixin):
         if not annotations:
             annotations["_dummy"] = Optional[str]
 
-        filter_class = type(filter_name, (), {"__annotations__": annotations})
+        # Every condition is optional; unset ones default to None
+        filter_fields: Dict[str, Any] = {
+            field_name: strawberry.field(default=None) for field_name in annotations
+        }
+        filter_class = type(filter_name, (), filter_fields)
+        filter_class.__annotations__ = annotations
         return strawberry.input(filter_class)
 
     def _is_already_optional(self, python_type: Type) -> bool:
@@ -902,12 +979,13 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
 
                     # For users, always query the requester (no ID parameter allowed)
-                    result = manager.get(id=requester_id, include=None, fields=None)
+                    fields, include = self._plan_selection(info, manager, "get")
+                    result = manager.get(
+                        id=requester_id, include=include, fields=fields
+                    )
                     return result
                 except Exception as e:
                     logger.error(f"Error in {field_name} resolver: {e}")
@@ -924,12 +1002,11 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
 
-                    # Call manager.get with just the ID
-                    result = manager.get(id=id, include=None, fields=None)
+                    # Load only what the query selects
+                    fields, include = self._plan_selection(info, manager, "get")
+                    result = manager.get(id=id, include=include, fields=fields)
                     return result
                 except Exception as e:
                     logger.error(f"Error in {field_name} resolver: {e}")
@@ -962,9 +1039,7 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
 
                     # If teamId is provided, return users in that team
                     if teamId:
@@ -974,17 +1049,21 @@ class GraphQLManager(ErrorHandlerMixin):
                             snake_key = stringcase.snakecase(key)
                             filter_params[snake_key] = value
 
+                        fields, include = self._plan_selection(info, manager, "list")
                         result = manager.list(
                             offset=offset or 0,
-                            limit=limit or 100,
-                            include=None,
-                            fields=None,
+                            limit=list_limit(limit),
+                            include=include,
+                            fields=fields,
                             **filter_params,
                         )
                         return result
                     else:
                         # No teamId provided - return only the requester
-                        user = manager.get(id=requester_id, include=None, fields=None)
+                        fields, include = self._plan_selection(info, manager, "get")
+                        user = manager.get(
+                            id=requester_id, include=include, fields=fields
+                        )
                         return [user] if user else []
                 except Exception as e:
                     logger.error(f"Error in {field_name} resolver: {e}")
@@ -1006,16 +1085,16 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
 
-                    # Call manager.list with pagination support
-                    result = manager.list(
+                    # Filter in SQL and load only what the query selects
+                    fields, include = self._plan_selection(info, manager, "search")
+                    result = manager.search(
                         offset=offset or 0,
-                        limit=limit or 100,
-                        include=None,
-                        fields=None,
+                        limit=list_limit(limit),
+                        include=include,
+                        fields=fields,
+                        **self._convert_filter_to_params(filter),
                     )
                     return result
                 except Exception as e:
@@ -1041,29 +1120,13 @@ class GraphQLManager(ErrorHandlerMixin):
                     raise Exception(
                         "Unable to authenticate user for GraphQL query - no requester_id found in context"
                     )
-                manager = manager_class(
-                    requester_id, model_registry=self.model_registry
-                )
+                manager = self._get_request_context(info).manager(manager_class)
                 data = self._convert_input_to_dict(input)
 
                 # Call manager.create with same signature as REST API
                 result = manager.create(**data)
 
-                # Broadcast subscription (convert to dict for JSON serialization)
-                try:
-                    if hasattr(result, "model_dump"):
-                        result_data = result.model_dump()
-                    elif hasattr(result, "dict"):
-                        result_data = result.dict()
-                    else:
-                        result_data = str(result)
-
-                    await self.broadcast.publish(
-                        channel=f"{return_type.__name__.lower()}_created",
-                        message=json.dumps({"action": "created", "data": result_data}),
-                    )
-                except Exception as e:
-                    logger.log("SQL", f"Failed to broadcast create event: {e}")
+                await self._publish_event(manager_class, "created", [result])
 
                 return result
             except Exception as e:
@@ -1093,9 +1156,7 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
                     logger.info(f"GraphQL update input: {input}")
                     logger.info(f"GraphQL update input type: {type(input)}")
                     logger.info(
@@ -1108,23 +1169,7 @@ class GraphQLManager(ErrorHandlerMixin):
                     # For users, always update the requester (no ID parameter allowed)
                     result = manager.update(requester_id, **data)
 
-                    # Broadcast subscription (convert to dict for JSON serialization)
-                    try:
-                        if hasattr(result, "model_dump"):
-                            result_data = result.model_dump()
-                        elif hasattr(result, "dict"):
-                            result_data = result.dict()
-                        else:
-                            result_data = str(result)
-
-                        await self.broadcast.publish(
-                            channel=f"{return_type.__name__.lower()}_updated",
-                            message=json.dumps(
-                                {"action": "updated", "data": result_data}
-                            ),
-                        )
-                    except Exception as e:
-                        logger.log("SQL", f"Failed to broadcast update event: {e}")
+                    await self._publish_event(manager_class, "updated", [result])
 
                     return result
                 except Exception as e:
@@ -1142,31 +1187,13 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
                     data = self._convert_input_to_dict(input)
 
                     # Call manager.update with same signature as REST API
                     result = manager.update(id, **data)
 
-                    # Broadcast subscription (convert to dict for JSON serialization)
-                    try:
-                        if hasattr(result, "model_dump"):
-                            result_data = result.model_dump()
-                        elif hasattr(result, "dict"):
-                            result_data = result.dict()
-                        else:
-                            result_data = str(result)
-
-                        await self.broadcast.publish(
-                            channel=f"{return_type.__name__.lower()}_updated",
-                            message=json.dumps(
-                                {"action": "updated", "data": result_data}
-                            ),
-                        )
-                    except Exception as e:
-                        logger.log("SQL", f"Failed to broadcast update event: {e}")
+                    await self._publish_event(manager_class, "updated", [result])
 
                     return result
                 except Exception as e:
@@ -1190,23 +1217,14 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
 
                     # For users, always delete the requester (no ID parameter allowed)
                     result = manager.delete(id=requester_id)
 
-                    # Broadcast subscription (convert to dict for JSON serialization)
-                    try:
-                        await self.broadcast.publish(
-                            channel=f"{manager_class.__name__.lower()}_deleted",
-                            message=json.dumps(
-                                {"action": "deleted", "id": requester_id}
-                            ),
-                        )
-                    except Exception as e:
-                        logger.log("SQL", f"Failed to broadcast delete event: {e}")
+                    await self._publish_event(
+                        manager_class, "deleted", [{"id": requester_id}]
+                    )
 
                     return True
                 except Exception as e:
@@ -1224,21 +1242,12 @@ class GraphQLManager(ErrorHandlerMixin):
                         raise Exception(
                             "Unable to authenticate user for GraphQL query - no requester_id found in context"
                         )
-                    manager = manager_class(
-                        requester_id, model_registry=self.model_registry
-                    )
+                    manager = self._get_request_context(info).manager(manager_class)
 
                     # Call manager.delete with same signature as REST API
                     result = manager.delete(id=id)
 
-                    # Broadcast subscription (convert to dict for JSON serialization)
-                    try:
-                        await self.broadcast.publish(
-                            channel=f"{manager_class.__name__.lower()}_deleted",
-                            message=json.dumps({"action": "deleted", "id": id}),
-                        )
-                    except Exception as e:
-                        logger.log("SQL", f"Failed to broadcast delete event: {e}")
+                    await self._publish_event(manager_class, "deleted", [{"id": id}])
 
                     return True
                 except Exception as e:
@@ -1247,31 +1256,344 @@ class GraphQLManager(ErrorHandlerMixin):
 
             self._mutation_fields[field_name] = strawberry.field(resolver)
 
-    def _add_subscription_resolver(self, field_name: str, model_name: str) -> None:
-        """Add a subscription resolver for model events"""
+    def _run_bulk(
+        self,
+        info: Info,
+        manager_class: Type[AbstractBLLManager],
+        operations: List[Tuple[Optional[str], Callable[[Any], Any]]],
+    ) -> Tuple[List[Any], List[BulkMutationError]]:
+        """Run ``(id, operation)`` pairs against the request's manager in one transaction.
+
+        Each operation gets its own savepoint, so one that fails is rolled
+        back and reported by its index while the others commit together.
+        """
+        max_items = int(env("BULK_MUTATION_MAX_ITEMS"))
+        if len(operations) > max_items:
+            raise Exception(f"At most {max_items} items may be sent at once")
+
+        manager = self._get_request_context(info).manager(manager_class)
+        results: List[Any] = []
+        errors: List[BulkMutationError] = []
+        with self.model_registry.DB.manager.batch_session() as session:
+            token = set_request_session(session)
+            try:
+                for index, (entity_id, operation) in enumerate(operations):
+                    savepoint = session.begin_nested()
+                    try:
+                        results.append(operation(manager))
+                        savepoint.commit()
+                    except Exception as e:
+                        if savepoint.is_active:
+                            savepoint.rollback()
+                        errors.append(
+                            BulkMutationError(
+                                index=index,
+                                id=entity_id,
+                                error=str(getattr(e, "detail", e)),
+                            )
+                        )
+            finally:
+                reset_request_session(token)
+        return results, errors
+
+    def _add_bulk_mutation_resolvers(
+        self,
+        plural_name: str,
+        return_type: Type,
+        manager_class: Type[AbstractBLLManager],
+        create_input: Type,
+        update_input: Type,
+    ) -> None:
+        """Add createMany/updateMany/deleteMany mutations for a model.
+
+        Each runs all of its items in one transaction, publishes one event
+        batch after it commits, and reports failed items instead of failing
+        the whole mutation.
+        """
+        result_type = strawberry.type(
+            type(
+                f"{return_type.__name__}BulkResult",
+                (),
+                {
+                    "__annotations__": {
+                        "items": List[return_type],
+                        "errors": List[BulkMutationError],
+                    }
+                },
+            )
+        )
+        update_item_type = strawberry.input(
+            type(
+                f"{return_type.__name__}UpdateManyInput",
+                (),
+                {"__annotations__": {"id": str, "input": update_input}},
+            )
+        )
+
+        def require_requester(info: Info) -> None:
+            if not self._get_context_from_info(info).get("requester_id"):
+                raise Exception(
+                    "Unable to authenticate user for GraphQL query - no requester_id found in context"
+                )
+
+        async def create_many_resolver(
+            input: List[create_input], info: Info
+        ) -> result_type:
+            require_requester(info)
+            operations = []
+            for item in input:
+                data = self._convert_input_to_dict(item)
+                operations.append(
+                    (None, lambda manager, data=data: manager.create(**data))
+                )
+            results, errors = self._run_bulk(info, manager_class, operations)
+            await self._publish_event(manager_class, "created", results)
+            return result_type(items=results, errors=errors)
+
+        async def update_many_resolver(
+            items: List[update_item_type], info: Info
+        ) -> result_type:
+            require_requester(info)
+            operations = []
+            for item in items:
+                data = self._convert_input_to_dict(item.input)
+                operations.append(
+                    (
+                        item.id,
+                        lambda manager, id=item.id, data=data: manager.update(
+                            id, **data
+                        ),
+                    )
+                )
+            results, errors = self._run_bulk(info, manager_class, operations)
+            await self._publish_event(manager_class, "updated", results)
+            return result_type(items=results, errors=errors)
+
+        async def delete_many_resolver(ids: List[str], info: Info) -> BulkDeleteResult:
+            require_requester(info)
+            operations = [
+                (id, lambda manager, id=id: manager.delete(id=id) or id) for id in ids
+            ]
+            deleted, errors = self._run_bulk(info, manager_class, operations)
+            await self._publish_event(
+                manager_class, "deleted", [{"id": id} for id in deleted]
+            )
+            return BulkDeleteResult(deleted_ids=deleted, errors=errors)
+
+        self._mutation_fields[f"createMany{plural_name}"] = strawberry.field(
+            create_many_resolver
+        )
+        self._mutation_fields[f"updateMany{plural_name}"] = strawberry.field(
+            update_many_resolver
+        )
+        self._mutation_fields[f"deleteMany{plural_name}"] = strawberry.field(
+            delete_many_resolver
+        )
+
+    @staticmethod
+    def _event_channel(manager_class: Type[AbstractBLLManager], action: str) -> str:
+        return f"{manager_class.__name__.lower()}_{action}"
+
+    async def _publish_event(
+        self, manager_class: Type[AbstractBLLManager], action: str, results: List[Any]
+    ) -> None:
+        """Announce the results of a mutation to subscribers on every worker.
+
+        All results go out as one message, which subscribers split again.
+        Failures are logged and swallowed so a broadcast problem never fails
+        the mutation that triggered it.
+        """
+        if not results:
+            return
+        try:
+            items = []
+            for result in results:
+                if hasattr(result, "model_dump"):
+                    data = result.model_dump()
+                elif hasattr(result, "dict"):
+                    data = result.dict()
+                else:
+                    data = result
+                entity_id = data.get("id") if isinstance(data, dict) else None
+                items.append({"id": entity_id, "data": data})
+            await self.broadcast.publish(
+                self._event_channel(manager_class, action),
+                {"action": action, "items": items},
+            )
+        except Exception as e:
+            logger.log("SQL", f"Failed to broadcast {action} event: {e}")
+
+    def _add_subscription_resolver(
+        self,
+        field_name: str,
+        manager_class: Type[AbstractBLLManager],
+        action: str,
+    ) -> None:
+        """Add a subscription resolver for one kind of model event.
+
+        Events are filtered per subscriber: only those about records the
+        subscriber may VIEW are sent, checked with one query per published
+        batch. Deletions are checked against the soft-deleted row, so they
+        reach whoever could see the record.
+        """
+        channel = self._event_channel(manager_class, action)
 
-        async def resolver() -> AsyncGenerator[str, None]:
-            channel = f"{model_name.lower()}_created"  # Simplified for now
-            async with self.broadcast.subscribe(channel=channel) as subscriber:
-                async for event in subscriber:
-                    yield event.message
+        async def resolver(info: Info) -> AsyncGenerator[str, None]:
+            requester_id = self._get_context_from_info(info).get("requester_id")
+            if not requester_id:
+                raise Exception(
+                    "Unable to authenticate user for GraphQL subscription - no requester_id found in context"
+                )
+            db_class = self.model_registry.apply(manager_class.Model).DB(
+                self.model_registry.DB.manager.Base
+            )
+
+            def visible(ids: List[str]) -> Set[str]:
+                return db_class.visible_ids(
+                    requester_id=requester_id,
+                    model_registry=self.model_registry,
+                    ids=ids,
+                )
+
+            async with self.broadcast.subscribe(channel) as subscription:
+                async for message in subscription:
+                    items = [item for item in message["items"] if item.get("id")]
+                    if not items:
+                        continue
+                    allowed = await run_in_threadpool(
+                        visible, [item["id"] for item in items]
+                    )
+                    for item in items:
+                        if item["id"] in allowed:
+                            yield json.dumps(
+                                {"action": action, **item}, default=str
+                            )
 
         self._subscription_fields[field_name] = strawberry.subscription(resolver)
 
     def _convert_filter_to_params(self, filter_obj: Optional[Any]) -> Dict[str, Any]:
-        """Convert filter object to search parameters"""
+        """Convert a generated filter input into ``search`` parameters.
+
+        ``name_contains`` becomes ``{"name": {"inc": ...}}``, ``_equals``
+        maps to ``eq`` and ``_gt``/``_lt`` to the numeric comparisons, so the
+        filter is applied in SQL by ``build_search_filters``.
+        """
         if not filter_obj:
             return {}
 
-        params: Dict[str, Any] = {}
-        for attr_name in dir(filter_obj):
-            if not attr_name.startswith("_"):
-                value = getattr(filter_obj, attr_name)
-                if value is not None:
-                    params[attr_name] = value
+        params: Dict[str, Dict[str, Any]] = {}
+        for attr_name, value in vars(filter_obj).items():
+            if value is None or attr_name.startswith("_"):
+                continue
+            field_name, _, suffix = attr_name.rpartition("_")
+            operator = FILTER_OPERATORS.get(suffix)
+            if field_name and operator:
+                params.setdefault(field_name, {})[operator] = value
 
         return params
 
+    @staticmethod
+    def _selected_subfields(selections: Optional[List[Any]]) -> List[Any]:
+        """Flatten fragment spreads and inline fragments into their fields."""
+        fields: List[Any] = []
+        for selection in selections or []:
+            if isinstance(selection, (FragmentSpread, InlineFragment)):
+                fields.extend(GraphQLManager._selected_subfields(selection.selections))
+            else:
+                fields.append(selection)
+        return fields
+
+    def _plan_selection(
+        self, info: Info, manager: AbstractBLLManager, method: str
+    ) -> Tuple[Optional[List[str]], List[str]]:
+        """Derive ``fields`` and ``include`` for ``manager`` from the selection set.
+
+        Selected columns become a ``load_only`` projection and selected
+        relationships become eager loads, nested up to ``INCLUDE_MAX_DEPTH``
+        and capped at ``INCLUDE_MAX_COUNT``. A many-to-one field that is not
+        loaded eagerly keeps its foreign key so the batch loader can resolve
+        it. The projection is dropped (None) when a selected model field is
+        not a column, since it may be computed from others, and when the
+        manager overrides ``method``, since overrides return dicts for
+        ``fields`` as the REST endpoints expect.
+
+        Args:
+            info: Resolver info carrying the selection set
+            manager: Manager the resolver reads through
+            method: Name of the manager method that will be called
+
+        Returns:
+            Tuple of (fields, include)
+        """
+        selected = getattr(info, "selected_fields", None)
+        mapper = getattr(manager.DB, "__mapper__", None)
+        if not selected or mapper is None:
+            return None, []
+
+        include: List[str] = []
+        self._plan_includes(selected[0].selections, mapper, manager.Model, "", include)
+
+        if getattr(type(manager), method, None) is not getattr(
+            AbstractBLLManager, method
+        ):
+            return None, include
+
+        columns = set(mapper.columns.keys())
+        model_fields = getattr(manager.Model, "model_fields", {})
+        fields: Set[str] = {"id"}
+        for selection in self._selected_subfields(selected[0].selections):
+            if selection.name.startswith("__"):
+                continue
+            name = stringcase.snakecase(selection.name)
+            if name in columns:
+                fields.add(name)
+            elif name in include:
+                continue
+            elif f"{name}_id" in columns:
+                fields.add(f"{name}_id")
+            elif name in model_fields and name not in mapper.relationships:
+                return None, include
+
+        return sorted(fields), include
+
+    def _plan_includes(
+        self,
+        selections: Optional[List[Any]],
+        mapper: Any,
+        model_class: Optional[Type[BaseModel]],
+        prefix: str,
+        include: List[str],
+    ) -> None:
+        """Append selected relationships that ``model_class`` exposes to ``include`` as dot paths."""
+        model_fields = getattr(model_class, "model_fields", {})
+        max_count = int(env("INCLUDE_MAX_COUNT"))
+        max_depth = int(env("INCLUDE_MAX_DEPTH"))
+        for selection in self._selected_subfields(selections):
+            name = stringcase.snakecase(selection.name)
+            if (
+                name not in mapper.relationships
+                or name not in model_fields
+                or len(include) >= max_count
+            ):
+                continue
+            path = f"{prefix}{name}"
+            if path.count(".") >= max_depth:
+                continue
+            include.append(path)
+
+            target_type = _type_introspector.extract_optional_inner_type(
+                model_fields[name].annotation
+            )
+            if _type_introspector.is_list_type(target_type):
+                target_type = _type_introspector.extract_list_inner_type(target_type)
+            self._plan_includes(
+                selection.selections,
+                mapper.relationships[name].mapper,
+                target_type if self._is_pydantic_model(target_type) else None,
+                f"{path}.",
+                include,
+            )
+
     def _get_context_from_info(self, info: Info) -> Dict[str, Any]:
         """Extract context from GraphQL Info object"""
         context: Dict[str, Any] = {}
@@ -1338,12 +1660,32 @@ class GraphQLManager(ErrorHandlerMixin):
                                     f"Failed to authenticate user from GraphQL context: {e}",
                                 )
 
-        # Set requester_id in context if found
+        # Set requester_id in context if found, and remember it for the rest
+        # of the request so later resolvers do not authenticate again
         if requester_id:
             context["requester_id"] = requester_id
+            if isinstance(getattr(info, "context", None), dict):
+                info.context["requester_id"] = requester_id
 
         return context
 
+    def _get_request_context(self, info: Info) -> GraphQLRequestContext:
+        """Return the request's shared requester and manager pool, creating it on first use.
+
+        Like the batch loaders it lives in the GraphQL context; without a dict
+        context every call gets a fresh one.
+        """
+        context = getattr(info, "context", None)
+        request = context.get(CONTEXT_KEY) if isinstance(context, dict) else None
+        if request is None:
+            request = GraphQLRequestContext(
+                self.model_registry,
+                self._get_context_from_info(info).get("requester_id"),
+            )
+            if isinstance(context, dict):
+                context[CONTEXT_KEY] = request
+        return request
+
     def _convert_input_to_dict(self, input_obj: Any) -> Dict[str, Any]:
         """Convert input object to dictionary, converting camelCase keys to snake_case for Python/Pydantic compatibility"""
         if hasattr(input_obj, "model_dump"):
@@ -1591,6 +1933,82 @@ class GraphQLManager(ErrorHandlerMixin):
 
         return None
 
+    def _get_loader(
+        self, info: Info, key: Tuple[Any, ...], load_fn: Callable
+    ) -> DataLoader:
+        """Return the request-scoped DataLoader for ``key``, creating it on first use.
+
+        Loaders live in the GraphQL context, so their batches and caches last
+        exactly as long as the request. Without a dict context every call
+        gets a fresh loader, which is correct but does not batch.
+        """
+        context = getattr(info, "context", None)
+        if not isinstance(context, dict):
+            return DataLoader(load_fn, max_batch_size=int(env("BATCH_GET_MAX_IDS")))
+        loaders = context.setdefault("loaders", {})
+        if key not in loaders:
+            loaders[key] = DataLoader(
+                load_fn, max_batch_size=int(env("BATCH_GET_MAX_IDS"))
+            )
+        return loaders[key]
+
+    def _id_loader(
+        self, info: Info, target_model: Type[BaseModel]
+    ) -> Optional[DataLoader]:
+        """Loader resolving ``target_model`` ids with one ``batch_get`` per batch."""
+        request = self._get_request_context(info)
+        manager_class = self._get_manager_for_model(target_model)
+        if not request.requester_id or not manager_class:
+            return None
+
+        async def load(ids: List[str]) -> List[Optional[Any]]:
+            manager = request.manager(manager_class)
+            found, _ = manager.batch_get(ids=ids)
+            by_id = {str(item.id): item for item in found}
+            return [by_id.get(str(entity_id)) for entity_id in ids]
+
+        return self._get_loader(info, ("id", target_model), load)
+
+    def _foreign_key_loader(
+        self,
+        info: Info,
+        source_model: Type[BaseModel],
+        foreign_key: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Optional[DataLoader]:
+        """Loader for pages of ``source_model`` rows grouped by ``foreign_key``.
+
+        Each batch is one ``IN`` query that keeps at most ``limit`` rows per
+        parent in SQL, so the window is part of the loader key. ``limit`` is
+        resolved with ``list_limit``, as the cost analysis counts it, and
+        capped at ``GQL_NAVIGATION_MAX_ITEMS``.
+        """
+        request = self._get_request_context(info)
+        manager_class = self._get_manager_for_model(source_model)
+        if not request.requester_id or not manager_class:
+            return None
+        max_items = int(env("GQL_NAVIGATION_MAX_ITEMS"))
+        limit = min(list_limit(limit), max_items)
+        offset = max(offset or 0, 0)
+
+        async def load(parent_ids: List[str]) -> List[List[Any]]:
+            manager = request.manager(manager_class)
+            column = getattr(manager.DB, foreign_key)
+            grouped: Dict[str, List[Any]] = {}
+            for item in manager.list(
+                filters=[column.in_(parent_ids)],
+                partition_by=foreign_key,
+                limit=limit,
+                offset=offset,
+            ):
+                grouped.setdefault(str(getattr(item, foreign_key)), []).append(item)
+            return [grouped.get(str(parent_id), []) for parent_id in parent_ids]
+
+        return self._get_loader(
+            info, ("fk", source_model, foreign_key, limit, offset), load
+        )
+
     def _create_navigation_resolver(
         self,
         source_model: Type[BaseModel],
@@ -1598,38 +2016,25 @@ class GraphQLManager(ErrorHandlerMixin):
         field_name: str,
         is_reverse: bool = False,
     ) -> Callable:
-        """Create a resolver for navigation properties."""
+        """Create a resolver for navigation properties.
+
+        Lookups go through the request's batch loaders, so resolving the
+        field for every item of a list costs one query per relation.
+        """
+        manager_ref: "GraphQLManager" = self
 
         if is_reverse:
             # Reverse navigation (one-to-many)
             async def reverse_resolver(
-                self, info: Info, limit: Optional[int] = 100, offset: Optional[int] = 0
+                root, info: Info, limit: Optional[int] = 100, offset: Optional[int] = 0
             ) -> List[target_model]:
                 try:
-                    context = self._get_context_from_info(info)
-                    requester_id = context.get("requester_id")
-
-                    if not requester_id:
-                        raise Exception("Authentication required")
-
-                    # Get the manager for the target model
-                    manager_class = self._get_manager_for_model(target_model)
-                    if not manager_class:
-                        return []
-
-                    manager = manager_class(
-                        requester_id=requester_id, model_registry=self.model_registry
+                    loader = manager_ref._foreign_key_loader(
+                        info, target_model, f"{field_name}_id", limit, offset
                     )
-
-                    # Build filter based on the foreign key
-                    foreign_key_field = f"{field_name}_id"
-                    filter_params = {foreign_key_field: self.id}
-
-                    # Get the related items
-                    results = manager.list(limit=limit, offset=offset, **filter_params)
-
-                    return results
-
+                    if loader is None:
+                        return []
+                    return await loader.load(root.id)
                 except Exception as e:
                     logger.error(f"Error in reverse navigation resolver: {e}")
                     return []
@@ -1637,43 +2042,21 @@ class GraphQLManager(ErrorHandlerMixin):
             return reverse_resolver
         else:
             # Forward navigation (many-to-one)
-            async def forward_resolver(self, info: Info) -> Optional[target_model]:
+            async def forward_resolver(root, info: Info) -> Any:
                 try:
-                    # Check if we already have the object loaded
-                    if (
-                        hasattr(self, field_name)
-                        and getattr(self, field_name) is not None
-                    ):
-                        return getattr(self, field_name)
+                    # Use the object if it was already loaded with the parent
+                    loaded = getattr(root, field_name, None)
+                    if loaded is not None:
+                        return loaded
 
-                    # Get the foreign key value
-                    foreign_key = getattr(self, f"{field_name}_id", None)
+                    foreign_key = getattr(root, f"{field_name}_id", None)
                     if not foreign_key:
                         return None
 
-                    context = self._get_context_from_info(info)
-                    requester_id = context.get("requester_id")
-
-                    if not requester_id:
-                        raise Exception("Authentication required")
-
-                    # Get the manager for the target model
-                    manager_class = self._get_manager_for_model(target_model)
-                    if not manager_class:
+                    loader = manager_ref._id_loader(info, target_model)
+                    if loader is None:
                         return None
-
-                    manager = manager_class(
-                        requester_id=requester_id, model_registry=self.model_registry
-                    )
-
-                    # Get the related item
-                    result = manager.get(id=foreign_key)
-
-                    # Cache it on the object for future access
-                    setattr(self, field_name, result)
-
-                    return result
-
+                    return await loader.load(foreign_key)
                 except Exception as e:
                     logger.error(f"Error in forward navigation resolver: {e}")
                     return None
@@ -1692,34 +2075,22 @@ class GraphQLManager(ErrorHandlerMixin):
         manager_ref: "GraphQLManager" = self
 
         async def resolver(
-            self, info: Info, limit: Optional[int] = 100, offset: Optional[int] = 0
+            root, info: Info, limit: Optional[int] = 100, offset: Optional[int] = 0
         ):
             try:
-                context = manager_ref._get_context_from_info(info)
-                requester_id = context.get("requester_id")
-
-                if not requester_id:
-                    logger.error("No requester_id found in GraphQL context")
-                    return []
-
-                # Get the manager for the source model
-                manager_class = manager_ref._get_manager_for_model(source_model)
-                if not manager_class:
-                    logger.error(f"No manager found for model {source_model}")
-                    return []
-
-                manager = manager_class(
-                    requester_id=requester_id, model_registry=manager_ref.model_registry
+                loader = manager_ref._foreign_key_loader(
+                    info, source_model, f"{source_field}_id", limit, offset
                 )
+                if loader is None:
+                    logger.error(
+                        f"Cannot resolve {reverse_field_name}: no requester_id in "
+                        f"GraphQL context or no manager for {source_model}"
+                    )
+                    return []
 
-                # Build filter based on the foreign key
-                foreign_key_field = f"{source_field}_id"
-                filter_params = {foreign_key_field: self.id}
-
-                # Get the related items
-                results = manager.list(limit=limit, offset=offset, **filter_params)
-
-                return results
+                # All parents asking for the same page share one IN query
+                # that is windowed per parent
+                return await loader.load(root.id)
 
             except Exception as e:
                 logger.error(
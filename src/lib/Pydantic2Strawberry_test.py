@@ -23,6 +23,7 @@ from lib.Pydantic2Strawberry import (
     enum_serializer,
     convert_field_name,
 )
+from logic.AbstractLogicManager import AbstractBLLManager
 
 
 # Test models that are referenced throughout the tests
@@ -712,3 +713,384 @@ class TestEnumHandling(AbstractPydanticTestMixin):
         finally:
             # Restore original behavior
             TestEnumWithIssue.__iter__ = original_iter
+
+
+class TestNavigationLoaders(AbstractPydanticTestMixin):
+    """Navigation resolvers batch through request-scoped DataLoaders."""
+
+    class FakeColumn:
+        def in_(self, values):
+            return ("in", tuple(values))
+
+    def _manager_class(self, calls):
+        column = self.FakeColumn()
+        children = [
+            ChildModel(id="c1", name="a", parent_id="p1"),
+            ChildModel(id="c2", name="b", parent_id="p1"),
+            ChildModel(id="c3", name="c", parent_id="p2"),
+        ]
+
+        class FakeManager:
+            DB = type("DB", (), {"parent_id": column})
+
+            def __init__(self, requester_id, model_registry):
+                pass
+
+            def list(self, filters=None, partition_by=None, limit=None, offset=None):
+                calls.append(("list", filters, partition_by, limit, offset))
+                ids = filters[0][1]
+                pages = {}
+                for child in children:
+                    if child.parent_id in ids:
+                        pages.setdefault(getattr(child, partition_by), []).append(child)
+                return [
+                    child
+                    for page in pages.values()
+                    for child in page[offset : offset + limit]
+                ]
+
+            def batch_get(self, ids, include=None, fields=None):
+                calls.append(("batch_get", list(ids)))
+                return [ParentModel(id=id, name=id) for id in ids if id != "gone"], []
+
+        return FakeManager
+
+    def _graphql_manager(self, calls):
+        manager = GraphQLManager(MagicMock(spec=ModelRegistry))
+        manager._get_manager_for_model = lambda model: self._manager_class(calls)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_reverse_navigation_uses_one_query(self):
+        import asyncio
+
+        calls = []
+        manager = self._graphql_manager(calls)
+        resolver = manager._create_navigation_resolver(
+            ChildModel, ChildModel, "parent", is_reverse=True
+        )
+        info = MagicMock(context={"requester_id": "u1"})
+        parents = [ParentModel(id=id, name=id) for id in ("p1", "p2", "p3")]
+
+        results = await asyncio.gather(
+            *(resolver(parent, info) for parent in parents),
+            resolver(parents[0], info, limit=1, offset=1),
+        )
+
+        assert [[child.id for child in result] for result in results] == [
+            ["c1", "c2"],
+            ["c3"],
+            [],
+            ["c2"],
+        ]
+        assert calls == [
+            ("list", [("in", ("p1", "p2", "p3"))], "parent_id", 100, 0),
+            ("list", [("in", ("p1",))], "parent_id", 1, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reverse_navigation_caps_page_size(self):
+        from unittest.mock import patch
+
+        calls = []
+        manager = self._graphql_manager(calls)
+        resolver = manager._create_navigation_resolver(
+            ChildModel, ChildModel, "parent", is_reverse=True
+        )
+        info = MagicMock(context={"requester_id": "u1"})
+        parent = ParentModel(id="p1", name="p1")
+
+        settings = {"BATCH_GET_MAX_IDS": "100", "GQL_NAVIGATION_MAX_ITEMS": "1"}
+        with patch("lib.Pydantic2Strawberry.env", side_effect=settings.get):
+            result = await resolver(parent, info, limit=None)
+
+        assert [child.id for child in result] == ["c1"]
+        assert calls == [("list", [("in", ("p1",))], "parent_id", 1, 0)]
+
+    @pytest.mark.asyncio
+    async def test_forward_navigation_batches_and_caches(self):
+        import asyncio
+
+        calls = []
+        manager = self._graphql_manager(calls)
+        resolver = manager._create_navigation_resolver(
+            ChildModel, ParentModel, "parent"
+        )
+        info = MagicMock(context={"requester_id": "u1"})
+        rows = [
+            ChildModel(id="c1", name="a", parent_id="p1"),
+            ChildModel(id="c2", name="b", parent_id="p2"),
+            ChildModel(id="c3", name="c", parent_id="p1"),
+            ChildModel(id="c4", name="d", parent_id="gone"),
+            ChildModel(id="c5", name="e"),
+        ]
+
+        first = await asyncio.gather(*(resolver(row, info) for row in rows))
+        again = await resolver(rows[0], info)
+
+        assert [parent.id if parent else None for parent in first] == [
+            "p1",
+            "p2",
+            "p1",
+            None,
+            None,
+        ]
+        assert again.id == "p1"
+        assert calls == [("batch_get", ["p1", "p2", "gone"])]
+
+
+class PlanParentModel(BaseModel):
+    id: str
+    name: str
+    children: List["PlanChildModel"] = Field(default_factory=list)
+
+
+class PlanChildModel(BaseModel):
+    id: str
+    name: str
+    score: Optional[int] = None
+    label: Optional[str] = None
+    parent_id: Optional[str] = None
+    parent: Optional[PlanParentModel] = None
+
+
+PlanParentModel.model_rebuild()
+
+
+@pytest.fixture(scope="module")
+def tables():
+    from sqlalchemy import Column, ForeignKey, Integer, String
+    from sqlalchemy.orm import declarative_base, relationship
+
+    Base = declarative_base()
+
+    class PlanParent(Base):
+        __tablename__ = "plan_parent"
+        id = Column(String, primary_key=True)
+        name = Column(String)
+        children = relationship("PlanChild", back_populates="parent")
+
+    class PlanChild(Base):
+        __tablename__ = "plan_child"
+        id = Column(String, primary_key=True)
+        name = Column(String)
+        score = Column(Integer)
+        parent_id = Column(String, ForeignKey("plan_parent.id"))
+        parent = relationship(PlanParent, back_populates="children")
+
+    return PlanChild
+
+
+class TestSelectionPlanning(AbstractPydanticTestMixin):
+    """Query and list resolvers load what the selection set asks for."""
+
+    @staticmethod
+    def _field(name, *selections):
+        from strawberry.types.nodes import SelectedField
+
+        return SelectedField(name, {}, {}, list(selections))
+
+    def _info(self, *selections):
+        return MagicMock(
+            context={"requester_id": "u1"},
+            selected_fields=[self._field("planChildren", *selections)],
+        )
+
+    def _plan(self, tables, *selections):
+        manager_class = type(
+            "PlanChildManager",
+            (),
+            {"DB": tables, "Model": PlanChildModel, "get": AbstractBLLManager.get},
+        )
+        return GraphQLManager(MagicMock(spec=ModelRegistry))._plan_selection(
+            self._info(*selections), manager_class(), "get"
+        )
+
+    def test_selected_columns_become_fields(self, tables):
+        fields, include = self._plan(
+            tables, self._field("name"), self._field("parentId")
+        )
+        assert fields == ["id", "name", "parent_id"]
+        assert include == []
+
+    def test_selected_relations_become_includes(self, tables):
+        fields, include = self._plan(
+            tables,
+            self._field("name"),
+            self._field("parent", self._field("children", self._field("score"))),
+        )
+        assert fields == ["id", "name"]
+        assert include == ["parent", "parent.children"]
+
+    def test_relations_over_the_cap_keep_their_foreign_key(self, tables):
+        from unittest.mock import patch
+
+        with patch("lib.Pydantic2Strawberry.env", return_value="0"):
+            fields, include = self._plan(
+                tables, self._field("parent", self._field("name"))
+            )
+        assert include == []
+        assert fields == ["id", "parent_id"]
+
+    def test_fragments_are_flattened(self, tables):
+        from strawberry.types.nodes import InlineFragment
+
+        fields, _ = self._plan(
+            tables,
+            InlineFragment("PlanChildType", [self._field("score")], {}),
+            self._field("__typename"),
+        )
+        assert fields == ["id", "score"]
+
+    def test_non_column_field_disables_projection(self, tables):
+        fields, _ = self._plan(tables, self._field("name"), self._field("label"))
+        assert fields is None
+
+    def test_overridden_read_keeps_includes_only(self, tables):
+        class PlanChildManager:
+            DB = tables
+            Model = PlanChildModel
+
+            def get(self, **kwargs):
+                return None
+
+        fields, include = GraphQLManager(MagicMock(spec=ModelRegistry))._plan_selection(
+            self._info(self._field("name"), self._field("parent")),
+            PlanChildManager(),
+            "get",
+        )
+        assert fields is None
+        assert include == ["parent"]
+
+    def test_filter_becomes_search_params(self):
+        manager = GraphQLManager(MagicMock(spec=ModelRegistry))
+        filter_type = manager._create_filter_type_from_model(PlanChildModel)
+        params = manager._convert_filter_to_params(
+            filter_type(name_contains="a", score_gt=1, score_lt=5)
+        )
+        assert params == {"name": {"inc": "a"}, "score": {"gt": 1, "lt": 5}}
+        assert manager._convert_filter_to_params(None) == {}
+
+    @pytest.mark.asyncio
+    async def test_list_resolver_pushes_plan_into_search(self, tables):
+        from unittest.mock import patch
+
+        calls = []
+
+        def search(self, **kwargs):
+            calls.append(kwargs)
+            return []
+
+        manager = GraphQLManager(MagicMock(spec=ModelRegistry))
+        filter_type = manager._create_filter_type_from_model(PlanChildModel)
+
+        with patch.object(AbstractBLLManager, "search", search):
+
+            class PlanChildManager:
+                DB = tables
+                Model = PlanChildModel
+                search = AbstractBLLManager.search
+
+                def __init__(self, requester_id, model_registry):
+                    pass
+
+            manager._add_list_query_resolver(
+                "planChildren", PlanChildModel, PlanChildManager, filter_type
+            )
+            resolver = manager._query_fields["planChildren"].base_resolver
+            await resolver.wrapped_func(
+                filter=filter_type(name_equals="a"),
+                limit=5,
+                info=self._info(self._field("name")),
+            )
+
+        assert calls == [
+            {
+                "offset": 0,
+                "limit": 5,
+                "include": [],
+                "fields": ["id", "name"],
+                "name": {"eq": "a"},
+            }
+        ]
+
+
+class TestBulkMutations(AbstractPydanticTestMixin):
+    """Bulk mutations share one transaction and report failed items."""
+
+    class BulkManager:
+        def __init__(self, requester_id, model_registry):
+            pass
+
+        def create(self, **data):
+            if data["name"] == "bad":
+                raise ValueError("name is not allowed")
+            return ParentModel(id=f"id-{data['name']}", name=data["name"])
+
+        def delete(self, id):
+            if id == "missing":
+                raise ValueError("not found")
+
+    def _graphql_manager(self):
+        from unittest.mock import AsyncMock
+
+        manager = GraphQLManager(MagicMock(spec=ModelRegistry))
+        manager.broadcast = MagicMock(publish=AsyncMock())
+        gql_type = manager._create_gql_type_from_model(ParentModel)
+        create_input = manager._create_input_type_from_model(ParentModel, "Create")
+        update_input = manager._create_input_type_from_model(ParentModel, "Update")
+        manager._add_bulk_mutation_resolvers(
+            "Parents", gql_type, self.BulkManager, create_input, update_input
+        )
+        return manager, create_input
+
+    def _resolver(self, manager, name):
+        return manager._mutation_fields[name].base_resolver.wrapped_func
+
+    @pytest.mark.asyncio
+    async def test_create_many_reports_failed_items(self):
+        manager, create_input = self._graphql_manager()
+        info = MagicMock(context={"requester_id": "u1"})
+
+        result = await self._resolver(manager, "createManyParents")(
+            input=[create_input(name=name) for name in ("a", "bad", "b")],
+            info=info,
+        )
+
+        assert [item.id for item in result.items] == ["id-a", "id-b"]
+        assert [(e.index, e.error) for e in result.errors] == [
+            (1, "name is not allowed")
+        ]
+        batch = manager.model_registry.DB.manager.batch_session
+        batch.assert_called_once()
+        # One event for the whole batch
+        manager.broadcast.publish.assert_awaited_once()
+        channel, message = manager.broadcast.publish.await_args.args
+        assert channel == "bulkmanager_created"
+        assert [item["id"] for item in message["items"]] == ["id-a", "id-b"]
+
+    @pytest.mark.asyncio
+    async def test_delete_many_returns_deleted_ids(self):
+        manager, _ = self._graphql_manager()
+        info = MagicMock(context={"requester_id": "u1"})
+
+        result = await self._resolver(manager, "deleteManyParents")(
+            ids=["x", "missing", "y"], info=info
+        )
+
+        assert result.deleted_ids == ["x", "y"]
+        assert [(e.index, e.id) for e in result.errors] == [(1, "missing")]
+
+    @pytest.mark.asyncio
+    async def test_too_many_items_rejected(self):
+        from unittest.mock import patch
+
+        manager, create_input = self._graphql_manager()
+        info = MagicMock(context={"requester_id": "u1"})
+
+        with patch("lib.Pydantic2Strawberry.env", return_value="1"):
+            with pytest.raises(Exception, match="At most 1 items"):
+                await self._resolver(manager, "createManyParents")(
+                    input=[create_input(name="a"), create_input(name="b")],
+                    info=info,
+                )
@@ -11,7 +11,12 @@ from pydantic import BaseModel, Field
 
 # Add parent directory to sys.path to import Pydantic
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from lib.Pydantic import ModelRegistry, PydanticUtility, obj_to_dict
+from lib.Pydantic import (
+    ModelRegistry,
+    PydanticUtility,
+    benchmark_registry_lookups,
+    obj_to_dict,
+)
 from lib.Pydantic2SQLAlchemy import DatabaseMixin
 from lib.Logging import logger
 
@@ -1122,6 +1127,37 @@ class TestModelRegistry:
         metadata = registry.model_metadata.get(TestModel, {})
         assert metadata.get("table_comment") == "Test table"
 
+    def test_apply_and_db_lookups_are_indexed(self):
+        """Test that apply() is served from the name index and DB is cached."""
+        registry = ModelRegistry(database_manager=MagicMock())
+
+        class IndexedModel(BaseModel):
+            name: str = Field(..., description="Test name")
+
+        registry.bind(IndexedModel)
+
+        assert registry.apply(IndexedModel) is IndexedModel
+        assert registry.DB is registry.DB
+        with pytest.raises(TypeError):
+            registry.apply(type("UnboundModel", (BaseModel,), {}))
+
+        registry.database_manager = MagicMock()
+        assert registry.DB.manager is registry.database_manager
+
+        registry.clear()
+        with pytest.raises(TypeError):
+            registry.apply(IndexedModel)
+
+        registry.bind(IndexedModel)
+        results = benchmark_registry_lookups(registry, iterations=10)
+        assert set(results) == {
+            "apply_us",
+            "linear_scan_us",
+            "db_us",
+            "db_uncached_us",
+        }
+        assert all(value > 0 for value in results.values())
+
     def test_bind_db_functionality(self):
         """Test that the ModelRegistry properly uses the new .DB(declarative_base) functionality."""
         registry = ModelRegistry()
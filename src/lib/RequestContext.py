@@ -1,11 +1,26 @@
-from contextvars import ContextVar
-from typing import Optional, Dict, Any
+from contextvars import ContextVar, Token
+from typing import Optional, Dict, Any, Tuple
 
 # Context variable to store current request's user information
 _request_user_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
     "request_user_context", default=None
 )
 
+# Context variable to store the verified authorization claims of the current request
+_request_claims_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_claims_context", default=None
+)
+
+# Context variable to store the If-Match precondition of the current update
+_request_if_match_context: ContextVar[Optional[Tuple[str, str]]] = ContextVar(
+    "request_if_match_context", default=None
+)
+
+# Context variable to store the database session shared by the current request
+_request_session_context: ContextVar[Optional[Any]] = ContextVar(
+    "request_session_context", default=None
+)
+
 
 def set_request_user(user_info: Dict[str, Any]) -> None:
     """Set the current request's user information"""
@@ -25,6 +40,49 @@ def get_user_timezone() -> str:
     return "UTC"
 
 
+def set_request_claims(claims: Dict[str, Any]) -> None:
+    """Set the current request's signed authorization claims"""
+    _request_claims_context.set(claims)
+
+
+def get_request_claims() -> Optional[Dict[str, Any]]:
+    """Get the current request's signed authorization claims"""
+    return _request_claims_context.get()
+
+
+def set_request_if_match(entity_id: Optional[str], if_match: Optional[str]) -> None:
+    """Set the If-Match header that guards the update of ``entity_id``"""
+    _request_if_match_context.set(
+        (entity_id, if_match) if entity_id and if_match else None
+    )
+
+
+def get_request_if_match(entity_id: str) -> Optional[str]:
+    """Get the If-Match header if it guards the update of ``entity_id``"""
+    precondition = _request_if_match_context.get()
+    if precondition and precondition[0] == entity_id:
+        return precondition[1]
+    return None
+
+
+def set_request_session(session: Any) -> Token:
+    """Share ``session`` with every database call of the current request"""
+    return _request_session_context.set(session)
+
+
+def get_request_session() -> Optional[Any]:
+    """Get the database session shared by the current request"""
+    return _request_session_context.get()
+
+
+def reset_request_session(token: Token) -> None:
+    """Stop sharing the session set with ``token``"""
+    _request_session_context.reset(token)
+
+
 def clear_request_context() -> None:
     """Clear the request context"""
     _request_user_context.set(None)
+    _request_claims_context.set(None)
+    _request_if_match_context.set(None)
+    _request_session_context.set(None)
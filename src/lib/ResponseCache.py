@@ -0,0 +1,254 @@
+"""
+ResponseCache.py - Host-local cache of generated GET/LIST response bodies.
+
+Entries live in a SQLite file that every worker on the host opens, so a
+response cached by one worker is served by the others. Each entry records
+the generation of every table it was read from (plus the permission tables)
+when its query ran. DB after-hooks bump a table's generation on each
+create, update and delete, which makes the dependent entries stale without
+touching them; stale and expired rows are dropped lazily or by the size
+limit.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lib.Environment import env
+from lib.Logging import logger
+
+# Tag shared by every entry; bumped when memberships, roles or permissions
+# change so the requester part of the key always reflects current access.
+PERMISSIONS_TAG = "@permissions"
+
+
+def response_cache_enabled() -> bool:
+    """Whether the response cache and its invalidation hooks are active."""
+    return str(env("RESPONSE_CACHE")).lower() == "true"
+
+
+class ResponseCache:
+    """
+    Size-limited, generation-checked response store shared through SQLite.
+
+    Args:
+        path: SQLite file; defaults to ``RESPONSE_CACHE_PATH`` or a file
+            named after ``APP_NAME`` in the system temp directory
+        max_entries: Maximum stored responses; oldest are evicted first
+        max_entry_bytes: Larger bodies are not cached
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+    ):
+        self._path = path
+        self.max_entries = int(
+            max_entries
+            if max_entries is not None
+            else env("RESPONSE_CACHE_MAX_ENTRIES")
+        )
+        self.max_entry_bytes = int(
+            max_entry_bytes
+            if max_entry_bytes is not None
+            else env("RESPONSE_CACHE_MAX_ENTRY_BYTES")
+        )
+        self._local = threading.local()
+
+    @property
+    def path(self) -> str:
+        if not self._path:
+            self._path = env("RESPONSE_CACHE_PATH") or os.path.join(
+                tempfile.gettempdir(),
+                f"{str(env('APP_NAME')).lower()}.response-cache.db",
+            )
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, opened lazily so forked workers never
+        # share a handle
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, generations TEXT NOT NULL, etag TEXT, "
+                "body BLOB NOT NULL, expires_at REAL NOT NULL, stored_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS generations ("
+                "tag TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def make_key(route: str, params: Dict[str, Any], requester_id: Any) -> str:
+        """
+        Key a response by route, normalized query parameters and requester.
+
+        List values are sorted so ``?fields=a,b`` and ``?fields=b,a`` share
+        an entry; ``None`` values are dropped.
+        """
+        normalized = {
+            name: sorted(str(v) for v in value) if isinstance(value, list) else value
+            for name, value in sorted(params.items())
+            if value is not None
+        }
+        payload = json.dumps(
+            [route, normalized, requester_id], default=str, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def snapshot(self, tags: Iterable[str]) -> Dict[str, int]:
+        """
+        Read the current generation of ``tags`` plus the permission tag.
+
+        Take the snapshot before running the query so a write that lands
+        while the response is built makes the stored entry stale.
+        """
+        tags = sorted(set(tags) | {PERMISSIONS_TAG})
+        try:
+            rows = self._connection().execute(
+                f"SELECT tag, value FROM generations WHERE tag IN ({','.join('?' * len(tags))})",
+                tags,
+            )
+            current = dict(rows.fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache snapshot failed: {e}")
+            return {}
+        return {tag: current.get(tag, 0) for tag in tags}
+
+    def get(
+        self, key: str, now: Optional[float] = None
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Return ``(body, etag)`` if the entry is fresh and its tables unchanged."""
+        now = time.time() if now is None else now
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT generations, etag, body, expires_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            generations = json.loads(row[0])
+            if row[3] <= now or self.snapshot(generations) != generations:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            return bytes(row[2]), row[1]
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        generations: Dict[str, int],
+        body: bytes,
+        etag: Optional[str],
+        ttl_seconds: int,
+        now: Optional[float] = None,
+    ) -> None:
+        """Store a response read under the ``generations`` snapshot."""
+        if ttl_seconds <= 0 or not generations or len(body) > self.max_entry_bytes:
+            return
+        now = time.time() if now is None else now
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, json.dumps(generations), etag, body, now + ttl_seconds, now),
+            )
+            overflow = (
+                conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                - self.max_entries
+            )
+            if overflow > 0:
+                conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY stored_at LIMIT ?)",
+                    (overflow,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def invalidate(self, tag: str) -> None:
+        """Bump the generation of ``tag``, staling every entry that read it."""
+        try:
+            self._connection().execute(
+                "INSERT INTO generations (tag, value) VALUES (?, 1) "
+                "ON CONFLICT(tag) DO UPDATE SET value = value + 1",
+                (tag,),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache invalidation of {tag} failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        try:
+            self._connection().execute("DELETE FROM entries")
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache clear failed: {e}")
+
+
+response_cache = ResponseCache()
+
+
+def related_tables(db_cls: Any, include: Optional[List[str]] = None) -> List[str]:
+    """Tables a response reads: ``db_cls`` plus every included relationship."""
+    tables = [db_cls.__tablename__]
+    for path in include or []:
+        current = db_cls
+        for part in path.split("."):
+            attr = getattr(current, part, None)
+            mapper = getattr(getattr(attr, "property", None), "mapper", None)
+            if mapper is None:
+                break
+            current = mapper.class_
+            tables.append(current.__tablename__)
+    return tables
+
+
+def invalidate_table(db_cls) -> None:
+    """Stale cached responses for set-based writes that skip entity hooks."""
+    if response_cache_enabled():
+        response_cache.invalidate(db_cls.__tablename__)
+
+
+def _invalidate_table(entity, *args) -> None:
+    """DB after-hook: stale cached responses that read this entity's table."""
+    response_cache.invalidate(type(entity).__tablename__)
+
+
+def _invalidate_permissions(entity, *args) -> None:
+    """DB after-hook for membership, role and permission rows."""
+    response_cache.invalidate(PERMISSIONS_TAG)
+
+
+def register_invalidation_hooks(db_cls, affects_permissions: bool = False) -> None:
+    """Attach response cache invalidation to every write of ``db_cls``."""
+    if not response_cache_enabled():
+        return
+    hooks = db_cls.hooks
+    callbacks = [_invalidate_table]
+    if affects_permissions:
+        callbacks.append(_invalidate_permissions)
+    for hook_type in ("create", "update", "delete"):
+        for callback in callbacks:
+            if callback not in hooks[hook_type]["after"]:
+                hooks[hook_type]["after"].append(callback)
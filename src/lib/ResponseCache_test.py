@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import pytest
+
+from lib.ResponseCache import (
+    PERMISSIONS_TAG,
+    ResponseCache,
+    _invalidate_permissions,
+    _invalidate_table,
+    related_tables,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(
+        path=str(tmp_path / "responses.db"), max_entries=3, max_entry_bytes=64
+    )
+
+
+class TestResponseCache:
+    """Keys, generation checks and limits of the shared response cache."""
+
+    def test_key_normalizes_params(self):
+        key = ResponseCache.make_key(
+            "/v1/user", {"fields": ["name", "id"], "include": None}, "u1"
+        )
+        assert key == ResponseCache.make_key("/v1/user", {"fields": ["id", "name"]}, "u1")
+        assert key != ResponseCache.make_key("/v1/user", {"fields": ["id", "name"]}, "u2")
+        assert key != ResponseCache.make_key("/v1/team", {"fields": ["id", "name"]}, "u1")
+
+    def test_roundtrip_and_table_invalidation(self, cache):
+        generations = cache.snapshot(["users"])
+        assert generations == {"users": 0, PERMISSIONS_TAG: 0}
+        cache.put("k", generations, b'{"a":1}', '"e"', ttl_seconds=60)
+        assert cache.get("k") == (b'{"a":1}', '"e"')
+
+        cache.invalidate("teams")
+        assert cache.get("k") is not None
+
+        cache.invalidate("users")
+        assert cache.get("k") is None
+
+    def test_permission_changes_invalidate_every_entry(self, cache):
+        cache.put("k", cache.snapshot(["users"]), b"{}", None, ttl_seconds=60)
+        cache.invalidate(PERMISSIONS_TAG)
+        assert cache.get("k") is None
+
+    def test_write_during_query_is_not_served(self, cache):
+        generations = cache.snapshot(["users"])
+        cache.invalidate("users")
+        cache.put("k", generations, b"{}", None, ttl_seconds=60)
+        assert cache.get("k") is None
+
+    def test_expiry_and_limits(self, cache):
+        cache.put("old", cache.snapshot(["t"]), b"{}", None, ttl_seconds=10, now=100)
+        assert cache.get("old", now=105) is not None
+        assert cache.get("old", now=111) is None
+
+        cache.put("big", cache.snapshot(["t"]), b"x" * 65, None, ttl_seconds=60)
+        assert cache.get("big") is None
+
+        for index in range(4):
+            cache.put(f"k{index}", cache.snapshot(["t"]), b"{}", None, 60, now=index)
+        assert cache.get("k0", now=10) is None
+        assert cache.get("k3", now=10) is not None
+
+    def test_shared_between_instances(self, cache):
+        other = ResponseCache(path=cache.path)
+        cache.put("k", cache.snapshot(["users"]), b"{}", None, ttl_seconds=60)
+        assert other.get("k") == (b"{}", None)
+        other.invalidate("users")
+        assert cache.get("k") is None
+
+
+class TestInvalidationHooks:
+    def test_hooks_bump_generations(self, cache, monkeypatch):
+        monkeypatch.setattr("lib.ResponseCache.response_cache", cache)
+
+        class Users:
+            __tablename__ = "users"
+
+        before = cache.snapshot(["users"])
+        _invalidate_table(Users(), None)
+        _invalidate_permissions(Users())
+        after = cache.snapshot(["users"])
+        assert after["users"] == before["users"] + 1
+        assert after[PERMISSIONS_TAG] == before[PERMISSIONS_TAG] + 1
+
+    def test_related_tables_follow_includes(self):
+        team = SimpleNamespace(__tablename__="teams")
+        user_team = SimpleNamespace(
+            __tablename__="user_teams",
+            team=SimpleNamespace(property=SimpleNamespace(mapper=SimpleNamespace(class_=team))),
+        )
+        user = SimpleNamespace(
+            __tablename__="users",
+            user_teams=SimpleNamespace(
+                property=SimpleNamespace(mapper=SimpleNamespace(class_=user_team))
+            ),
+        )
+        assert related_tables(user, ["user_teams.team", "unknown"]) == [
+            "users",
+            "user_teams",
+            "teams",
+        ]
@@ -11,9 +11,11 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -28,8 +30,9 @@ from fastapi import HTTPException
 from fastapi.encoders import ENCODERS_BY_TYPE
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
+from lib.Environment import env
 from lib.Logging import logger
 from lib.Pydantic import BaseNetworkModel, classproperty
 from lib.Pydantic2FastAPI import AuthType
@@ -1179,6 +1182,7 @@ class AbstractBLLManager(ABC):
         target_id: Optional[str] = None,
         target_team_id: Optional[str] = None,
         parent: Optional[Any] = None,
+        requester: Optional[Any] = None,
     ):
         """
         Initialize the BLL manager.
@@ -1189,6 +1193,7 @@ class AbstractBLLManager(ABC):
             target_team_id: ID of the target team (kept for backward compatibility)
             parent: Parent manager for nested operations (optional)
             model_registry: ModelRegistry instance for accessing registry-bound models (required)
+            requester: Already loaded requesting user; skips the lookup when its id matches
         """
         self.model_registry = model_registry
         self.requester_id = requester_id
@@ -1217,6 +1222,11 @@ class AbstractBLLManager(ABC):
                 f"model_registry is required to be defined and committed in {self.__class__.__name__}."
             )
 
+        if requester is not None and str(requester.id) == str(requester_id):
+            self.requester = requester
+            self._register_search_transformers()
+            return
+
         # Use BLL models instead of direct DB imports
         from logic.BLL_Auth import TeamModel, UserModel
 
@@ -1788,85 +1798,104 @@ class AbstractBLLManager(ABC):
 
         return resolved
 
+    def _projected_fields(
+        self,
+        include: Optional[Union[List[str], str]],
+        fields: Optional[Union[List[str], str]],
+    ) -> Optional[List[str]]:
+        """Return ``fields`` if they can be selected as plain columns.
+
+        A projection is pushed down to the query (``return_type="rows"``)
+        only when nothing is included and every field is a mapped column;
+        otherwise None, and callers build DTOs as usual.
+        """
+        if include and self._parse_includes(include):
+            return None
+        fields_list = self._parse_fields(fields) if fields else []
+        mapper = getattr(self.DB, "__mapper__", None)
+        if not fields_list or mapper is None:
+            return None
+        column_keys = set(mapper.columns.keys())
+        if any(field_name not in column_keys for field_name in fields_list):
+            return None
+        return fields_list
+
     @staticmethod
-    def generate_joins(model_class, include_fields):
-        """Generate join loads based on specified include fields.
+    def generate_joins(model_class, include_fields, loader=None, strict=False):
+        """Generate eager loader options for the specified include fields.
+
+        Each hop picks its strategy from the relationship: ``selectinload``
+        for collections, so one-to-many includes never multiply the parent
+        rows that ``limit``/``offset`` page over, and ``joinedload`` for
+        many-to-one.
 
         Args:
             model_class: SQLAlchemy model class
             include_fields: List of relationship names, supports dot notation for nested relationships
+            loader: Eager loader to force for every hop (e.g. ``selectinload``
+                for streamed batches); chosen per relationship when None
+            strict: Add ``raiseload("*")`` so relationships that were not
+                requested raise instead of lazy loading one query per row
 
         Returns:
-            List of SQLAlchemy joinedload options
+            List of SQLAlchemy loader options
+
+        Raises:
+            HTTPException: 400 if more than ``INCLUDE_MAX_COUNT`` includes are
+                requested or one is nested deeper than ``INCLUDE_MAX_DEPTH``
         """
         from lib.Logging import logger
 
+        include_fields = list(include_fields or [])
+        max_count = int(env("INCLUDE_MAX_COUNT"))
+        max_depth = int(env("INCLUDE_MAX_DEPTH"))
+        if len(include_fields) > max_count:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {max_count} includes may be requested at once",
+            )
+
         joins = []
 
         for field in include_fields:
+            # Handle nested includes (e.g., 'user_teams.team.roles')
+            parts = field.split(".")
+            if len(parts) > max_depth:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Include '{field}' is nested deeper than {max_depth} levels",
+                )
             try:
-                # Handle nested includes (e.g., 'user_teams.team.roles')
-                if "." in field:
-                    parts = field.split(".")
-
-                    # Start with the first relationship
-                    if not hasattr(model_class, parts[0]):
-                        logger.warning(
-                            f"Relationship '{parts[0]}' not found on {model_class.__name__}"
-                        )
-                        continue
-
-                    current_attr = getattr(model_class, parts[0])
-
-                    # Check if it's actually a relationship
-                    if not (hasattr(current_attr.property, "mapper")):
+                current_join = None
+                current_model_class = model_class
+                for part in parts:
+                    if not hasattr(current_model_class, part):
                         logger.warning(
-                            f"'{parts[0]}' is not a relationship on {model_class.__name__}"
+                            f"Relationship '{part}' not found on {current_model_class.__name__}"
                         )
-                        continue
+                        break
 
-                    # Start building the nested joinload
-                    current_join = joinedload(current_attr)
-                    current_model_class = current_attr.property.mapper.class_
-
-                    # Build nested joinloads for deeper relationships
-                    for part in parts[1:]:
-                        if hasattr(current_model_class, part):
-                            nested_attr = getattr(current_model_class, part)
-
-                            # Ensure it's a relationship
-                            if hasattr(nested_attr.property, "mapper"):
-                                current_join = current_join.joinedload(nested_attr)
-                                current_model_class = nested_attr.property.mapper.class_
-                            else:
-                                logger.warning(
-                                    f"'{part}' is not a relationship on {current_model_class.__name__}"
-                                )
-                                break
-                        else:
-                            logger.warning(
-                                f"Relationship '{part}' not found on {current_model_class.__name__}"
-                            )
-                            break
-                    else:
-                        # If we didn't break out of the loop, add the join
-                        joins.append(current_join)
-
-                # Handle simple includes (e.g., 'user_teams')
-                elif hasattr(model_class, field):
-                    attr = getattr(model_class, field)
+                    attr = getattr(current_model_class, part)
 
                     # Check if this is actually a relationship (not a column property)
-                    if hasattr(attr.property, "mapper"):
-                        joins.append(joinedload(attr))
-                    else:
+                    if not hasattr(attr.property, "mapper"):
                         logger.warning(
-                            f"'{field}' is not a relationship on {model_class.__name__}"
+                            f"'{part}' is not a relationship on {current_model_class.__name__}"
                         )
-                else:
-                    logger.warning(
-                        f"Relationship '{field}' not found on {model_class.__name__}"
+                        break
+
+                    strategy = loader or (
+                        selectinload if attr.property.uselist else joinedload
+                    )
+                    current_join = (
+                        strategy(attr)
+                        if current_join is None
+                        else getattr(current_join, strategy.__name__)(attr)
                     )
+                    current_model_class = attr.property.mapper.class_
+                else:
+                    # If we didn't break out of the loop, add the loader
+                    joins.append(current_join)
 
             except (AttributeError, TypeError) as e:
                 logger.warning(
@@ -1874,6 +1903,9 @@ class AbstractBLLManager(ABC):
                 )
                 continue
 
+        if strict:
+            joins.append(raiseload("*"))
+
         return joins
 
     @property
@@ -1983,13 +2015,10 @@ class AbstractBLLManager(ABC):
         Returns:
             Entity with included relationships loaded
         """
-        options = []
-
-        if include:
-            # Parse includes - handle both CSV strings and lists
-            include_list = self._parse_includes(include)
-            if include_list:
-                options = self.generate_joins(self.DB, include_list)
+        # Parse includes - handle both CSV strings and lists; relationships
+        # that were not requested raise instead of lazy loading
+        include_list = self._parse_includes(include) if include else []
+        options = self.generate_joins(self.DB, include_list, strict=True)
         if fields:
             from sqlalchemy.orm import load_only
 
@@ -2011,6 +2040,76 @@ class AbstractBLLManager(ABC):
             **db_kwargs,
         )
 
+    def version(self, id: str, **kwargs) -> Optional[Tuple[str, Any]]:
+        """Get ``(id, updated_at)`` for an entity without loading it.
+
+        Uses the same VIEW permission filter as ``get``. Returns None if the
+        entity is not visible or its model has no ``updated_at``.
+        """
+        db_kwargs = {k: v for k, v in kwargs.items() if k not in ["hook_processed"]}
+
+        return self.DB.get(
+            requester_id=self.requester.id,
+            model_registry=self.model_registry,
+            return_type="keys",
+            id=id,
+            **db_kwargs,
+        )
+
+    def batch_get(
+        self,
+        ids: List[str],
+        include: Optional[Union[List[str], str]] = None,
+        fields: Optional[Union[List[str], str]] = None,
+    ) -> Tuple[List[Any], List[Dict[str, str]]]:
+        """Get many entities in one permission-filtered ``IN`` query.
+
+        Args:
+            ids: Entity IDs; duplicates are read once
+            include: Relationships to include, as for ``get``
+            fields: Fields to load, as for ``get``
+
+        Returns:
+            The visible entities in the order of ``ids``, and one
+            ``{"id", "error"}`` entry per unresolved id, where ``error`` is
+            ``"forbidden"`` if the entity exists but is not visible to the
+            requester and ``"not_found"`` otherwise
+        """
+        ids = list(dict.fromkeys(str(entity_id) for entity_id in ids))
+        max_ids = int(env("BATCH_GET_MAX_IDS"))
+        if len(ids) > max_ids:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {max_ids} ids may be requested at once",
+            )
+        if not ids:
+            return [], []
+
+        found = {
+            entity.id: entity
+            for entity in self.list(
+                include=include, fields=fields, filters=[self.DB.id.in_(ids)]
+            )
+        }
+        missing = [entity_id for entity_id in ids if entity_id not in found]
+        existing = (
+            self.DB.existing_ids(
+                requester_id=self.requester.id,
+                model_registry=self.model_registry,
+                ids=missing,
+            )
+            if missing
+            else set()
+        )
+        errors = [
+            {
+                "id": entity_id,
+                "error": "forbidden" if entity_id in existing else "not_found",
+            }
+            for entity_id in missing
+        ]
+        return [found[entity_id] for entity_id in ids if entity_id in found], errors
+
     def list(
         self,
         include: Optional[Union[List[str], str]] = None,
@@ -2023,14 +2122,30 @@ class AbstractBLLManager(ABC):
         page: Optional[int] = None,
         pageSize: Optional[int] = None,
         return_type: str = "dto",
+        partition_by: Optional[str] = None,
         **kwargs,
     ) -> List[Any]:
-        """List entities with optional included relationships."""
+        """List entities with optional included relationships.
+
+        ``return_type="rows"`` returns plain dicts of the requested ``fields``
+        (plus ``id``/``updated_at``) selected straight from the table; it
+        falls back to DTOs when the projection cannot be pushed down.
+        ``partition_by`` names a column whose values each get their own
+        ``limit``/``offset`` window, e.g. a page of children per parent.
+        """
         # Handle pagination - convert page/pageSize to limit/offset
         if page is not None and pageSize is not None:
             limit = pageSize
             offset = (page - 1) * pageSize
 
+        projected_fields = None
+        if return_type == "rows":
+            projected_fields = self._projected_fields(include, fields)
+            if projected_fields is None:
+                return_type = "dto"
+            else:
+                include = fields = None
+
         options = []
         order_by = None
         # Separate kwargs for simple filter_by and complex dicts for build_search_filters
@@ -2045,11 +2160,12 @@ class AbstractBLLManager(ABC):
             else:
                 simple_kwargs[key] = value
 
-        if include:
-            # Parse includes - handle both CSV strings and lists
-            include_list = self._parse_includes(include)
-            if include_list:
-                options = self.generate_joins(self.DB, include_list)
+        # Parse includes - handle both CSV strings and lists; DTO reads raise
+        # on relationships that were not requested instead of lazy loading
+        include_list = self._parse_includes(include) if include else []
+        options = self.generate_joins(
+            self.DB, include_list, strict=return_type in ("dto", "model")
+        )
         if fields:
             from sqlalchemy.orm import load_only
 
@@ -2085,7 +2201,9 @@ class AbstractBLLManager(ABC):
             order_by=order_by,
             limit=limit,
             offset=offset,
+            fields=projected_fields or [],
             filters=combined_filters,  # Use combined_filters here
+            partition_by=getattr(self.DB, partition_by) if partition_by else None,
             **simple_kwargs,  # Pass simple_kwargs for filter_by
         )
 
@@ -2129,12 +2247,20 @@ class AbstractBLLManager(ABC):
             "return_type", "dto"
         )  # Remove and save return_type
 
-        # Convert include to SQLAlchemy joinedload options
-        if include:
-            # Parse includes - handle both CSV strings and lists
-            include_list = self._parse_includes(include)
-            if include_list:
-                options = self.generate_joins(self.DB, include_list)
+        # Push a plain-column projection down to the query
+        projected_fields = None
+        if return_type == "rows":
+            projected_fields = self._projected_fields(include, fields)
+            if projected_fields is None:
+                return_type = "dto"
+            else:
+                include = fields = None
+
+        # Convert include to SQLAlchemy eager loader options
+        include_list = self._parse_includes(include) if include else []
+        options = self.generate_joins(
+            self.DB, include_list, strict=return_type in ("dto", "model")
+        )
 
         # Convert fields to SQLAlchemy load_only option
         if fields:
@@ -2172,10 +2298,186 @@ class AbstractBLLManager(ABC):
             order_by=order_by,
             limit=limit,
             offset=offset,
+            fields=projected_fields or [],
             filters=combined_filters,  # Filters from build_search_filters
             **simple_kwargs,  # Simple equality kwargs for filter_by
         )
 
+    def stream(
+        self,
+        include: Optional[Union[List[str], str]] = None,
+        fields: Optional[Union[List[str], str]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        filters: Optional[List[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        batch_size: int = 500,
+        **search_params,
+    ) -> Iterator[Any]:
+        """Iterate over matching entities without materializing the result set.
+
+        Accepts the same filters as ``search`` and yields DTOs one at a time
+        from a server-side cursor. Includes are loaded per batch with
+        ``selectinload`` since joined collection loads cannot be streamed.
+        """
+        options = []
+        order_by = None
+        simple_kwargs = {}
+        complex_search_params = {}
+        for key, value in search_params.items():
+            # Skip hook-related parameters
+            if key in ["hook_processed"]:
+                continue
+            if isinstance(value, dict):
+                complex_search_params[key] = value
+            else:
+                simple_kwargs[key] = value
+
+        self.search_validation(simple_kwargs)
+
+        if include:
+            include_list = self._parse_includes(include)
+            if include_list:
+                options = self.generate_joins(
+                    self.DB, include_list, loader=selectinload
+                )
+        if fields:
+            from sqlalchemy.orm import load_only
+
+            fields_list = self._parse_fields(fields)
+            if fields_list:
+                columns = self._resolve_load_only_columns(fields_list)
+                if columns:
+                    options.append(load_only(*columns))
+        if sort_by:
+            from sqlalchemy import asc, desc
+
+            if hasattr(self.DB, sort_by):
+                column = getattr(self.DB, sort_by)
+                if sort_order.lower() == "asc":
+                    order_by = [asc(column)]
+                else:
+                    order_by = [desc(column)]
+
+        search_filters = self.build_search_filters(complex_search_params)
+        combined_filters = filters + search_filters if filters else search_filters
+        combined_filters = self._normalize_filters(combined_filters)
+
+        return self.DB.stream(
+            requester_id=self.requester.id,
+            model_registry=self.model_registry,
+            return_type="dto",
+            override_dto=self.model_registry.apply(self.Model),
+            options=options,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            filters=combined_filters,
+            batch_size=batch_size,
+            **simple_kwargs,
+        )
+
+    def aggregate(
+        self,
+        group_by: Optional[Union[List[str], str]] = None,
+        metrics: Optional[Dict[str, Union[List[str], str]]] = None,
+        filters: Optional[List[Any]] = None,
+        limit: Optional[int] = None,
+        **search_params,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Count and aggregate matching entities per group in one query.
+
+        Args:
+            group_by: Fields to group by
+            metrics: ``sum``, ``min`` or ``max`` mapped to the fields to
+                aggregate; ``sum`` only applies to numeric fields
+            filters: Additional SQLAlchemy filter conditions
+            limit: Maximum number of groups, capped at ``AGGREGATE_MAX_GROUPS``
+            **search_params: Criteria in the same format as ``search``
+
+        Returns:
+            Tuple of one ``{"group", "count", "sum", "min", "max"}`` dict per
+            group (metric keys only when requested) and whether more groups
+            existed than the limit allowed
+        """
+        group_list = self._parse_fields(group_by) if group_by else []
+        metric_lists = {}
+        for function, names in (metrics or {}).items():
+            if function not in ("sum", "min", "max"):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unsupported aggregate function: {function}",
+                )
+            names = self._parse_fields(names) if names else []
+            if names:
+                metric_lists[function] = names
+
+        # Only fields clients can already search by may be grouped or
+        # aggregated; columns the network model leaves out stay hidden
+        allowed = self._aggregate_fields()
+        invalid = [
+            name
+            for name in group_list
+            + [name for names in metric_lists.values() for name in names]
+            if name not in allowed
+        ]
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid field(s) requested: {', '.join(invalid)}",
+            )
+
+        _, numeric_fields, _, _ = self.get_field_types()
+        non_numeric = [
+            name for name in metric_lists.get("sum", []) if name not in numeric_fields
+        ]
+        if non_numeric:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot sum non-numeric field(s): {', '.join(non_numeric)}",
+            )
+
+        max_groups = int(env("AGGREGATE_MAX_GROUPS"))
+        limit = min(limit, max_groups) if limit else max_groups
+
+        simple_kwargs = {}
+        complex_search_params = {}
+        for key, value in search_params.items():
+            # Skip hook-related parameters
+            if key in ["hook_processed"]:
+                continue
+            if isinstance(value, dict):
+                complex_search_params[key] = value
+            else:
+                simple_kwargs[key] = value
+
+        self.search_validation(simple_kwargs)
+
+        search_filters = self.build_search_filters(complex_search_params)
+        combined_filters = filters + search_filters if filters else search_filters
+        combined_filters = self._normalize_filters(combined_filters)
+
+        # One extra group tells a full page apart from a cut-off one
+        groups = self.DB.aggregate(
+            requester_id=self.requester.id,
+            model_registry=self.model_registry,
+            group_by=group_list,
+            metrics=metric_lists,
+            filters=combined_filters,
+            limit=limit + 1,
+            **simple_kwargs,
+        )
+        return groups[:limit], len(groups) > limit
+
+    def _aggregate_fields(self) -> Set[str]:
+        """Fields of the model's network ``Search`` model, falling back to the response model."""
+        model = self.model_registry.apply(self.Model)
+        search_model = getattr(model, "Search", None)
+        if search_model is not None and hasattr(search_model, "model_fields"):
+            return set(search_model.model_fields)
+        return set(model.model_fields)
+
     def _normalize_filters(self, filters: Optional[List[Any]]) -> Optional[List[Any]]:
         if not filters:
             return filters
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from database.StaticPermissions import ROOT_ID
 from lib.Pydantic2SQLAlchemy import DatabaseMixin
@@ -842,6 +842,97 @@ class TestAbstractLogicManager:
         assert entity1.id in entity_ids
         assert entity2.id in entity_ids
 
+    def test_list_rows_projection(self):
+        """Plain-column fields are pushed down; includes fall back to DTOs."""
+        created = self.base_manager.create(name="Row Entity")
+
+        rows = self.base_manager.list(fields=["name"], return_type="rows")
+        row = next(row for row in rows if row["id"] == created.id)
+        assert row["name"] == "Row Entity"
+        assert "description" not in row
+
+        assert self.base_manager._projected_fields(None, "name,id") == ["name", "id"]
+        assert self.base_manager._projected_fields("owner", ["name"]) is None
+        assert self.base_manager._projected_fields(None, ["not_a_column"]) is None
+
+    def test_batch_get_operation(self):
+        """Batch get keeps request order and reports unresolved ids."""
+        from fastapi import HTTPException
+
+        first = self.base_manager.create(name="Batch Get 1")
+        second = self.base_manager.create(name="Batch Get 2")
+
+        entities, errors = self.base_manager.batch_get(
+            ids=[second.id, "missing", first.id, second.id]
+        )
+
+        assert [entity.id for entity in entities] == [second.id, first.id]
+        assert errors == [{"id": "missing", "error": "not_found"}]
+
+        with patch.object(
+            self.base_manager.DB, "existing_ids", return_value={"hidden"}
+        ):
+            _, errors = self.base_manager.batch_get(ids=["hidden"])
+        assert errors == [{"id": "hidden", "error": "forbidden"}]
+
+        with pytest.raises(HTTPException) as exc:
+            self.base_manager.batch_get(ids=[str(index) for index in range(101)])
+        assert exc.value.status_code == 400
+
+    def test_aggregate_operation(self):
+        """Aggregates group matching rows and reuse the search filter format."""
+        from fastapi import HTTPException
+
+        prefix = f"Agg {uuid.uuid4().hex[:8]}"
+        for name, count in (("a", 1), ("a", 4), ("b", 2), ("b", 10)):
+            self.base_manager.create(name=f"{prefix} {name}", count=count)
+
+        groups, truncated = self.base_manager.aggregate(
+            group_by="name",
+            metrics={"sum": ["count"], "min": "count", "max": ["count"]},
+            name={"sw": prefix},
+        )
+        assert groups == [
+            {
+                "group": {"name": f"{prefix} a"},
+                "count": 2,
+                "sum": {"count": 5},
+                "min": {"count": 1},
+                "max": {"count": 4},
+            },
+            {
+                "group": {"name": f"{prefix} b"},
+                "count": 2,
+                "sum": {"count": 12},
+                "min": {"count": 2},
+                "max": {"count": 10},
+            },
+        ]
+        assert truncated is False
+
+        first, truncated = self.base_manager.aggregate(
+            group_by="name", name={"sw": prefix}, limit=1
+        )
+        assert [group["group"]["name"] for group in first] == [f"{prefix} a"]
+        assert truncated is True
+
+        totals, _ = self.base_manager.aggregate(
+            name={"sw": prefix}, count={"gt": 1}, metrics={"sum": ["count"]}
+        )
+        assert totals == [{"group": {}, "count": 3, "sum": {"count": 16}}]
+
+        for bad in (
+            {"metrics": {"sum": ["name"]}},
+            {"metrics": {"avg": ["count"]}},
+            {"group_by": ["not_a_column"]},
+            # Mapped, but not part of the network Search model
+            {"group_by": ["description"]},
+            {"metrics": {"max": ["description"]}},
+        ):
+            with pytest.raises(HTTPException) as exc:
+                self.base_manager.aggregate(**bad)
+            assert exc.value.status_code == 400
+
     def test_update_operation(self):
         """Test updating an entity."""
         # Create an entity first
@@ -1148,3 +1239,64 @@ class TestAbstractLogicManager:
 
         # Restore original method
         self.base_manager.delete = original_delete
+
+
+class TestGenerateJoins:
+    """Eager loader strategy selection and include limits."""
+
+    @pytest.fixture
+    def models(self):
+        from sqlalchemy import Column, ForeignKey, String
+        from sqlalchemy.orm import declarative_base, relationship
+
+        Base = declarative_base()
+
+        class Parent(Base):
+            __tablename__ = "join_parent"
+            id = Column(String, primary_key=True)
+            children = relationship("Child", back_populates="parent")
+
+        class Child(Base):
+            __tablename__ = "join_child"
+            id = Column(String, primary_key=True)
+            parent_id = Column(ForeignKey("join_parent.id"))
+            parent = relationship("Parent", back_populates="children")
+
+        return Parent, Child
+
+    @staticmethod
+    def strategies(option):
+        return [dict(context.strategy)["lazy"] for context in option.context]
+
+    def test_strategy_follows_cardinality(self, models):
+        Parent, Child = models
+        (collection,) = AbstractBLLManager.generate_joins(Parent, ["children"])
+        assert self.strategies(collection) == ["selectin"]
+
+        (chain,) = AbstractBLLManager.generate_joins(Child, ["parent.children"])
+        assert self.strategies(chain) == ["joined", "selectin"]
+
+        (forced,) = AbstractBLLManager.generate_joins(
+            Child, ["parent"], loader=selectinload
+        )
+        assert self.strategies(forced) == ["selectin"]
+
+    def test_strict_adds_raiseload(self, models):
+        Parent, _ = models
+        options = AbstractBLLManager.generate_joins(Parent, [], strict=True)
+        assert len(options) == 1
+        assert dict(options[0].strategy)["lazy"] == "raise"
+
+    def test_include_limits(self, models):
+        from fastapi import HTTPException
+
+        Parent, Child = models
+        with pytest.raises(HTTPException) as exc:
+            AbstractBLLManager.generate_joins(
+                Child, ["parent.children.parent.children"]
+            )
+        assert exc.value.status_code == 400
+
+        with pytest.raises(HTTPException) as exc:
+            AbstractBLLManager.generate_joins(Parent, ["children"] * 11)
+        assert exc.value.status_code == 400
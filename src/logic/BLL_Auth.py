@@ -1,7 +1,25 @@
+import os
 import secrets
+import sqlite3
 import string
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 if TYPE_CHECKING:
     from logic.BLL_Auth import (
@@ -22,13 +40,29 @@ if TYPE_CHECKING:
 import bcrypt
 from fastapi import Header, HTTPException, Request, status
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
-from sqlalchemy import or_
+from sqlalchemy import (
+    bindparam,
+    case,
+    event,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    update,
+)
 
-from database.StaticPermissions import can_manage_permissions
+from database.AbstractDatabaseEntity import HookDict, version_timestamp
+from database.StaticPermissions import (
+    build_authorization_claims,
+    can_manage_permissions,
+)
 from lib.Dependencies import jwt
 from lib.Environment import env, extract_base_domain
 from lib.Logging import logger
 from lib.Pydantic import BaseModel
+from lib.RequestContext import get_request_claims
+from lib.ResponseCache import invalidate_table, register_invalidation_hooks
 from lib.Pydantic2FastAPI import (
     AuthType,
     RequestInfo,
@@ -69,6 +103,10 @@ class UserModel(
     )
     timezone: Optional[str] = Field(description="User's timezone")
     language: Optional[str] = Field(description="User's language")
+    membership_version: Optional[int] = Field(
+        default=0,
+        description="Incremented whenever the user's team memberships change",
+    )
 
     # Database metadata for SQLAlchemy generation
     table_comment: ClassVar[str] = (
@@ -492,6 +530,24 @@ class UserManager(AbstractBLLManager, RouterMixin):
             "response_model": "Dict[str, str]",
             "status_code": 200,
         },
+        {
+            "path": "/{user_id}/preference",
+            "method": "get",
+            "function": "get_preference_map",
+            "summary": "Get user preferences",
+            "description": "Gets all of a user's preferences as a single key/value object.",
+            "response_model": "Dict[str, str]",
+            "status_code": 200,
+        },
+        {
+            "path": "/{user_id}/preference",
+            "method": "put",
+            "function": "set_preferences",
+            "summary": "Set user preferences",
+            "description": "Creates or updates many user preferences from a key/value object.",
+            "response_model": "Dict[str, List[str]]",
+            "status_code": 200,
+        },
     ]
     nested_resources: ClassVar[Dict[str, Any]] = {
         "user_team": {
@@ -686,7 +742,11 @@ class UserManager(AbstractBLLManager, RouterMixin):
 
     @staticmethod
     def generate_jwt_token(
-        user_id: str, email: str, timezone_str: str = "UTC", expiration_hours: int = 24
+        user_id: str,
+        email: str,
+        timezone_str: str = "UTC",
+        expiration_hours: int = 24,
+        claims: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Generate a JWT token for authentication"""
         expiration = datetime.now(timezone.utc) + timedelta(hours=expiration_hours)
@@ -697,6 +757,8 @@ class UserManager(AbstractBLLManager, RouterMixin):
             "exp": expiration,
             "iat": datetime.now(timezone.utc),
         }
+        if claims:
+            payload["authz"] = claims
         return jwt.encode(payload, env("JWT_SECRET"), algorithm="HS256")
 
     @staticmethod
@@ -836,6 +898,14 @@ class UserManager(AbstractBLLManager, RouterMixin):
                             status_code=403, detail="User account is disabled"
                         )
 
+                    # The user row is already loaded, so settle the claims
+                    # version check here instead of in the permission filter
+                    claims = get_request_claims()
+                    if claims and claims.get("sub") == user.id:
+                        claims["_version_ok"] = (
+                            user.membership_version or 0
+                        ) == claims.get("v")
+
                     return user
                 except jwt.ExpiredSignatureError:
                     raise HTTPException(status_code=401, detail="Token has expired")
@@ -984,11 +1054,33 @@ class UserManager(AbstractBLLManager, RouterMixin):
         """Revoke all sessions for a user (nested custom route method)"""
         return self.sessions.revoke_all_user_sessions(user_id=user_id)
 
+    def get_preference_map(self, user_id: str) -> Dict[str, Optional[str]]:
+        """Get all preferences for a user (custom route method)"""
+        return self.metadata.get_preference_map(user_id=user_id)
+
+    def set_preferences(
+        self, user_id: str, body: Dict[str, Any]
+    ) -> Dict[str, List[str]]:
+        """Upsert many preferences for a user (custom route method)"""
+        return self.metadata.set_preferences(body, user_id=user_id)
+
     # Login-specific models (not part of the main entity model system)
     class UserLoginModel(BaseModel):
         email: str = Field(..., description="User's email or username")
         password: str = Field(..., description="User's password")
 
+    @staticmethod
+    def _record_failed_login(
+        user_id: str, ip_address: Optional[str], db, model_registry
+    ) -> None:
+        """Count a failed login and queue it for write-behind persistence."""
+        if failed_login_tracker.record(user_id, ip_address):
+            # Buffer is full (no flush service running or it is behind)
+            try:
+                failed_login_tracker.flush(db, model_registry.DB.manager.Base)
+            except Exception as e:
+                logger.error(f"Failed to flush failed login attempts: {e}")
+
     @staticmethod
     def login(
         login_data: Dict[str, Any] = None,
@@ -1056,24 +1148,26 @@ class UserManager(AbstractBLLManager, RouterMixin):
 
             user = user[0]
 
-            # Check for too many failed login attempts
-            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-            failed_login_count = FailedLoginAttemptModel.DB(
-                model_registry.DB.manager.Base
-            ).count(
-                requester_id=user["id"],
-                model_registry=model_registry,
-                user_id=user["id"],
-                filters=[
-                    FailedLoginAttemptModel.DB(
-                        model_registry.DB.manager.Base
-                    ).created_at
-                    >= one_hour_ago
-                ],
-            )
+            # Check for too many failed login attempts (served from memory,
+            # re-seeded from persisted attempts once per sync interval)
+            if failed_login_tracker.needs_sync(user["id"]):
+                FailedLoginDB = FailedLoginAttemptModel.DB(
+                    model_registry.DB.manager.Base
+                )
+                window_start = datetime.now(timezone.utc) - timedelta(
+                    seconds=failed_login_tracker.window_seconds
+                )
+                failed_login_tracker.seed(
+                    user["id"],
+                    db.query(FailedLoginDB.id, FailedLoginDB.created_at)
+                    .filter(
+                        FailedLoginDB.user_id == user["id"],
+                        FailedLoginDB.created_at >= window_start.replace(tzinfo=None),
+                    )
+                    .all(),
+                )
 
-            max_failed_attempts = 5
-            if failed_login_count >= max_failed_attempts:
+            if failed_login_tracker.is_locked(user["id"]):
                 raise HTTPException(
                     status_code=429,
                     detail="Too many failed login attempts. Please try again later.",
@@ -1081,22 +1175,16 @@ class UserManager(AbstractBLLManager, RouterMixin):
 
             # Check if user account is active
             if not user["active"]:
-                FailedLoginAttemptModel.DB(model_registry.DB.manager.Base).create(
-                    requester_id=user["id"],
-                    model_registry=model_registry,
-                    user_id=user["id"],
-                    ip_address=ip_address,
+                UserManager._record_failed_login(
+                    user["id"], ip_address, db, model_registry
                 )
                 raise HTTPException(status_code=401, detail="Invalid credentials")
 
             # Check if user account was deleted
             # TODO: This is a temporary fix to block users from logging in after they have been deleted but the DB layer should handle this
             if user["deleted_at"]:
-                FailedLoginAttemptModel.DB(model_registry.DB.manager.Base).create(
-                    requester_id=user["id"],
-                    model_registry=model_registry,
-                    user_id=user["id"],
-                    ip_address=ip_address,
+                UserManager._record_failed_login(
+                    user["id"], ip_address, db, model_registry
                 )
                 raise HTTPException(status_code=401, detail="Invalid credentials")
 
@@ -1151,13 +1239,8 @@ class UserManager(AbstractBLLManager, RouterMixin):
                             detail=f"Your password was changed during {change_date}.",
                         )
                     else:
-                        FailedLoginAttemptModel.DB(
-                            model_registry.DB.manager.Base
-                        ).create(
-                            requester_id=user["id"],
-                            model_registry=model_registry,
-                            user_id=user["id"],
-                            ip_address=ip_address,
+                        UserManager._record_failed_login(
+                            user["id"], ip_address, db, model_registry
                         )
                         raise HTTPException(
                             status_code=401, detail="Invalid credentials"
@@ -1174,8 +1257,16 @@ class UserManager(AbstractBLLManager, RouterMixin):
                 if isinstance(user, dict)
                 else getattr(user, "timezone", "UTC")
             )
+            claims = None
+            if env("AUTHZ_CLAIMS").lower() == "true":
+                claims = build_authorization_claims(
+                    str(user["id"]), db, model_registry.DB.manager.Base
+                )
             token = UserManager.generate_jwt_token(
-                user_id=str(user["id"]), email=user["email"], timezone_str=user_timezone
+                user_id=str(user["id"]),
+                email=user["email"],
+                timezone_str=user_timezone,
+                claims=claims,
             )
 
             # Create session
@@ -2131,6 +2222,175 @@ class FailedLoginAttemptManager(AbstractBLLManager, RouterMixin):
         return recent_count >= max_attempts
 
 
+def _utc_epoch(value: datetime) -> float:
+    """Convert a (possibly naive, UTC) datetime to a POSIX timestamp."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class FailedLoginTracker:
+    """
+    Sliding-window failed-login counter with write-behind persistence.
+
+    Lockout decisions are answered from memory. Attempt rows are buffered and
+    written in batches by ``flush`` (normally driven by
+    ``FailedLoginAttemptService``). Every worker re-seeds a user's window from
+    the persisted rows at most once per ``sync_seconds``, so attempts recorded
+    by other workers are counted once they have been flushed.
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+        sync_seconds: Optional[int] = None,
+        max_pending: int = 500,
+    ):
+        self.max_attempts = int(max_attempts or env("LOGIN_MAX_FAILED_ATTEMPTS"))
+        self.window_seconds = int(window_seconds or env("LOGIN_LOCKOUT_WINDOW_SECONDS"))
+        self.sync_seconds = int(sync_seconds or env("FAILED_LOGIN_FLUSH_SECONDS"))
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._windows: Dict[str, Deque[Tuple[float, str]]] = {}
+        self._synced_at: Dict[str, float] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._inflight: List[Dict[str, Any]] = []
+
+    def _prune(self, user_id: str, now: float) -> Deque[Tuple[float, str]]:
+        window = self._windows.setdefault(user_id, deque())
+        cutoff = now - self.window_seconds
+        while window and window[0][0] < cutoff:
+            window.popleft()
+        return window
+
+    def needs_sync(self, user_id: str, now: Optional[float] = None) -> bool:
+        """Whether the user's window should be re-read from the database."""
+        now = time.time() if now is None else now
+        with self._lock:
+            synced_at = self._synced_at.get(user_id)
+            return synced_at is None or now - synced_at >= self.sync_seconds
+
+    def seed(
+        self,
+        user_id: str,
+        persisted: Iterable[Tuple[str, datetime]],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Replace a user's window with persisted ``(id, created_at)`` rows plus
+        any local attempts that have not been committed yet.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            attempts = {
+                row_id: _utc_epoch(created_at) for row_id, created_at in persisted
+            }
+            for row in self._inflight + self._pending:
+                if row["user_id"] == user_id:
+                    attempts[row["id"]] = _utc_epoch(row["created_at"])
+            self._windows[user_id] = deque(
+                sorted((ts, row_id) for row_id, ts in attempts.items())
+            )
+            self._prune(user_id, now)
+            self._synced_at[user_id] = now
+
+    def is_locked(self, user_id: str, now: Optional[float] = None) -> bool:
+        """Whether the user has reached the failed-attempt limit in the window."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return len(self._prune(user_id, now)) >= self.max_attempts
+
+    def record(
+        self, user_id: str, ip_address: Optional[str], now: Optional[float] = None
+    ) -> bool:
+        """
+        Record a failed attempt and queue its row for persistence.
+
+        Returns:
+            True when the pending buffer is full and should be flushed now
+        """
+        now = time.time() if now is None else now
+        row = {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "ip_address": ip_address,
+            "created_at": datetime.fromtimestamp(now, timezone.utc).replace(
+                tzinfo=None
+            ),
+            "created_by_user_id": user_id,
+        }
+        with self._lock:
+            self._prune(user_id, now).append((now, row["id"]))
+            self._pending.append(row)
+            return len(self._pending) >= self.max_pending
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self, db, declarative_base) -> int:
+        """
+        Persist all buffered attempts in a single transaction.
+
+        Rows are put back in the buffer if the write fails, so nothing is lost
+        on a transient database error.
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            rows, self._pending = self._pending, []
+            self._inflight.extend(rows)
+        if not rows:
+            return 0
+
+        db_cls = FailedLoginAttemptModel.DB(declarative_base)
+        hooks = db_cls.hooks
+        before_hooks = hooks["create"]["before"] if "create" in hooks else []
+        after_hooks = hooks["create"]["after"] if "create" in hooks else []
+        try:
+            entities = []
+            for row in rows:
+                data = dict(row)
+                if before_hooks:
+                    hook_dict = HookDict(data)
+                    for hook in before_hooks:
+                        hook(hook_dict, db)
+                    data = {k: v for k, v in hook_dict.items()}
+                entities.append(db_cls(**data))
+            db.add_all(entities)
+            db.commit()
+            for entity in entities if after_hooks else []:
+                for hook in after_hooks:
+                    hook(entity, db)
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._pending = rows + self._pending
+                self._inflight = [r for r in self._inflight if r not in rows]
+            raise
+        with self._lock:
+            written = {row["id"] for row in rows}
+            self._inflight = [r for r in self._inflight if r["id"] not in written]
+        return len(rows)
+
+    def reset(self, user_id: Optional[str] = None) -> None:
+        """Forget in-memory windows (all users, or just ``user_id``)."""
+        with self._lock:
+            if user_id is None:
+                self._windows.clear()
+                self._synced_at.clear()
+            else:
+                self._windows.pop(user_id, None)
+                self._synced_at.pop(user_id, None)
+
+
+failed_login_tracker = FailedLoginTracker()
+
+
 class TeamModel(
     ApplicationModel.Optional,
     UpdateMixinModel.Optional,
@@ -2160,6 +2420,10 @@ class TeamModel(
         }
     ]
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        register_invalidation_hooks(db_cls, affects_permissions=True)
+
     @classmethod
     def user_has_read_access(
         cls, user_id, id, db, referred=False, db_manager=None, model_registry=None
@@ -2298,6 +2562,24 @@ class TeamManager(AbstractBLLManager, RouterMixin):
             "response_model": "Dict[str, str]",
             "status_code": 200,
         },
+        {
+            "path": "/{team_id}/preference",
+            "method": "get",
+            "function": "get_preference_map",
+            "summary": "Get team preferences",
+            "description": "Gets all of a team's preferences as a single key/value object.",
+            "response_model": "Dict[str, str]",
+            "status_code": 200,
+        },
+        {
+            "path": "/{team_id}/preference",
+            "method": "put",
+            "function": "set_preferences",
+            "summary": "Set team preferences",
+            "description": "Creates or updates many team preferences from a key/value object.",
+            "response_model": "Dict[str, List[str]]",
+            "status_code": 200,
+        },
     ]
     nested_resources: ClassVar[Dict[str, Any]] = {
         "invitation": {
@@ -2571,6 +2853,16 @@ class TeamManager(AbstractBLLManager, RouterMixin):
         """Update a user's role within a team (custom route method)"""
         return self.user_teams.patch_role(user_id=user_id, team_id=team_id, body=body)
 
+    def get_preference_map(self, team_id: str) -> Dict[str, Optional[str]]:
+        """Get all preferences for a team (custom route method)"""
+        return self.team_metadata.get_preference_map(team_id=team_id)
+
+    def set_preferences(
+        self, team_id: str, body: Dict[str, Any]
+    ) -> Dict[str, List[str]]:
+        """Upsert many preferences for a team (custom route method)"""
+        return self.team_metadata.set_preferences(body, team_id=team_id)
+
     def revoke_all_invitations(self, team_id: str):
         """Revoke all invitations for a team (nested custom route method)"""
         # Get all invitations for the team
@@ -2615,6 +2907,91 @@ class TeamManager(AbstractBLLManager, RouterMixin):
         return {"invitations": invitations_dict}
 
 
+class PreferenceCache:
+    """
+    Per-worker cache of preference maps.
+
+    Maps are keyed by requester and ``(user_id, team_id)`` scope, so a cached
+    map never widens what a requester could read. Metadata DB hooks and
+    ``MetadataManager.set_preferences`` drop every map naming the affected
+    user or team. Writes made by another worker are seen within
+    ``ttl_seconds`` (``PREFERENCE_CACHE_SECONDS``). Set the TTL to 0 to
+    disable caching.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None, max_entries: int = 10000):
+        self.ttl_seconds = int(
+            ttl_seconds if ttl_seconds is not None else env("PREFERENCE_CACHE_SECONDS")
+        )
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (requester_id, user_id, team_id) -> (preferences, cached_at)
+        self._entries: "OrderedDict[tuple, Tuple[dict, float]]" = OrderedDict()
+
+    def get(
+        self,
+        requester_id: str,
+        user_id: Optional[str],
+        team_id: Optional[str],
+        now: Optional[float] = None,
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """Return a copy of the cached map if present and fresh."""
+        now = time.time() if now is None else now
+        key = (requester_id, user_id, team_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if now - entry[1] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[0])
+
+    def put(
+        self,
+        requester_id: str,
+        user_id: Optional[str],
+        team_id: Optional[str],
+        preferences: Dict[str, Optional[str]],
+        now: Optional[float] = None,
+    ) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        now = time.time() if now is None else now
+        key = (requester_id, user_id, team_id)
+        with self._lock:
+            self._entries[key] = (dict(preferences), now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, user_id: Optional[str] = None, team_id: Optional[str] = None
+    ) -> None:
+        """Drop every map scoped to the user or the team, or all maps."""
+        with self._lock:
+            if user_id is None and team_id is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if (user_id is not None and key[1] == user_id) or (
+                    team_id is not None and key[2] == team_id
+                ):
+                    del self._entries[key]
+
+
+preference_cache = PreferenceCache()
+
+
+def _invalidate_preference_cache(entity, *args) -> None:
+    """DB after-hook for metadata rows: drop the cached maps they belong to."""
+    user_id = getattr(entity, "user_id", None)
+    team_id = getattr(entity, "team_id", None)
+    if user_id or team_id:
+        preference_cache.invalidate(user_id=user_id, team_id=team_id)
+
+
 # Unified Metadata Model
 class MetadataModel(
     ApplicationModel.Optional,
@@ -2636,6 +3013,17 @@ class MetadataModel(
     table_comment: ClassVar[str] = "Unified metadata table for users and teams"
     seed_data: ClassVar[List[Dict[str, Any]]] = []
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        # The registry may import this module more than once; managers read
+        # the cache through the shared DB class so they always see the copy
+        # these hooks invalidate.
+        db_cls.preference_cache = preference_cache
+        hooks = db_cls.hooks
+        for hook_type in ("create", "update", "delete"):
+            if _invalidate_preference_cache not in hooks[hook_type]["after"]:
+                hooks[hook_type]["after"].append(_invalidate_preference_cache)
+
     class Create(BaseModel):
         user_id: Optional[str] = Field(None, description="User ID if user metadata")
         team_id: Optional[str] = Field(None, description="Team ID if team metadata")
@@ -2840,6 +3228,172 @@ class MetadataManager(AbstractBLLManager):
         logger.debug("DEBUG get_preference: returning None")
         return None
 
+    def _preference_scope(
+        self, user_id: Optional[str], team_id: Optional[str]
+    ) -> List[Any]:
+        """Filters selecting the metadata rows of a user and/or team scope."""
+        if not user_id and not team_id:
+            raise HTTPException(
+                status_code=400, detail="Either user_id or team_id is required"
+            )
+        filters = []
+        if user_id:
+            filters.append(self.DB.user_id == user_id)
+        if team_id:
+            filters.append(self.DB.team_id == team_id)
+        return filters
+
+    def get_preference_map(
+        self, user_id: Optional[str] = None, team_id: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get every preference of a user and/or team as one key/value map.
+
+        The map is read in a single query and cached per worker (see
+        ``PreferenceCache``). When a key has several rows, the newest wins.
+        """
+        scope = self._preference_scope(user_id, team_id)
+        cache = self.DB.preference_cache
+        cached = cache.get(self.requester.id, user_id, team_id)
+        if cached is not None:
+            return cached
+
+        records = self.DB.list(
+            requester_id=self.requester.id,
+            model_registry=self.model_registry,
+            filters=scope,
+            order_by=[self.DB.created_at],
+            return_type="db",
+        )
+        preferences = {record.key: record.value for record in records}
+        cache.put(self.requester.id, user_id, team_id, preferences)
+        return preferences
+
+    def set_preferences(
+        self,
+        values: Dict[str, Any],
+        user_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Upsert many preferences of a user and/or team in one transaction.
+
+        Existing keys are rewritten by a single UPDATE and missing keys are
+        added by a single multi-row INSERT, whatever the number of keys. As
+        with ``set_preference``, user preferences never overwrite rows created
+        by ROOT or SYSTEM, and new user rows are owned by the user. Per-row
+        metadata hooks are not run; the preference and response caches are
+        invalidated directly.
+
+        Returns:
+            The keys that were updated and created
+        """
+        from database.StaticPermissions import (
+            PermissionResult,
+            PermissionType,
+            check_permission,
+            is_root_id,
+            is_system_user_id,
+        )
+
+        scope = self._preference_scope(user_id, team_id)
+        if not isinstance(values, dict):
+            raise HTTPException(
+                status_code=400, detail="Preferences must be a key/value object"
+            )
+        values = {
+            str(key): None if value is None else str(value)
+            for key, value in values.items()
+        }
+        if not values:
+            return {"updated": [], "created": []}
+
+        requester_id = self.requester.id
+        privileged = is_root_id(requester_id) or is_system_user_id(requester_id)
+        base = self.model_registry.DB.manager.Base
+        db_cls = self.DB
+        db = self.db
+        try:
+            # Authorize the whole scope once instead of once per row
+            if not privileged:
+                if team_id:
+                    result, _ = check_permission(
+                        requester_id,
+                        TeamModel.DB(base),
+                        team_id,
+                        db,
+                        base,
+                        required_level=PermissionType.EDIT,
+                    )
+                    if result != PermissionResult.GRANTED:
+                        raise HTTPException(
+                            status_code=403,
+                            detail="Not authorized to edit this team's preferences",
+                        )
+                elif user_id != requester_id:
+                    raise HTTPException(
+                        status_code=403,
+                        detail="Not authorized to edit this user's preferences",
+                    )
+
+            conditions = scope + [
+                db_cls.key.in_(list(values)),
+                db_cls.deleted_at.is_(None),
+            ]
+            if user_id and not team_id:
+                conditions.append(
+                    or_(
+                        db_cls.created_by_user_id.is_(None),
+                        db_cls.created_by_user_id.notin_(
+                            [env("ROOT_ID"), env("SYSTEM_ID")]
+                        ),
+                    )
+                )
+
+            existing = set(db.execute(select(db_cls.key).where(*conditions)).scalars())
+            if existing:
+                db.execute(
+                    update(db_cls)
+                    .where(*conditions)
+                    .values(
+                        value=case(
+                            {key: values[key] for key in existing},
+                            value=db_cls.key,
+                        ),
+                        updated_at=version_timestamp(),
+                        updated_by_user_id=requester_id,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+            created = [key for key in values if key not in existing]
+            if created:
+                owner_id = user_id if user_id and not team_id else requester_id
+                db.execute(
+                    insert(db_cls),
+                    [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "user_id": user_id,
+                            "team_id": team_id,
+                            "key": key,
+                            "value": values[key],
+                            "created_by_user_id": owner_id,
+                        }
+                        for key in created
+                    ],
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        db_cls.preference_cache.invalidate(user_id=user_id, team_id=team_id)
+        invalidate_table(db_cls)
+        return {"updated": sorted(existing), "created": created}
+
 
 class TeamMetadataManager(MetadataManager):
     """Alias for backward compatibility - filters by team_id by default"""
@@ -2951,6 +3505,10 @@ class RoleModel(
 
     create_permission_reference: ClassVar[str] = "resource"
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        register_invalidation_hooks(db_cls, affects_permissions=True)
+
     @classmethod
     def user_can_create(cls, user_id, db, **kwargs):
         """
@@ -3134,6 +3692,81 @@ class RoleManager(AbstractBLLManager, RouterMixin):
                 raise HTTPException(status_code=400, detail="Team ID cannot be None")
 
 
+def _bump_membership_version(db, db_cls, ids=(), user_ids=()) -> None:
+    """
+    Advance ``users.membership_version`` for every user whose memberships
+    the rows ``ids`` of ``db_cls`` affect, plus ``user_ids``, so
+    authorization claims issued before the change are no longer trusted by
+    the permission filter.
+
+    ``db`` is the session or connection of the membership write itself, so
+    the bump commits or rolls back together with it.
+    """
+    # Generated DB classes derive from their declarative base first
+    base = db_cls.__bases__[0]
+    tables = db_cls.metadata.tables
+    users = tables[UserModel.DB(base).__tablename__]
+    table = db_cls.__table__
+
+    conditions = []
+    user_ids = [user_id for user_id in user_ids if user_id]
+    if user_ids:
+        conditions.append(users.c.id.in_(user_ids))
+    if ids and "user_id" in table.c:
+        conditions.append(
+            users.c.id.in_(select(table.c.user_id).where(table.c.id.in_(ids)))
+        )
+    if ids and db_cls.__tablename__ == InvitationModel.DB(base).__tablename__:
+        invitees = tables[InviteeModel.DB(base).__tablename__]
+        conditions.append(
+            users.c.id.in_(
+                select(invitees.c.user_id).where(invitees.c.invitation_id.in_(ids))
+            )
+        )
+    if not conditions:
+        return
+
+    db.execute(
+        update(users)
+        .where(or_(*conditions))
+        .values(membership_version=func.coalesce(users.c.membership_version, 0) + 1)
+    )
+
+    # Re-check the version of this request's claims on next use
+    claims = get_request_claims()
+    if claims:
+        claims.pop("_version_ok", None)
+
+
+def _membership_row_flushed(mapper, connection, target) -> None:
+    """ORM flush listener bumping the versions for one membership row."""
+    user_ids = []
+    if "user_id" in mapper.columns:
+        # A reassigned row affects both its previous and its current user
+        user_ids = [target.user_id, *inspect(target).attrs.user_id.history.deleted]
+    _bump_membership_version(connection, type(target), [target.id], user_ids)
+
+
+def _membership_rows_bulk_written(db_cls, ids, updated, db) -> None:
+    """``bulk`` before-hook bumping the versions for one chunk of rows."""
+    _bump_membership_version(db, db_cls, ids, [(updated or {}).get("user_id")])
+
+
+def _register_membership_version_hooks(db_cls) -> None:
+    """
+    Bump membership versions inside every write of ``db_cls``.
+
+    Entity writes are covered by flush listeners and set-based writes by a
+    ``bulk`` hook, so the bump is always part of the membership transaction.
+    """
+    for name in ("after_insert", "after_update", "after_delete"):
+        if not event.contains(db_cls, name, _membership_row_flushed):
+            event.listen(db_cls, name, _membership_row_flushed)
+    bulk_hooks = db_cls.hooks["bulk"]["before"]
+    if _membership_rows_bulk_written not in bulk_hooks:
+        bulk_hooks.append(_membership_rows_bulk_written)
+
+
 class UserTeamModel(
     ApplicationModel,
     UpdateMixinModel,
@@ -3153,6 +3786,11 @@ class UserTeamModel(
         "Junction table linking users to teams with assigned roles"
     )
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        _register_membership_version_hooks(db_cls)
+        register_invalidation_hooks(db_cls, affects_permissions=True)
+
     class Create(
         BaseModel,
         UserModel.Reference.ID,
@@ -3683,6 +4321,10 @@ class PermissionModel(
     )
     create_permission_reference: ClassVar[str] = "resource"
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        register_invalidation_hooks(db_cls, affects_permissions=True)
+
     class Create(
         BaseModel,
         UserModel.Reference.ID.Optional,
@@ -3842,6 +4484,11 @@ class InvitationModel(
         "Invitations to join teams, can be direct or via invitation code"
     )
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        _register_membership_version_hooks(db_cls)
+        register_invalidation_hooks(db_cls, affects_permissions=True)
+
     class Create(
         BaseModel,
         TeamModel.Reference.ID.Optional,
@@ -4473,6 +5120,11 @@ class InviteeModel(
     # Database metadata for SQLAlchemy generation
     table_comment: ClassVar[str] = "Tracks specific individuals invited to join a team"
 
+    @classmethod
+    def register_db_hooks(cls, db_cls) -> None:
+        _register_membership_version_hooks(db_cls)
+        register_invalidation_hooks(db_cls, affects_permissions=True)
+
     class Create(
         BaseModel, InvitationModel.Reference.ID, UserModel.Reference.ID.Optional
     ):
@@ -4972,7 +5624,6 @@ class SessionModel(
         )
 
     class Search(ApplicationModel.Search, UserModel.Reference.ID.Search):
-        session_key: Optional[StringSearchModel] = None
         is_active: Optional[bool] = None
         revoked: Optional[bool] = None
         expires_at: Optional[DateSearchModel] = None
@@ -4982,6 +5633,239 @@ class SessionModel(
         trust_score: Optional[NumericalSearchModel] = None
 
 
+class SessionRevocations:
+    """
+    Host-wide session revocation generation shared through SQLite.
+
+    Every worker on the host opens the same file, like ``ResponseCache``.
+    Each revocation bumps the generation, and ``SessionValidationCache``
+    only trusts entries cached under the current one, so a revocation made
+    by any worker takes effect on the next request in all of them.
+
+    Args:
+        path: SQLite file; defaults to ``SESSION_REVOCATION_PATH`` or a file
+            named after ``APP_NAME`` in the system temp directory
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._local = threading.local()
+
+    @property
+    def path(self) -> str:
+        if not self._path:
+            self._path = env("SESSION_REVOCATION_PATH") or os.path.join(
+                tempfile.gettempdir(),
+                f"{str(env('APP_NAME')).lower()}.session-revocations.db",
+            )
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened after a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS revocations ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), generation INTEGER NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def generation(self) -> Optional[int]:
+        """Current generation, or None when the store cannot be read."""
+        try:
+            row = (
+                self._connection()
+                .execute("SELECT generation FROM revocations WHERE id = 0")
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Session revocation read failed: {e}")
+            return None
+        return row[0] if row else 0
+
+    def bump(self) -> None:
+        """Advance the generation, retiring every cached validation."""
+        try:
+            self._connection().execute(
+                "INSERT INTO revocations (id, generation) VALUES (0, 1) "
+                "ON CONFLICT(id) DO UPDATE SET generation = generation + 1"
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Session revocation broadcast failed: {e}")
+
+
+class SessionValidationCache:
+    """
+    Per-worker cache of positive ``validate_session`` results.
+
+    Entries are trusted for at most ``ttl_seconds`` (``SESSION_CACHE_SECONDS``)
+    before the session row is read again. Expiry is re-checked on every hit.
+    With ``revocations``, each entry records the revocation generation taken
+    before its session row was read and is dropped once the generation moves,
+    so revocations made by any worker on the host apply immediately. When the
+    generation cannot be read nothing is trusted from the cache. Set the TTL
+    to 0 to disable caching.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        max_entries: int = 10000,
+        revocations: Optional[SessionRevocations] = None,
+    ):
+        self.ttl_seconds = int(
+            ttl_seconds if ttl_seconds is not None else env("SESSION_CACHE_SECONDS")
+        )
+        self.max_entries = max_entries
+        self.revocations = revocations
+        self._lock = threading.Lock()
+        # (requester_id, session_key) ->
+        #     (session_id, user_id, expires_at, cached_at, generation)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, str, float, float, int]]" = (
+            OrderedDict()
+        )
+
+    def generation(self) -> Optional[int]:
+        """Revocation generation to pass to ``put`` for a row read after this call."""
+        if self.ttl_seconds <= 0:
+            return None
+        if self.revocations is None:
+            return 0
+        return self.revocations.generation()
+
+    def get(
+        self, requester_id: str, session_key: str, now: Optional[float] = None
+    ) -> Optional[Tuple[str, str, float]]:
+        """Return ``(session_id, user_id, expires_at)`` if cached and fresh."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get((requester_id, session_key))
+            if entry is None:
+                return None
+            if now - entry[3] >= self.ttl_seconds:
+                del self._entries[(requester_id, session_key)]
+                return None
+        generation = self.generation()
+        if generation != entry[4]:
+            with self._lock:
+                self._entries.pop((requester_id, session_key), None)
+            return None
+        return entry[:3]
+
+    def put(
+        self,
+        requester_id: str,
+        session_key: str,
+        session_id: str,
+        user_id: str,
+        expires_at: datetime,
+        now: Optional[float] = None,
+        generation: Optional[int] = 0,
+    ) -> None:
+        if self.ttl_seconds <= 0 or generation is None:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            self._entries[(requester_id, session_key)] = (
+                session_id,
+                user_id,
+                _utc_epoch(expires_at),
+                now,
+                generation,
+            )
+            self._entries.move_to_end((requester_id, session_key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Drop entries for a session id, for every session of a user, or all,
+        and bump the shared generation so other workers drop theirs.
+        """
+        with self._lock:
+            if session_id is None and user_id is None:
+                self._entries.clear()
+            else:
+                for key, entry in list(self._entries.items()):
+                    if entry[0] == session_id or entry[1] == user_id:
+                        del self._entries[key]
+        if self.revocations is not None:
+            self.revocations.bump()
+
+
+class SessionActivityBuffer:
+    """
+    Coalesces ``last_activity`` bumps and writes them in one statement.
+
+    Only the most recent timestamp per session is kept between flushes, so a
+    busy session costs one row update per flush interval no matter how many
+    requests it makes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[str, datetime] = {}
+
+    def touch(self, session_id: str, at: Optional[datetime] = None) -> None:
+        at = at or datetime.now(timezone.utc)
+        with self._lock:
+            current = self._pending.get(session_id)
+            if current is None or current < at:
+                self._pending[session_id] = at
+
+    def discard(self, session_ids: Iterable[str]) -> None:
+        with self._lock:
+            for session_id in session_ids:
+                self._pending.pop(session_id, None)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self, db, declarative_base) -> int:
+        """
+        Write all buffered timestamps with a single executemany UPDATE.
+
+        Returns:
+            Number of sessions updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        db_cls = SessionModel.DB(declarative_base)
+        try:
+            db.execute(
+                update(db_cls.__table__)
+                .where(db_cls.__table__.c.id == bindparam("session_id"))
+                .values(last_activity=bindparam("last_activity")),
+                [
+                    {"session_id": session_id, "last_activity": at}
+                    for session_id, at in pending.items()
+                ],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            for session_id, at in pending.items():
+                self.touch(session_id, at)
+            raise
+        return len(pending)
+
+
+session_validation_cache = SessionValidationCache(revocations=SessionRevocations())
+session_activity_buffer = SessionActivityBuffer()
+
+
 class SessionManager(AbstractBLLManager, RouterMixin):
     _model = SessionModel
 
@@ -5059,108 +5943,121 @@ class SessionManager(AbstractBLLManager, RouterMixin):
             id=id,
             new_properties={"revoked": True, "is_active": False},
         )
+        session_validation_cache.invalidate(session_id=id)
+        session_activity_buffer.discard([id])
 
         return {"message": "Session revoked successfully"}
 
     def revoke_all_user_sessions(self, user_id: str) -> Dict[str, Any]:
         """Revoke all active sessions for a user"""
-        sessions = self.Model.DB(self.model_registry.DB.manager.Base).list(
+        SessionDB = self.Model.DB(self.model_registry.DB.manager.Base)
+        session_ids = [
+            key[0]
+            for key in SessionDB.list(
+                requester_id=self.requester.id,
+                model_registry=self.model_registry,
+                return_type="keys",
+                user_id=user_id,
+                is_active=True,
+                revoked=False,
+            )
+        ]
+        revoked_count = SessionDB.bulk_update(
             requester_id=self.requester.id,
             model_registry=self.model_registry,
+            new_properties={"is_active": False, "revoked": True},
             user_id=user_id,
             is_active=True,
             revoked=False,
         )
-
-        revoked_count = 0
-        for session in sessions:
-            session_id = session["id"] if isinstance(session, dict) else session.id
-            self.Model.DB(self.model_registry.DB.manager.Base).update(
-                requester_id=self.requester.id,
-                model_registry=self.model_registry,
-                id=session_id,
-                new_properties={"is_active": False, "revoked": True},
-            )
-            revoked_count += 1
+        session_validation_cache.invalidate(user_id=user_id)
+        session_activity_buffer.discard(session_ids)
 
         return {
             "message": f"Revoked {revoked_count} sessions successfully",
             "revoked_count": revoked_count,
         }
 
-    def update_activity(self, session_key: str) -> Dict[str, str]:
-        """Update the last activity timestamp for a session"""
+    def _resolve_session(self, session_key: str) -> Optional[Tuple[str, str, float]]:
+        """
+        Resolve an active, unrevoked session to ``(id, user_id, expires_at)``,
+        using the validation cache when the entry is fresh.
+        """
+        cached = session_validation_cache.get(self.requester.id, session_key)
+        if cached is not None:
+            return cached
+
+        # Taken before the read so a revocation racing it stales the entry
+        generation = session_validation_cache.generation()
+
         sessions = self.Model.DB(self.model_registry.DB.manager.Base).list(
             requester_id=self.requester.id,
             model_registry=self.model_registry,
             session_key=session_key,
+            is_active=True,
+            revoked=False,
         )
-
         if not sessions:
-            raise HTTPException(status_code=404, detail="Session not found")
+            return None
 
         session = sessions[0]
-        session_id = session["id"] if isinstance(session, dict) else session.id
-
-        self.Model.DB(self.model_registry.DB.manager.Base).update(
-            requester_id=self.requester.id,
-            model_registry=self.model_registry,
-            id=session_id,
-            new_properties={"last_activity": datetime.now(timezone.utc)},
+        if not isinstance(session, dict):
+            session = {
+                "id": session.id,
+                "user_id": session.user_id,
+                "expires_at": session.expires_at,
+            }
+        session_validation_cache.put(
+            self.requester.id,
+            session_key,
+            session["id"],
+            session["user_id"],
+            session["expires_at"],
+            generation=generation,
         )
+        return session["id"], session["user_id"], _utc_epoch(session["expires_at"])
+
+    def update_activity(self, session_key: str) -> Dict[str, str]:
+        """
+        Record activity for a session.
+
+        The timestamp is buffered and written by ``SessionActivityService`` in
+        a single bulk update per flush interval.
+        """
+        session = self._resolve_session(session_key)
+        if session is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        session_activity_buffer.touch(session[0])
 
         return {"message": "Session activity updated successfully"}
 
     def validate_session(self, session_key: str) -> bool:
         """Validate if a session is active and not expired"""
-        sessions = self.Model.DB(self.model_registry.DB.manager.Base).list(
-            requester_id=self.requester.id,
-            model_registry=self.model_registry,
-            session_key=session_key,
-            is_active=True,
-            revoked=False,
-        )
-
-        if not sessions:
+        session = self._resolve_session(session_key)
+        if session is None:
             return False
 
-        session = sessions[0]
-        expires_at = (
-            session["expires_at"] if isinstance(session, dict) else session.expires_at
-        )
-
-        # Handle timezone comparison
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-
-        return expires_at > datetime.now(timezone.utc)
+        return session[2] > time.time()
 
     def cleanup_expired_sessions(self) -> Dict[str, Any]:
-        """Clean up expired sessions"""
-        current_time = datetime.now(timezone.utc)
+        """
+        Deactivate expired sessions with chunked set-based updates.
 
-        # Find expired sessions
-        expired_sessions = self.Model.DB(self.model_registry.DB.manager.Base).list(
+        ``SessionReaperService`` runs this on a schedule and also purges
+        sessions past the retention period.
+        """
+        SessionDB = self.Model.DB(self.model_registry.DB.manager.Base)
+        cleaned_count = SessionDB.bulk_update(
             requester_id=self.requester.id,
             model_registry=self.model_registry,
+            new_properties={"is_active": False},
             filters=[
-                self.Model.DB(self.model_registry.DB.manager.Base).expires_at
-                < current_time,
-                self.Model.DB(self.model_registry.DB.manager.Base).is_active == True,
+                SessionDB.expires_at < datetime.now(timezone.utc).replace(tzinfo=None),
+                SessionDB.is_active == True,
             ],
         )
 
-        cleaned_count = 0
-        for session in expired_sessions:
-            session_id = session["id"] if isinstance(session, dict) else session.id
-            self.Model.DB(self.model_registry.DB.manager.Base).update(
-                requester_id=self.requester.id,
-                model_registry=self.model_registry,
-                id=session_id,
-                new_properties={"is_active": False},
-            )
-            cleaned_count += 1
-
         return {
             "message": f"Cleaned up {cleaned_count} expired sessions",
             "cleaned_count": cleaned_count,
@@ -23,6 +23,7 @@ from logic.BLL_Auth import (
     InviteeManager,
     MetadataManager,
     PermissionManager,
+    PreferenceCache,
     RoleManager,
     SessionManager,
     TeamManager,
@@ -503,6 +504,47 @@ class TestMetadataManager(AbstractBLLTest):
         value = mgr.get_preference("nonexistent", user_id=test_user.id)
         assert value is None
 
+    def test_set_preferences_bulk(self, admin_a, server, model_registry):
+        """Test set_preferences upserts many keys and refreshes the cached map"""
+        user_data = {
+            "email": f"test_metadata_bulk_{uuid.uuid4().hex[:8]}@example.com",
+            "username": f"test_metadata_bulk_user_{uuid.uuid4().hex[:8]}",
+            "password": "TestPass123!",
+        }
+        test_user = UserManager.register(user_data, model_registry)
+
+        mgr = self.class_under_test(
+            requester_id=test_user.id, model_registry=model_registry
+        )
+        mgr.set_preference("theme", "light", user_id=test_user.id)
+        assert mgr.get_preference_map(user_id=test_user.id)["theme"] == "light"
+
+        result = mgr.set_preferences(
+            {"theme": "dark", "language": "fr", "page_size": 50},
+            user_id=test_user.id,
+        )
+        assert result["updated"] == ["theme"]
+        assert sorted(result["created"]) == ["language", "page_size"]
+
+        preferences = mgr.get_preference_map(user_id=test_user.id)
+        assert preferences["theme"] == "dark"
+        assert preferences["language"] == "fr"
+        assert preferences["page_size"] == "50"
+        assert mgr.get_preference("theme", user_id=test_user.id) == "dark"
+
+        # Single-row writes go through the metadata hooks
+        mgr.set_preference("language", "de", user_id=test_user.id)
+        assert mgr.get_preference_map(user_id=test_user.id)["language"] == "de"
+
+    def test_set_preferences_requires_access(self, admin_a, server, model_registry):
+        """Test set_preferences rejects another user's scope"""
+        mgr = self.class_under_test(
+            requester_id=admin_a.id, model_registry=model_registry
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            mgr.set_preferences({"theme": "dark"}, user_id=str(uuid.uuid4()))
+        assert exc_info.value.status_code == 403
+
 
 class TestUserTeamManager(AbstractBLLTest):
     class_under_test = UserTeamManager
@@ -3054,3 +3096,30 @@ class TestPermissionManager(AbstractBLLTest):
             f"Entity not found when searching {search_field} with operator '{search_operator}' "
             f"and value '{search_value}' (type: {type(search_value).__name__}). Found {len(results)} results."
         )
+
+
+class TestPreferenceCache:
+    """Per-worker preference map cache, no database involved."""
+
+    def test_entries_expire_after_ttl(self):
+        cache = PreferenceCache(ttl_seconds=10)
+        cache.put("requester", "user", None, {"theme": "dark"}, now=1000)
+        assert cache.get("requester", "user", None, now=1005) == {"theme": "dark"}
+        assert cache.get("other", "user", None, now=1005) is None
+        assert cache.get("requester", "user", None, now=1010) is None
+
+    def test_invalidate_by_user_and_team(self):
+        cache = PreferenceCache(ttl_seconds=60)
+        cache.put("a", "user", None, {}, now=1000)
+        cache.put("b", "user", "team", {}, now=1000)
+        cache.put("a", None, "team", {}, now=1000)
+        cache.put("a", "other", None, {}, now=1000)
+
+        cache.invalidate(user_id="user")
+        assert cache.get("a", "user", None, now=1001) is None
+        assert cache.get("b", "user", "team", now=1001) is None
+        assert cache.get("a", None, "team", now=1001) == {}
+
+        cache.invalidate(team_id="team")
+        assert cache.get("a", None, "team", now=1001) is None
+        assert cache.get("a", "other", None, now=1001) == {}
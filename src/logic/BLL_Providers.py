@@ -543,7 +543,6 @@ class ProviderInstanceModel(
         ProviderModel.Reference.ID.Search,
     ):
         model_name: Optional[StringSearchModel] = None
-        api_key: Optional[StringSearchModel] = None
 
 
 class ProviderInstanceManager(AbstractBLLManager, RouterMixin):
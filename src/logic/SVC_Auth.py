@@ -0,0 +1,302 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from lib.Environment import env
+from lib.Logging import logger
+from logic.AbstractService import AbstractService
+from logic.BLL_Auth import (
+    FailedLoginAttemptModel,
+    FailedLoginTracker,
+    SessionActivityBuffer,
+    SessionModel,
+    failed_login_tracker,
+    session_activity_buffer,
+)
+
+
+class FailedLoginAttemptService(AbstractService):
+    """
+    Write-behind flusher and retention pruner for failed login attempts.
+
+    Each run writes the attempts buffered by ``FailedLoginTracker`` in one
+    transaction, then deletes persisted attempts older than the retention
+    period in bounded batches.
+    """
+
+    def __init__(
+        self,
+        requester_id: str,
+        db: Optional[Session] = None,
+        interval_seconds: int = None,
+        max_failures: int = 3,
+        retry_delay_seconds: int = 5,
+        service_id: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            requester_id=requester_id,
+            db=db,
+            interval_seconds=(
+                interval_seconds
+                if interval_seconds is not None
+                else int(env("FAILED_LOGIN_FLUSH_SECONDS"))
+            ),
+            max_failures=max_failures,
+            retry_delay_seconds=retry_delay_seconds,
+            service_id=service_id,
+            **kwargs,
+        )
+
+    def _configure_service(self, **kwargs) -> None:
+        self.tracker: FailedLoginTracker = kwargs.get("tracker", failed_login_tracker)
+        self.retention_days = int(
+            kwargs.get("retention_days") or env("FAILED_LOGIN_RETENTION_DAYS")
+        )
+        self.prune_batch_size = kwargs.get("prune_batch_size", 1000)
+        self.prune_interval_seconds = kwargs.get("prune_interval_seconds", 3600)
+        self._last_prune_time = 0.0
+        self.metrics = {"flushed": 0, "pruned": 0, "errors": 0}
+
+    @property
+    def declarative_base(self):
+        return self.db_manager.Base
+
+    def flush(self) -> int:
+        """Write all buffered attempts now."""
+        written = self.tracker.flush(self.db, self.declarative_base)
+        self.metrics["flushed"] += written
+        if written:
+            logger.debug(f"Flushed {written} failed login attempts")
+        return written
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """Delete attempts older than the retention period in bounded batches."""
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=self.retention_days)).replace(tzinfo=None)
+        db_cls = FailedLoginAttemptModel.DB(self.declarative_base)
+
+        total = 0
+        while True:
+            batch = select(db_cls.id).where(db_cls.created_at < cutoff)
+            batch = batch.limit(self.prune_batch_size).scalar_subquery()
+            result = self.db.execute(
+                delete(db_cls)
+                .where(db_cls.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            total += result.rowcount or 0
+            if (result.rowcount or 0) < self.prune_batch_size:
+                break
+
+        self.metrics["pruned"] += total
+        if total:
+            logger.debug(f"Pruned {total} failed login attempts older than {cutoff}")
+        return total
+
+    async def update(self) -> None:
+        try:
+            self.flush()
+            if self._last_run_time - self._last_prune_time >= (
+                self.prune_interval_seconds
+            ):
+                self._last_prune_time = self._last_run_time
+                self.prune()
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Error in {self.__class__.__name__}: {str(e)}")
+            raise
+
+    def cleanup(self) -> None:
+        tracker = getattr(self, "tracker", None)
+        if tracker is not None and tracker.pending_count and self.db_manager:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush failed login attempts on shutdown: {e}")
+        super().cleanup()
+
+
+class SessionActivityService(AbstractService):
+    """
+    Write-behind flusher for session ``last_activity`` timestamps.
+
+    ``SessionManager.update_activity`` only records the timestamp in memory;
+    this service writes every buffered session in a single bulk update.
+    """
+
+    def __init__(
+        self,
+        requester_id: str,
+        db: Optional[Session] = None,
+        interval_seconds: int = None,
+        max_failures: int = 3,
+        retry_delay_seconds: int = 5,
+        service_id: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            requester_id=requester_id,
+            db=db,
+            interval_seconds=(
+                interval_seconds
+                if interval_seconds is not None
+                else int(env("SESSION_ACTIVITY_FLUSH_SECONDS"))
+            ),
+            max_failures=max_failures,
+            retry_delay_seconds=retry_delay_seconds,
+            service_id=service_id,
+            **kwargs,
+        )
+
+    def _configure_service(self, **kwargs) -> None:
+        self.buffer: SessionActivityBuffer = kwargs.get(
+            "buffer", session_activity_buffer
+        )
+        self.metrics = {"flushed": 0, "errors": 0}
+
+    def flush(self) -> int:
+        """Write all buffered activity timestamps now."""
+        written = self.buffer.flush(self.db, self.db_manager.Base)
+        self.metrics["flushed"] += written
+        if written:
+            logger.debug(f"Flushed activity for {written} sessions")
+        return written
+
+    async def update(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Error in {self.__class__.__name__}: {str(e)}")
+            raise
+
+    def cleanup(self) -> None:
+        buffer = getattr(self, "buffer", None)
+        if buffer is not None and buffer.pending_count and self.db_manager:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush session activity on shutdown: {e}")
+        super().cleanup()
+
+
+class SessionReaperService(AbstractService):
+    """
+    Scheduled reaper for expired sessions.
+
+    Each run deactivates sessions past ``expires_at`` and then hard-deletes
+    sessions that expired more than ``retention_days`` ago. Both steps use
+    chunked set-based statements, one transaction per ``chunk_size`` rows,
+    so no transaction spans the whole sweep. Sweeps run in a worker thread
+    under the ``session-reaper`` database lock, so only one process sweeps
+    at a time. Throughput is logged and kept in ``metrics``.
+    """
+
+    def __init__(
+        self,
+        requester_id: str,
+        db: Optional[Session] = None,
+        interval_seconds: int = None,
+        max_failures: int = 3,
+        retry_delay_seconds: int = 5,
+        service_id: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            requester_id=requester_id,
+            db=db,
+            interval_seconds=(
+                interval_seconds
+                if interval_seconds is not None
+                else int(env("SESSION_REAPER_SECONDS"))
+            ),
+            max_failures=max_failures,
+            retry_delay_seconds=retry_delay_seconds,
+            service_id=service_id,
+            **kwargs,
+        )
+
+    def _configure_service(self, **kwargs) -> None:
+        self.model_registry = kwargs.get("model_registry")
+        if self.db_manager is None and self.model_registry is not None:
+            self.db_manager = self.model_registry.DB.manager
+        self.chunk_size = int(
+            kwargs.get("chunk_size") or env("SESSION_REAPER_CHUNK_SIZE")
+        )
+        self.retention_days = int(
+            kwargs.get("retention_days") or env("SESSION_RETENTION_DAYS")
+        )
+        self.metrics = {
+            "expired": 0,
+            "purged": 0,
+            "errors": 0,
+            "last_run_seconds": 0.0,
+            "last_rows_per_second": 0.0,
+        }
+
+    def reap(self, now: Optional[datetime] = None) -> dict:
+        """Run one expire-and-purge sweep and return its statistics."""
+        now = (now or datetime.now(timezone.utc)).replace(tzinfo=None)
+        SessionDB = SessionModel.DB(self.model_registry.DB.manager.Base)
+        started = time.perf_counter()
+
+        expired = SessionDB.bulk_update(
+            requester_id=self.requester_id,
+            model_registry=self.model_registry,
+            new_properties={"is_active": False},
+            filters=[SessionDB.expires_at < now, SessionDB.is_active == True],
+            chunk_size=self.chunk_size,
+        )
+        purged = SessionDB.bulk_purge(
+            requester_id=self.requester_id,
+            model_registry=self.model_registry,
+            filters=[SessionDB.expires_at < now - timedelta(days=self.retention_days)],
+            chunk_size=self.chunk_size,
+        )
+
+        elapsed = time.perf_counter() - started
+        rows_per_second = (expired + purged) / elapsed if elapsed > 0 else 0.0
+        self.metrics["expired"] += expired
+        self.metrics["purged"] += purged
+        self.metrics["last_run_seconds"] = elapsed
+        self.metrics["last_rows_per_second"] = rows_per_second
+
+        if expired or purged:
+            logger.info(
+                f"Session reaper expired {expired} and purged {purged} sessions "
+                f"in {elapsed:.2f}s ({rows_per_second:.0f} rows/s)"
+            )
+        return {
+            "expired": expired,
+            "purged": purged,
+            "seconds": elapsed,
+            "rows_per_second": rows_per_second,
+        }
+
+    def reap_exclusive(self, now: Optional[datetime] = None) -> Optional[dict]:
+        """
+        Run ``reap`` unless another process is already sweeping.
+
+        Every worker schedules the reaper, but the sweep is guarded by a
+        database lock so only one of them runs it at a time.
+        """
+        with self.db_manager.try_lock("session-reaper") as acquired:
+            if not acquired:
+                logger.debug("Session reaper skipped, another process is sweeping")
+                return None
+            return self.reap(now)
+
+    async def update(self) -> None:
+        try:
+            # The sweep is blocking database work; keep it off the event loop
+            await asyncio.to_thread(self.reap_exclusive)
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Error in {self.__class__.__name__}: {str(e)}")
+            raise
@@ -0,0 +1,316 @@
+import base64
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from conftest import create_user
+from lib.Environment import env
+from logic.BLL_Auth import (
+    FailedLoginAttemptModel,
+    FailedLoginTracker,
+    SessionActivityBuffer,
+    SessionManager,
+    SessionModel,
+    SessionRevocations,
+    SessionValidationCache,
+    UserManager,
+    failed_login_tracker,
+    session_activity_buffer,
+)
+from logic.SVC_Auth import (
+    FailedLoginAttemptService,
+    SessionActivityService,
+    SessionReaperService,
+)
+
+
+class TestFailedLoginTracker:
+    """In-memory sliding window behaviour, no database involved."""
+
+    def test_locks_after_max_attempts(self):
+        tracker = FailedLoginTracker(max_attempts=3, window_seconds=60)
+        for i in range(2):
+            tracker.record("user", "127.0.0.1", now=1000 + i)
+        assert not tracker.is_locked("user", now=1002)
+        tracker.record("user", "127.0.0.1", now=1002)
+        assert tracker.is_locked("user", now=1003)
+        assert not tracker.is_locked("other", now=1003)
+
+    def test_window_slides(self):
+        tracker = FailedLoginTracker(max_attempts=2, window_seconds=60)
+        tracker.record("user", None, now=1000)
+        tracker.record("user", None, now=1030)
+        assert tracker.is_locked("user", now=1031)
+        # First attempt leaves the window
+        assert not tracker.is_locked("user", now=1061)
+
+    def test_seed_merges_unflushed_attempts(self):
+        tracker = FailedLoginTracker(max_attempts=3, window_seconds=60, sync_seconds=10)
+        tracker.record("user", None, now=1000)
+        assert tracker.needs_sync("user", now=1000)
+
+        persisted = [
+            (str(uuid.uuid4()), datetime.fromtimestamp(990, timezone.utc)),
+            # Outside of the window, dropped on seed
+            (str(uuid.uuid4()), datetime.fromtimestamp(900, timezone.utc)),
+        ]
+        tracker.seed("user", persisted, now=1001)
+        assert not tracker.needs_sync("user", now=1005)
+        assert tracker.needs_sync("user", now=1011)
+
+        tracker.record("user", None, now=1002)
+        assert tracker.is_locked("user", now=1003)
+        assert tracker.pending_count == 2
+
+
+class TestFailedLoginAttemptService:
+    """Write-behind flush and retention pruning against the test database."""
+
+    @pytest.fixture
+    def service(self, model_registry):
+        tracker = FailedLoginTracker(max_attempts=3, window_seconds=3600)
+        service = FailedLoginAttemptService(
+            requester_id=env("SYSTEM_ID"),
+            db_manager=model_registry.DB.manager,
+            tracker=tracker,
+            prune_batch_size=2,
+        )
+        yield service
+        service.cleanup()
+
+    def _attempts(self, model_registry, user_id):
+        FailedLogin = FailedLoginAttemptModel.DB(model_registry.DB.manager.Base)
+        with model_registry.database_manager._get_db_session() as session:
+            return (
+                session.query(FailedLogin).filter(FailedLogin.user_id == user_id).all()
+            )
+
+    async def test_update_flushes_pending(self, server, model_registry, service):
+        user = create_user(server)
+        service.tracker.record(user.id, "10.0.0.1")
+        service.tracker.record(user.id, "10.0.0.2")
+        assert self._attempts(model_registry, user.id) == []
+
+        await service.update()
+
+        attempts = self._attempts(model_registry, user.id)
+        assert sorted(a.ip_address for a in attempts) == ["10.0.0.1", "10.0.0.2"]
+        assert service.tracker.pending_count == 0
+        assert service.metrics["flushed"] == 2
+
+    def test_prune_deletes_expired_in_batches(self, server, model_registry, service):
+        user = create_user(server)
+        long_ago = (datetime.now(timezone.utc) - timedelta(days=400)).timestamp()
+        for i in range(5):
+            service.tracker.record(user.id, None, now=long_ago + i)
+        service.tracker.record(user.id, None)
+        service.flush()
+
+        assert service.prune() >= 5
+        assert len(self._attempts(model_registry, user.id)) == 1
+
+    def test_login_lockout(self, server, model_registry):
+        user = create_user(server)
+        failed_login_tracker.reset(user.id)
+        bad = base64.b64encode(f"{user.email}:wrong".encode()).decode()
+
+        for _ in range(failed_login_tracker.max_attempts):
+            with pytest.raises(HTTPException) as exc:
+                UserManager.login(
+                    ip_address="127.0.0.1",
+                    authorization=f"Basic {bad}",
+                    model_registry=model_registry,
+                )
+            assert exc.value.status_code == 401
+
+        with pytest.raises(HTTPException) as exc:
+            UserManager.login(
+                ip_address="127.0.0.1",
+                authorization=f"Basic {bad}",
+                model_registry=model_registry,
+            )
+        assert exc.value.status_code == 429
+        failed_login_tracker.reset(user.id)
+
+
+class TestSessionValidationCache:
+    def test_entries_expire_after_ttl(self):
+        cache = SessionValidationCache(ttl_seconds=10)
+        expires = datetime.now(timezone.utc) + timedelta(days=1)
+        cache.put("requester", "key", "session", "user", expires, now=1000)
+        assert cache.get("requester", "key", now=1005)[0] == "session"
+        assert cache.get("other", "key", now=1005) is None
+        assert cache.get("requester", "key", now=1010) is None
+
+    def test_invalidate_by_session_and_user(self):
+        cache = SessionValidationCache(ttl_seconds=10)
+        expires = datetime.now(timezone.utc) + timedelta(days=1)
+        cache.put("r", "a", "session-a", "user-1", expires, now=1000)
+        cache.put("r", "b", "session-b", "user-1", expires, now=1000)
+        cache.put("r", "c", "session-c", "user-2", expires, now=1000)
+
+        cache.invalidate(session_id="session-a")
+        assert cache.get("r", "a", now=1001) is None
+        cache.invalidate(user_id="user-1")
+        assert cache.get("r", "b", now=1001) is None
+        assert cache.get("r", "c", now=1001) is not None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = SessionValidationCache(ttl_seconds=0)
+        cache.put("r", "a", "s", "u", datetime.now(timezone.utc), now=1000)
+        assert cache.get("r", "a", now=1000) is None
+
+    def test_revocation_reaches_other_workers(self, tmp_path):
+        path = str(tmp_path / "revocations.db")
+        worker_a = SessionValidationCache(
+            ttl_seconds=10, revocations=SessionRevocations(path)
+        )
+        worker_b = SessionValidationCache(
+            ttl_seconds=10, revocations=SessionRevocations(path)
+        )
+        expires = datetime.now(timezone.utc) + timedelta(days=1)
+        generation = worker_b.generation()
+        worker_b.put("r", "a", "session-a", "user-1", expires, generation=generation)
+        worker_b.put("r", "c", "session-c", "user-2", expires, generation=generation)
+        assert worker_b.get("r", "a") is not None
+
+        worker_a.invalidate(session_id="session-a")
+
+        assert worker_b.get("r", "a") is None
+        assert worker_b.get("r", "c") is None
+
+    def test_read_racing_a_revocation_is_not_cached(self, tmp_path):
+        cache = SessionValidationCache(
+            ttl_seconds=10, revocations=SessionRevocations(str(tmp_path / "r.db"))
+        )
+        expires = datetime.now(timezone.utc) + timedelta(days=1)
+        generation = cache.generation()
+        cache.invalidate(user_id="user-1")
+        cache.put("r", "a", "session-a", "user-1", expires, generation=generation)
+        assert cache.get("r", "a") is None
+
+    def test_unreadable_store_trusts_nothing(self, tmp_path):
+        cache = SessionValidationCache(
+            ttl_seconds=10,
+            revocations=SessionRevocations(str(tmp_path / "missing" / "r.db")),
+        )
+        expires = datetime.now(timezone.utc) + timedelta(days=1)
+        assert cache.generation() is None
+        cache.put("r", "a", "s", "u", expires, generation=cache.generation())
+        assert cache.get("r", "a") is None
+
+
+class TestSessionActivityService:
+    def test_buffer_coalesces_per_session(self):
+        buffer = SessionActivityBuffer()
+        earlier = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        later = earlier + timedelta(minutes=5)
+        buffer.touch("session", later)
+        buffer.touch("session", earlier)
+        buffer.touch("other", earlier)
+        assert buffer.pending_count == 2
+        assert buffer._pending["session"] == later
+
+    def test_activity_flush_and_revocation(self, server, model_registry):
+        user = create_user(server)
+        result = UserManager.login(
+            login_data={"email": user.email, "password": "testpassword"},
+            ip_address="127.0.0.1",
+            model_registry=model_registry,
+        )
+        session_key = result["session_key"]
+        service = SessionActivityService(
+            requester_id=env("SYSTEM_ID"), db_manager=model_registry.DB.manager
+        )
+        service.flush()
+
+        with SessionManager(
+            requester_id=user.id, model_registry=model_registry
+        ) as manager:
+            assert manager.validate_session(session_key)
+            manager.update_activity(session_key)
+            assert session_activity_buffer.pending_count == 1
+            assert service.flush() == 1
+
+            session_id = manager._resolve_session(session_key)[0]
+            manager.revoke_session(session_id)
+            assert not manager.validate_session(session_key)
+        service.cleanup()
+
+    def test_revoke_all_discards_buffered_activity(self, server, model_registry):
+        user = create_user(server)
+        session_key = UserManager.login(
+            login_data={"email": user.email, "password": "testpassword"},
+            ip_address="127.0.0.1",
+            model_registry=model_registry,
+        )["session_key"]
+
+        with SessionManager(
+            requester_id=user.id, model_registry=model_registry
+        ) as manager:
+            manager.update_activity(session_key)
+            session_id = manager._resolve_session(session_key)[0]
+            assert session_id in session_activity_buffer._pending
+
+            manager.revoke_all_user_sessions(user.id)
+            assert session_id not in session_activity_buffer._pending
+            assert not manager.validate_session(session_key)
+
+
+class TestSessionReaperService:
+    def test_reap_expires_and_purges(self, server, model_registry):
+        user = create_user(server)
+        SessionDB = SessionModel.DB(model_registry.DB.manager.Base)
+        now = datetime.now(timezone.utc)
+
+        def add_session(expires_at):
+            return SessionDB.create(
+                requester_id=env("ROOT_ID"),
+                model_registry=model_registry,
+                user_id=user.id,
+                session_key=uuid.uuid4().hex,
+                jwt_issued_at=now,
+                is_active=True,
+                last_activity=now,
+                expires_at=expires_at,
+                revoked=False,
+            )["id"]
+
+        live = add_session(now + timedelta(days=1))
+        expired = [add_session(now - timedelta(hours=1)) for _ in range(3)]
+        ancient = add_session(now - timedelta(days=365))
+
+        service = SessionReaperService(
+            requester_id=env("ROOT_ID"),
+            model_registry=model_registry,
+            chunk_size=2,
+            retention_days=30,
+        )
+        stats = service.reap()
+        assert stats["expired"] >= 4
+        assert stats["purged"] >= 1
+        assert service.metrics["last_rows_per_second"] >= 0
+
+        with model_registry.database_manager._get_db_session() as session:
+            rows = {
+                row.id: row.is_active
+                for row in session.query(SessionDB).filter(SessionDB.user_id == user.id)
+            }
+        assert rows[live] is True
+        assert all(rows[session_id] is False for session_id in expired)
+        assert ancient not in rows
+        service.cleanup()
+
+    def test_sweep_is_skipped_while_another_process_holds_the_lock(
+        self, model_registry
+    ):
+        service = SessionReaperService(
+            requester_id=env("ROOT_ID"), model_registry=model_registry
+        )
+        with service.db_manager.try_lock("session-reaper") as acquired:
+            assert acquired
+            assert service.reap_exclusive() is None
+        assert service.reap_exclusive() is not None
+        service.cleanup()
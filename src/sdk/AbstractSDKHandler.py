@@ -207,6 +207,34 @@ class ResourceManager:
             resource_name=self.config.name_plural,
         )
 
+    def batch_get(
+        self,
+        resource_ids: List[str],
+        include: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get multiple resources by ID in one request.
+
+        The response holds the visible resources under the plural name and an
+        ``errors`` list with ``{"id", "error"}`` for each id that was
+        ``not_found`` or ``forbidden``.
+        """
+        if not self.config.supports_batch:
+            raise SDKException(f"Batch operations not supported for {self.config.name}")
+
+        params = {"ids": ",".join(resource_ids)}
+        if include:
+            params["include"] = ",".join(include)
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        return self.handler._request(
+            "GET",
+            f"{self.config.endpoint}/batch",
+            query_params=params,
+            resource_name=self.config.name_plural,
+        )
+
     def batch_delete(self, resource_ids: List[str]) -> Dict[str, Any]:
         """Delete multiple resources in a batch."""
         if not self.config.supports_batch:
@@ -42,6 +42,7 @@ class TestOperation(str, Enum):
     BATCH_CREATE = "batch_create"
     BATCH_UPDATE = "batch_update"
     BATCH_DELETE = "batch_delete"
+    BATCH_GET = "batch_get"
 
 
 @dataclass
@@ -504,6 +505,8 @@ class AbstractSDKTest(unittest.TestCase, ABC):
             self._test_batch_update_operation(manager)
         elif operation == TestOperation.BATCH_DELETE:
             self._test_batch_delete_operation(manager)
+        elif operation == TestOperation.BATCH_GET:
+            self._test_batch_get_operation(manager)
 
     def _test_create_operation(self, manager):
         """Test create operation for a resource manager."""
@@ -605,6 +608,22 @@ class AbstractSDKTest(unittest.TestCase, ABC):
         with self.mock_request_context({}, 204) as mock_client:
             manager.batch_delete(["123"])  # Should not raise an exception
 
+    def _test_batch_get_operation(self, manager):
+        """Test batch get operation for a resource manager."""
+        if not manager.config.supports_batch:
+            with self.assertRaises(SDKException):
+                manager.batch_get(["123"])
+            return
+
+        response_data = {
+            manager.config.name_plural: [{"id": "123", **self.sample_data}],
+            "errors": [{"id": "456", "error": "not_found"}],
+        }
+
+        with self.mock_request_context(response_data) as mock_client:
+            result = manager.batch_get(["123", "456"])
+            assert result == response_data
+
     # Abstract methods for subclasses to implement
     @abstractmethod
     def create_test_data(
@@ -736,6 +736,16 @@ class UserMetadataSDK(AbstractSDKHandler):
         """Delete user metadata."""
         self.user_metadata.delete(metadata_id)
 
+    def get_user_preferences(self, user_id: str) -> Dict[str, Any]:
+        """Get all preferences of a user as one key/value object."""
+        return self._request("GET", f"/v1/user/{user_id}/preference")
+
+    def set_user_preferences(
+        self, user_id: str, preferences: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create or update many preferences of a user in one request."""
+        return self._request("PUT", f"/v1/user/{user_id}/preference", data=preferences)
+
 
 # ===== Team Metadata SDK =====
 
@@ -793,6 +803,16 @@ class TeamMetadataSDK(AbstractSDKHandler):
         """Delete team metadata."""
         self.team_metadata.delete(metadata_id)
 
+    def get_team_preferences(self, team_id: str) -> Dict[str, Any]:
+        """Get all preferences of a team as one key/value object."""
+        return self._request("GET", f"/v1/team/{team_id}/preference")
+
+    def set_team_preferences(
+        self, team_id: str, preferences: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create or update many preferences of a team in one request."""
+        return self._request("PUT", f"/v1/team/{team_id}/preference", data=preferences)
+
 
 # ===== User Credential SDK =====
 